@@ -7,6 +7,7 @@ from custom_components.voltalis.apps.home_assistant.entities.config_entry_data i
 )
 from custom_components.voltalis.apps.home_assistant.home_assistant_module import VoltalisHomeAssistantModule
 from custom_components.voltalis.const import CONFIG_SCHEMA
+from custom_components.voltalis.services import async_setup_services
 
 PLATFORMS = VoltalisHomeAssistantModule.PLATFORMS
 
@@ -16,6 +17,8 @@ __all__ = ["CONFIG_SCHEMA"]
 async def async_setup(hass: HomeAssistant, entry: VoltalisConfigEntry) -> bool:
     """Set up the Voltalis component."""
 
+    async_setup_services(hass)
+
     return True
 
 
@@ -40,3 +43,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: VoltalisConfigEntry) ->
     """Unload a config entry."""
 
     return await entry.runtime_data.voltalis_home_assistant_module.async_unload_entry()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: VoltalisConfigEntry) -> None:
+    """Remove the persisted session and consumption data of a config entry."""
+
+    await VoltalisHomeAssistantModule.get_session_store(hass=hass, entry=entry).async_remove()
+    await VoltalisHomeAssistantModule.get_consumption_cache_store(hass=hass, entry=entry).async_remove()
+    await VoltalisHomeAssistantModule.get_consumption_backfill_store(hass=hass, entry=entry).async_remove()
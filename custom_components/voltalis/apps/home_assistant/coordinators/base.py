@@ -1,8 +1,9 @@
 from abc import abstractmethod
-from datetime import timedelta
-from typing import TypeVar
+from datetime import datetime, timedelta
+from typing import Any, Callable, TypeVar
 
 from homeassistant import config_entries
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
@@ -19,6 +20,9 @@ TData = TypeVar("TData")
 class BaseVoltalisCoordinator(DataUpdateCoordinator[TData]):
     """Base class for Voltalis coordinators with shared error handling & recovery logging."""
 
+    # The refreshes go through the circuit breaker of the entry, skipped while the API is unavailable
+    _use_circuit_breaker = True
+
     def __init__(
         self,
         name: str,
@@ -35,6 +39,11 @@ class BaseVoltalisCoordinator(DataUpdateCoordinator[TData]):
         )
         self._voltalis_module = voltalis_module
         self._was_unavailable = False  # Track previous availability state for one-shot logging
+        self._last_refresh_at: datetime | None = None  # Start of the last successful refresh
+        self.__slices_fingerprints: dict[Any, int] | None = None  # Fingerprint of each slice of the last published data
+        self.__changed_contexts: set[Any] | None = None  # Contexts to notify, None to notify all the listeners
+        self.__skip_unchanged_slices = False
+        self.suppressed_updates = 0  # Number of listener notifications skipped because their slice didn't change
 
     def _handle_update_error(self, err: Exception) -> Exception:
         if self._was_unavailable:
@@ -79,6 +88,83 @@ class BaseVoltalisCoordinator(DataUpdateCoordinator[TData]):
             self.logger.exception("Unexpected error while updating Voltalis data")
         return UpdateFailed(f"Unexpected error: {err}")
 
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> Callable[[], None]:
+        """Listen for data updates, only called when the slice of the data matching the context changed."""
+
+        if context is None:
+            return super().async_add_listener(update_callback, context)
+
+        @callback
+        def update_slice_callback() -> None:
+            if self.__changed_contexts is not None and context not in self.__changed_contexts:
+                self.suppressed_updates += 1
+                return
+            update_callback()
+
+        return super().async_add_listener(update_slice_callback, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, skipping the ones whose slice didn't change during a site snapshot tick."""
+
+        previous_fingerprints = self.__slices_fingerprints
+        fingerprints = self.__get_slices_fingerprints()
+        self.__slices_fingerprints = fingerprints
+
+        self.__changed_contexts = None
+        if self.__skip_unchanged_slices and previous_fingerprints is not None and fingerprints is not None:
+            self.__changed_contexts = {
+                key
+                for key in previous_fingerprints.keys() | fingerprints.keys()
+                if previous_fingerprints.get(key) != fingerprints.get(key)
+            }
+
+        try:
+            super().async_update_listeners()
+        finally:
+            self.__changed_contexts = None
+
+    def __get_slices_fingerprints(self) -> dict[Any, int] | None:
+        """Get a cheap structural fingerprint of each slice of the data, by key."""
+
+        if not self.last_update_success or not isinstance(self.data, dict):
+            return None
+
+        return {key: hash(repr(value)) for key, value in self.data.items()}
+
+    def is_refresh_due(self, now: datetime) -> bool:
+        """Return True if the site snapshot tick at `now` should refresh this coordinator.
+
+        By default, the coordinator is refreshed on every tick (every minute).
+        """
+        return True
+
+    def _is_refreshed_since(self, instant: datetime) -> bool:
+        """Check if the last successful refresh started at or after the given instant."""
+        return self._last_refresh_at is not None and self._last_refresh_at >= instant
+
+    async def async_refresh_slice(self) -> None:
+        """Fetch the data and publish it to the listening entities, as part of a site snapshot tick."""
+
+        try:
+            data = await self._async_update_data()
+        except UpdateFailed as err:
+            self.async_set_update_error(err)
+            raise
+
+        self.async_set_updated_slices(data)
+
+    @callback
+    def async_set_updated_slices(self, data: TData) -> None:
+        """Publish the data, only notifying the listeners whose slice changed since the last update."""
+
+        self.__skip_unchanged_slices = True
+        try:
+            self.async_set_updated_data(data)
+        finally:
+            self.__skip_unchanged_slices = False
+
     @abstractmethod
     async def _get_data(self) -> TData:
         """Fetch updated data from the Voltalis API."""
@@ -87,8 +173,16 @@ class BaseVoltalisCoordinator(DataUpdateCoordinator[TData]):
     async def _async_update_data(self) -> TData:
         """Fetch updated data from the Voltalis API."""
 
+        refresh_started_at = self._voltalis_module.date_provider.get_now()
+        circuit_breaker = self._voltalis_module.circuit_breaker if self._use_circuit_breaker else None
+        if circuit_breaker is not None and not circuit_breaker.try_acquire(refresh_started_at):
+            raise UpdateFailed("Voltalis API unavailable, refresh skipped")
+
         try:
             result = await self._get_data()
+            self._last_refresh_at = refresh_started_at
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
 
             if self._was_unavailable:
                 self.logger.info("Voltalis API back online for %s", self.name)
@@ -96,4 +190,14 @@ class BaseVoltalisCoordinator(DataUpdateCoordinator[TData]):
 
             return result
         except Exception as err:
+            # Only the connection errors mean the API is unavailable, the other errors come from its answer
+            if circuit_breaker is not None and isinstance(err, VoltalisConnectionException):
+                circuit_breaker.record_failure(refresh_started_at)
+            elif circuit_breaker is not None:
+                circuit_breaker.record_success()
             raise self._handle_update_error(err) from err
+        except BaseException:
+            # A cancelled refresh got no answer, it must not leave the circuit half open
+            if circuit_breaker is not None:
+                circuit_breaker.release_probe(refresh_started_at)
+            raise
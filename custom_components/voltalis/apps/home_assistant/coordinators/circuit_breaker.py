@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from enum import StrEnum
+from logging import Logger
+
+
+class VoltalisCircuitBreakerStateEnum(StrEnum):
+    """Enum to represent the state of the circuit breaker"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class VoltalisCircuitBreaker:
+    """Circuit breaker shared by the coordinators of a config entry, to stop polling the API during an outage.
+
+    After failure_threshold consecutive connection failures the circuit opens and the refreshes are skipped until
+    the backoff elapsed. Then a single refresh probes the API: the circuit closes if the API answers, otherwise it
+    opens again with a doubled backoff, up to max_backoff.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: Logger,
+        failure_threshold: int,
+        base_backoff: timedelta,
+        max_backoff: timedelta,
+    ) -> None:
+        self.__logger = logger
+        self.__failure_threshold = failure_threshold
+        self.__base_backoff = base_backoff
+        self.__max_backoff = max_backoff
+
+        self.__failures = 0
+        self.__backoff = base_backoff
+        self.state = VoltalisCircuitBreakerStateEnum.CLOSED
+        self.retry_at: datetime | None = None  # End of the backoff of the open circuit
+        self.skipped_refreshes = 0  # Number of refreshes skipped while the circuit was open
+
+    def try_acquire(self, now: datetime) -> bool:
+        """Check if a refresh can call the API, the first refresh after the backoff is the probe."""
+
+        if self.state == VoltalisCircuitBreakerStateEnum.CLOSED:
+            return True
+
+        if self.state == VoltalisCircuitBreakerStateEnum.OPEN and self.retry_at is not None and now >= self.retry_at:
+            self.__logger.info("Probing the Voltalis API after %s of backoff", self.__backoff)
+            self.state = VoltalisCircuitBreakerStateEnum.HALF_OPEN
+            return True
+
+        self.skipped_refreshes += 1
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit, the API answered."""
+
+        if self.state != VoltalisCircuitBreakerStateEnum.CLOSED:
+            self.__logger.info("Voltalis API answered again, resuming the refreshes")
+
+        self.__failures = 0
+        self.__backoff = self.__base_backoff
+        self.state = VoltalisCircuitBreakerStateEnum.CLOSED
+        self.retry_at = None
+
+    def record_failure(self, now: datetime) -> None:
+        """Count a connection failure, opening the circuit after too many of them or when the probe failed."""
+
+        if self.state == VoltalisCircuitBreakerStateEnum.HALF_OPEN:
+            self.__backoff = min(self.__backoff * 2, self.__max_backoff)
+            self.__open(now)
+            return
+
+        # The refreshes started before the circuit opened don't extend the backoff
+        if self.state == VoltalisCircuitBreakerStateEnum.OPEN:
+            return
+
+        self.__failures += 1
+        if self.__failures >= self.__failure_threshold:
+            self.__open(now)
+
+    def release_probe(self, now: datetime) -> None:
+        """Open the circuit again when the probe ended without an answer, the next refresh probes the API again."""
+
+        if self.state == VoltalisCircuitBreakerStateEnum.HALF_OPEN:
+            self.state = VoltalisCircuitBreakerStateEnum.OPEN
+            self.retry_at = now
+
+    def __open(self, now: datetime) -> None:
+        self.state = VoltalisCircuitBreakerStateEnum.OPEN
+        self.retry_at = now + self.__backoff
+        self.__logger.warning("Voltalis API unavailable, refreshes paused until %s", self.retry_at)
@@ -1,4 +1,8 @@
-from datetime import timedelta
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
@@ -8,19 +12,57 @@ from custom_components.voltalis.lib.application.devices_management.dtos.device_d
 class VoltalisDeviceCoordinator(BaseVoltalisCoordinator[dict[int, DeviceDto]]):
     """Coordinator to fetch devices from Voltalis API."""
 
+    # Delay before fetching the devices to reconcile an optimistic update with the API, in seconds
+    RECONCILIATION_DELAY = 15
+
     def __init__(
         self,
         *,
         entry: VoltalisConfigEntry,
     ) -> None:
+        # No automatic update_interval - refreshed on every tick of the site snapshot coordinator
         super().__init__(
             "Voltalis Device",
             entry=entry,
-            update_interval=timedelta(minutes=1),
         )
 
+        self.__cancel_reconciliation: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_set_device(self, device: DeviceDto) -> None:
+        """Publish the expected state of a device after a command, without fetching all the devices.
+
+        A single reconciliation fetch is scheduled, postponed by each new command.
+        """
+
+        self.async_set_updated_slices({**self.data, device.id: device})
+
+        self.cancel_reconciliation()
+        self.__cancel_reconciliation = async_call_later(self.hass, self.RECONCILIATION_DELAY, self.__async_reconcile)
+
+    def cancel_reconciliation(self) -> None:
+        """Cancel the scheduled reconciliation fetch, if any."""
+        if not self.__cancel_reconciliation:
+            return
+
+        self.__cancel_reconciliation()
+        self.__cancel_reconciliation = None
+
+    async def __async_reconcile(self, _now: datetime) -> None:
+        """Fetch the devices to replace the optimistic updates by the state known by the API."""
+
+        self.__cancel_reconciliation = None
+        try:
+            await self.async_refresh_slice()
+        except UpdateFailed:
+            # Already logged, the next site snapshot tick will try again
+            pass
+
     async def _get_data(self) -> dict[int, DeviceDto]:
         """Fetch updated data from the Voltalis API."""
 
+        # This fetch reconciles the optimistic updates already published
+        self.cancel_reconciliation()
+
         result = await self._voltalis_module.get_devices_handler.handle()
         return result
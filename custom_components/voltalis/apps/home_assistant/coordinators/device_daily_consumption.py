@@ -1,11 +1,10 @@
-from datetime import datetime
-from typing import Callable
-
-from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_time_change
+from datetime import datetime, timedelta
 
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_daily_consumption_query import (  # noqa: E501
+    GetDevicesDailyConsumptionQuery,
+)
 from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption import (
     DeviceConsumption,
 )
@@ -22,42 +21,30 @@ class VoltalisDeviceDailyConsumptionCoordinator(BaseVoltalisCoordinator[dict[int
         *,
         entry: VoltalisConfigEntry,
     ) -> None:
-        # No automatic update_interval - updates only triggered by time tracker
+        # No automatic update_interval - refreshed by the site snapshot coordinator
         super().__init__(
             "Voltalis Device Daily Consumption",
             entry=entry,
         )
 
-        self.__stop_time_tracking: Callable[[], None] | None = None
-
-    def start_time_tracking(self) -> None:
-        """Start tracking time to trigger updates at specific minutes."""
-        if self.__stop_time_tracking:
-            return
-        # Schedule updates every hour at MINUTE_OFFSET minutes (e.g., HH:05)
-        self.__stop_time_tracking = async_track_time_change(
-            self.hass,
-            self.__scheduled_update,
-            minute=VoltalisDeviceDailyConsumptionCoordinator.MINUTE_OFFSET,
-            second=0,
-        )
-
-    def stop_time_tracking(self) -> None:
-        """Stop the time tracking."""
-        if not self.__stop_time_tracking:
-            return
+    def is_refresh_due(self, now: datetime) -> bool:
+        """Refresh every hour at MINUTE_OFFSET minutes (e.g., HH:05), or on the next tick if it was missed."""
 
-        self.__stop_time_tracking()
-        self.__stop_time_tracking = None
-
-    @callback
-    def __scheduled_update(self, scheduled_at: datetime) -> None:
-        """Triggered by time tracker at the scheduled time."""
-        # Request a refresh (will call _async_update_data)
-        self.hass.async_create_task(self.async_request_refresh())
+        latest_slot = now.replace(
+            minute=VoltalisDeviceDailyConsumptionCoordinator.MINUTE_OFFSET, second=0, microsecond=0
+        )
+        if latest_slot > now:
+            latest_slot -= timedelta(hours=1)
+        return not self._is_refreshed_since(latest_slot)
 
     async def _get_data(self) -> dict[int, DeviceConsumption]:
         """Fetch updated data from the Voltalis API."""
 
-        data = await self._voltalis_module.get_devices_daily_consumption_handler.handle()
+        # The current energy contract prices the consumption of the devices
+        energy_contracts = self._voltalis_module.energy_contract_coordinator.data or {}
+        energy_contract = next(iter(energy_contracts.values()), None)
+
+        data = await self._voltalis_module.get_devices_daily_consumption_handler.handle(
+            GetDevicesDailyConsumptionQuery(energy_contract=energy_contract)
+        )
         return data
@@ -1,8 +1,4 @@
 from datetime import datetime
-from typing import Callable
-
-from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_time_change
 
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
@@ -17,38 +13,17 @@ class VoltalisLiveConsumptionCoordinator(BaseVoltalisCoordinator[dict[int, LiveC
         *,
         entry: VoltalisConfigEntry,
     ) -> None:
-        # No automatic update_interval - updates only triggered by time tracker
+        # No automatic update_interval - refreshed by the site snapshot coordinator
         super().__init__(
             "Voltalis Live Consumption",
             entry=entry,
         )
-        self.__stop_time_tracking: Callable[[], None] | None = None
-
-    def start_time_tracking(self) -> None:
-        """Start tracking time to trigger updates at specific minutes."""
-        if self.__stop_time_tracking:
-            return
-
-        self.__stop_time_tracking = async_track_time_change(
-            self.hass,
-            self.__scheduled_update,
-            # Update every 10 minutes (HH:00, HH:10, HH:20, HH:30, HH:40, HH:50)
-            minute=[0, 10, 20, 30, 40, 50],
-        )
-
-    def stop_time_tracking(self) -> None:
-        """Stop the time tracking."""
-        if not self.__stop_time_tracking:
-            return
 
-        self.__stop_time_tracking()
-        self.__stop_time_tracking = None
+    def is_refresh_due(self, now: datetime) -> bool:
+        """Refresh every 10 minutes (HH:00, HH:10, HH:20, HH:30, HH:40, HH:50), or on the next tick if it was missed."""
 
-    @callback
-    def __scheduled_update(self, scheduled_at: datetime) -> None:
-        """Triggered by time tracker at the scheduled time."""
-        # Request a refresh (will call _async_update_data)
-        self.hass.async_create_task(self.async_request_refresh())
+        latest_slot = now.replace(minute=now.minute - now.minute % 10, second=0, microsecond=0)
+        return not self._is_refreshed_since(latest_slot)
 
     async def _get_data(self) -> dict[int, LiveConsumption]:
         """Fetch updated data from the Voltalis API."""
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import datetime
 
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
@@ -13,12 +13,16 @@ class VoltalisEnergyContractCoordinator(BaseVoltalisCoordinator[dict[int, Energy
         *,
         entry: VoltalisConfigEntry,
     ) -> None:
+        # No automatic update_interval - refreshed once a day by the site snapshot coordinator
         super().__init__(
             "Voltalis Energy Contract",
             entry=entry,
-            update_interval=timedelta(days=1),
         )
 
+    def is_refresh_due(self, now: datetime) -> bool:
+        """Refresh on the first tick of each day."""
+        return self._last_refresh_at is None or self._last_refresh_at.date() != now.date()
+
     async def _get_data(self) -> dict[int, EnergyContract]:
         """Fetch updated data from the Voltalis API."""
 
@@ -1,5 +1,3 @@
-from datetime import timedelta
-
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
 from custom_components.voltalis.lib.domain.programs_management.programs.program import Program
@@ -13,10 +11,10 @@ class VoltalisProgramCoordinator(BaseVoltalisCoordinator[dict[int, Program]]):
         *,
         entry: VoltalisConfigEntry,
     ) -> None:
+        # No automatic update_interval - refreshed on every tick of the site snapshot coordinator
         super().__init__(
             "Voltalis Program",
             entry=entry,
-            update_interval=timedelta(minutes=1),
         )
 
     async def _get_data(self) -> dict[int, Program]:
@@ -0,0 +1,83 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Callable
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_change
+
+from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
+from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
+
+
+class VoltalisSiteSnapshotCoordinator(BaseVoltalisCoordinator[dict[str, datetime]]):
+    """Coordinator that refreshes every due slice of the site in one scheduled tick.
+
+    Instead of each coordinator running its own timer, this coordinator wakes up once per minute,
+    asks each slice coordinator if it is due, fetches the due ones concurrently
+    and publishes the typed data of each slice to its listening entities.
+
+    The data of this coordinator is the start time of the last successful refresh of each slice, by name.
+    """
+
+    # The tick doesn't call the API itself, each slice goes through the circuit breaker
+    _use_circuit_breaker = False
+
+    def __init__(
+        self,
+        *,
+        entry: VoltalisConfigEntry,
+        slices: list[BaseVoltalisCoordinator[Any]],
+    ) -> None:
+        # No automatic update_interval - updates only triggered by time tracker
+        super().__init__(
+            "Voltalis Site Snapshot",
+            entry=entry,
+        )
+
+        self.__slices = slices
+        self.__stop_time_tracking: Callable[[], None] | None = None
+
+    def start_time_tracking(self) -> None:
+        """Start tracking time to trigger a snapshot at the start of every minute."""
+        if self.__stop_time_tracking:
+            return
+
+        self.__stop_time_tracking = async_track_time_change(
+            self.hass,
+            self.__scheduled_update,
+            second=0,
+        )
+
+    def stop_time_tracking(self) -> None:
+        """Stop the time tracking."""
+        if not self.__stop_time_tracking:
+            return
+
+        self.__stop_time_tracking()
+        self.__stop_time_tracking = None
+
+    @callback
+    def __scheduled_update(self, scheduled_at: datetime) -> None:
+        """Triggered by time tracker at the scheduled time."""
+        # Request a refresh (will call _async_update_data)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def _get_data(self) -> dict[str, datetime]:
+        """Refresh all the due slices concurrently."""
+
+        now = self._voltalis_module.date_provider.get_now()
+        due_slices = [coordinator for coordinator in self.__slices if coordinator.is_refresh_due(now)]
+
+        # Each slice handles (and logs) its own errors, a failing slice doesn't prevent the others to be published
+        results = await asyncio.gather(
+            *(coordinator.async_refresh_slice() for coordinator in due_slices),
+            return_exceptions=True,
+        )
+
+        refreshed_at = dict(self.data or {})
+        for coordinator, result in zip(due_slices, results):
+            if isinstance(result, BaseException):
+                continue
+            refreshed_at[coordinator.name] = now
+
+        return refreshed_at
@@ -0,0 +1,128 @@
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+from custom_components.voltalis.apps.home_assistant.coordinators.energy_contract import (
+    VoltalisEnergyContractCoordinator,
+)
+from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
+from custom_components.voltalis.lib.application.energy_contracts.queries.get_energy_contract_next_mode_change_query import (  # noqa: E501
+    GetEnergyContractNextModeChangeQuery,
+)
+
+TariffClockListener = Callable[[datetime], Awaitable[None]]
+
+
+class VoltalisTariffClock:
+    """Clock waking its listeners on each peak / offpeak transition of the energy contracts.
+
+    Instead of each tariff sensor checking the current mode every minute, the clock computes the next transition
+    of the energy contracts, fires once for all its listeners at this instant and then schedules the following one.
+
+    The listeners are also called when the energy contracts are updated, as the transitions may have changed.
+    """
+
+    def __init__(
+        self,
+        *,
+        entry: VoltalisConfigEntry,
+        energy_contract_coordinator: VoltalisEnergyContractCoordinator,
+    ) -> None:
+        self.__voltalis_module = entry.runtime_data.voltalis_home_assistant_module
+        self.__energy_contract_coordinator = energy_contract_coordinator
+        self.__listeners: list[TariffClockListener] = []
+        self.__stop_contracts_tracking: Callable[[], None] | None = None
+        self.__cancel_next_transition: CALLBACK_TYPE | None = None
+        self.next_transition: datetime | None = None
+
+    @callback
+    def async_add_listener(self, listener: TariffClockListener) -> Callable[[], None]:
+        """Listen for the tariff transitions, returns a function to remove the listener."""
+
+        self.__listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self.__listeners.remove(listener)
+
+        return remove_listener
+
+    async def async_start_time_tracking(self) -> None:
+        """Start tracking the transitions of the energy contracts."""
+        if self.__stop_contracts_tracking:
+            return
+
+        self.__stop_contracts_tracking = self.__energy_contract_coordinator.async_add_listener(
+            self.__handle_contracts_update
+        )
+        await self.__async_schedule_next_transition()
+
+    def stop_time_tracking(self) -> None:
+        """Stop tracking the transitions."""
+        if self.__stop_contracts_tracking:
+            self.__stop_contracts_tracking()
+            self.__stop_contracts_tracking = None
+
+        if self.__cancel_next_transition:
+            self.__cancel_next_transition()
+            self.__cancel_next_transition = None
+
+    @callback
+    def __handle_contracts_update(self) -> None:
+        """Reschedule the next transition with the updated energy contracts."""
+        self.__voltalis_module.hass.async_create_task(self.__async_on_contracts_update())
+
+    async def __async_on_contracts_update(self) -> None:
+        """Triggered once the energy contracts are updated."""
+        await self.__async_schedule_next_transition()
+
+        now = self.__voltalis_module.date_provider.get_now()
+        await self.__async_notify_listeners(now)
+
+    async def __async_on_transition(self, _: datetime) -> None:
+        """Triggered at the scheduled transition."""
+        self.__cancel_next_transition = None
+        await self.__async_schedule_next_transition()
+
+        now = self.__voltalis_module.date_provider.get_now()
+        await self.__async_notify_listeners(now)
+
+    async def __async_notify_listeners(self, now: datetime) -> None:
+        for listener in list(self.__listeners):
+            await listener(now)
+
+    async def __async_schedule_next_transition(self) -> None:
+        """Schedule a wake-up at the earliest next transition of the energy contracts, if any."""
+
+        next_transitions = [
+            await self.__voltalis_module.get_energy_contract_next_mode_change_handler.handle(
+                GetEnergyContractNextModeChangeQuery(
+                    type=energy_contract.type,
+                    offpeak_hours=energy_contract.offpeak_hours,
+                )
+            )
+            for energy_contract in (self.__energy_contract_coordinator.data or {}).values()
+        ]
+
+        # Replaced only once computed, so the latest schedule wins over a concurrent one
+        if not self.__stop_contracts_tracking:
+            return
+        if self.__cancel_next_transition:
+            self.__cancel_next_transition()
+            self.__cancel_next_transition = None
+
+        self.next_transition = min(
+            (next_transition for next_transition in next_transitions if next_transition is not None),
+            default=None,
+        )
+        if self.next_transition is None:
+            return
+
+        # The transitions are in the local time of the date provider
+        self.__cancel_next_transition = async_track_point_in_time(
+            self.__voltalis_module.hass,
+            self.__async_on_transition,
+            self.next_transition.astimezone(),
+        )
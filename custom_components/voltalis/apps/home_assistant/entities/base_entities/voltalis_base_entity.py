@@ -15,15 +15,25 @@ class VoltalisBaseEntity(CoordinatorEntity[BaseVoltalisCoordinator[dict[int, Any
         self,
         entry: VoltalisConfigEntry,
         coordinator: BaseVoltalisCoordinator[dict[int, Any]],
+        context: Any = None,
     ) -> None:
-        """Initialize the base entity."""
-        super().__init__(coordinator)
+        """Initialize the base entity.
+
+        The context is the key of the entity's slice in the coordinator data,
+        the entity is then only updated when its slice changes.
+        """
+        super().__init__(coordinator, context)
         self._voltalis_module = entry.runtime_data.voltalis_home_assistant_module
         self._entry = entry
 
         if len(self._unique_id_suffix) == 0:
             raise ValueError("Unique ID suffix must be defined in subclass.")
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator, then set the first state from the data of its first refresh."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
     @property
     def unique_internal_name(self) -> str:
         """Return a unique internal name for the entity."""
@@ -21,7 +21,7 @@ class VoltalisDeviceEntity(VoltalisBaseEntity):
         coordinator: BaseVoltalisCoordinator[dict[int, Any]],
     ) -> None:
         """Initialize the device entity."""
-        super().__init__(entry, coordinator)
+        super().__init__(entry, coordinator, device.id)
 
         self._device = device
 
@@ -19,9 +19,10 @@ class VoltalisEnergyContractEntity(VoltalisBaseEntity):
         entry: VoltalisConfigEntry,
         energy_contract: EnergyContract,
         coordinator: BaseVoltalisCoordinator[dict[int, Any]],
+        context: Any = None,
     ) -> None:
         """Initialize the energy contract entity."""
-        super().__init__(entry, coordinator)
+        super().__init__(entry, coordinator, energy_contract.id if context is None else context)
 
         self._energy_contract = energy_contract
 
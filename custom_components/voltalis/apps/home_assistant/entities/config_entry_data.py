@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypedDict
 
 from homeassistant import config_entries
 
@@ -14,4 +14,12 @@ class VoltalisConfigEntryData:
         self.voltalis_home_assistant_module = voltalis_home_assistant_module
 
 
+class VoltalisSessionData(TypedDict):
+    """Voltalis session persisted across Home Assistant restarts"""
+
+    username: str
+    auth_token: str
+    default_site_id: str
+
+
 VoltalisConfigEntry = config_entries.ConfigEntry[VoltalisConfigEntryData]
@@ -120,7 +120,7 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
 
-        await self._voltalis_module.set_device_temperature_handler.handle(
+        updated_device = await self._voltalis_module.set_device_temperature_handler.handle(
             SetDeviceTemperatureCommand(
                 device=self._current_device,
                 mode=DeviceModeEnum.TEMPERATURE,
@@ -128,8 +128,8 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # HVAC mode handling
@@ -168,36 +168,38 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             HVACMode.AUTO: HVACAction.IDLE,
         }
 
-        await self._voltalis_module.set_climate_action_handler.handle(
+        updated_device = await self._voltalis_module.set_climate_action_handler.handle(
             SetClimateActionCommand(
                 device=self._current_device,
                 action=mode_to_action[hvac_mode],
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
 
-        await self._voltalis_module.set_device_temperature_handler.handle(
+        updated_device = await self._voltalis_module.set_device_temperature_handler.handle(
             SetDeviceTemperatureCommand(
                 device=self._current_device,
                 mode=self._current_device.programming.mode or DeviceModeEnum.ECO,
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
 
-        await self._voltalis_module.turn_off_device_handler.handle(TurnOffDeviceCommand(device=self._current_device))
+        updated_device = await self._voltalis_module.turn_off_device_handler.handle(
+            TurnOffDeviceCommand(device=self._current_device)
+        )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # Preset mode handling
@@ -223,7 +225,7 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
 
-        await self._voltalis_module.set_device_preset_handler.handle(
+        updated_device = await self._voltalis_module.set_device_preset_handler.handle(
             SetDevicePresetCommand(
                 device=self._current_device,
                 preset=DeviceCurrentPresetEnum(preset_mode),
@@ -231,8 +233,8 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # Availability handling override
@@ -252,7 +254,7 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
         """Service action to set manual mode with preset or temperature."""
 
         if preset_mode is not None:
-            await self._voltalis_module.set_device_preset_handler.handle(
+            updated_device = await self._voltalis_module.set_device_preset_handler.handle(
                 SetDevicePresetCommand(
                     device=self._current_device,
                     temperature=temperature,
@@ -261,8 +263,8 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
                 )
             )
 
-            # Refresh coordinator data
-            await self.coordinator.async_request_refresh()
+            # Publish the expected device state, without fetching all the devices
+            self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
             return
 
@@ -272,7 +274,7 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             # Use TEMPERATURE mode if temperature is specified
             target_mode = DeviceModeEnum.TEMPERATURE
 
-        await self._voltalis_module.set_device_temperature_handler.handle(
+        updated_device = await self._voltalis_module.set_device_temperature_handler.handle(
             SetDeviceTemperatureCommand(
                 device=self._current_device,
                 mode=target_mode,
@@ -281,16 +283,19 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     async def async_service_disable_manual_mode(self) -> None:
         """Service action to disable manual mode and return to automatic planning."""
 
-        await self._voltalis_module.disable_manual_mode_handler.handle(
+        updated_device = await self._voltalis_module.disable_manual_mode_handler.handle(
             DisableManualModeCommand(device=self._current_device)
         )
 
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
+
     async def async_service_set_quick_boost(
         self,
         duration_hours: float = CLIMATE_BOOST_DURATION,
@@ -318,7 +323,7 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             target_mode = DeviceModeEnum.TEMPERATURE
             target_temp = temperature
 
-        await self._voltalis_module.set_device_temperature_handler.handle(
+        updated_device = await self._voltalis_module.set_device_temperature_handler.handle(
             SetDeviceTemperatureCommand(
                 device=device,
                 mode=target_mode,
@@ -327,5 +332,5 @@ class VoltalisClimate(VoltalisDeviceEntity, ClimateEntity):
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
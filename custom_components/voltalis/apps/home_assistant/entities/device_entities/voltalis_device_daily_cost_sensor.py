@@ -0,0 +1,68 @@
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import CURRENCY_EURO
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from custom_components.voltalis.apps.home_assistant.entities.base_entities.voltalis_device_entity import (
+    VoltalisDeviceEntity,
+)
+from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption import (
+    DeviceConsumption,
+)
+
+
+class VoltalisDeviceDailyCostSensor(VoltalisDeviceEntity, SensorEntity):
+    """References the daily cost of a device, with its consumption by energy contract mode as attributes."""
+
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_unit_of_measurement = CURRENCY_EURO
+    _attr_suggested_display_precision = 2
+    _attr_translation_key = "device_daily_cost"
+    _unique_id_suffix = "device_daily_cost"
+
+    def __init__(self, entry: VoltalisConfigEntry, device: DeviceDto) -> None:
+        """Initialize the sensor entity."""
+        super().__init__(
+            entry, device, entry.runtime_data.voltalis_home_assistant_module.device_daily_consumption_coordinator
+        )
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+
+        data = self._voltalis_module.device_daily_consumption_coordinator.data.get(self._device.id)
+        if data is None or data.daily_cost is None:
+            self._voltalis_module.logger.debug("Daily cost data for device %s is None", self._device.id)
+            return
+
+        new_value = data.daily_cost.cost
+        new_attributes = {
+            f"{mode}_consumption": round(consumption, 2) for mode, consumption in data.daily_cost.consumptions.items()
+        }
+        if self.native_value == new_value and self._attr_extra_state_attributes == new_attributes:
+            return
+
+        # The cost is computed since the start of the day of the last fetched hour
+        target_datetime = self._voltalis_module.date_provider.get_now() - timedelta(hours=1)
+        self._attr_last_reset = dt_util.start_of_local_day(target_datetime)
+
+        self._attr_native_value = new_value
+        self._attr_extra_state_attributes = new_attributes
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------------------
+    # Availability handling override
+    # ------------------------------------------------------------------
+    def _is_available_from_data(self, data: DeviceConsumption) -> bool:
+        return data.daily_cost is not None
@@ -92,7 +92,7 @@ class VoltalisDevicePresetSelect(VoltalisDeviceEntity, SelectEntity):
         if not device.manual_setting:
             raise HomeAssistantError(f"Manual setting not available for device {device.id}")
 
-        await self._voltalis_module.set_device_preset_handler.handle(
+        updated_device = await self._voltalis_module.set_device_preset_handler.handle(
             SetDevicePresetCommand(
                 device=device,
                 preset=DeviceCurrentPresetEnum(option),
@@ -101,8 +101,8 @@ class VoltalisDevicePresetSelect(VoltalisDeviceEntity, SelectEntity):
             )
         )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # Availability handling override
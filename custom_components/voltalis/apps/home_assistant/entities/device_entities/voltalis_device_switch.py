@@ -67,24 +67,23 @@ class VoltalisDeviceSwitch(VoltalisDeviceEntity, SwitchEntity):
         """
 
         if not is_on:
-            await self._voltalis_module.turn_off_device_handler.handle(
+            updated_device = await self._voltalis_module.turn_off_device_handler.handle(
                 TurnOffDeviceCommand(
                     device=self._current_device,
                     duration_hours=None,  # Indefinite until user turns it back on
                 )
             )
-            return
-
-        await self._voltalis_module.set_device_temperature_handler.handle(
-            SetDeviceTemperatureCommand(
-                device=self._current_device,
-                mode=self.__on_mode,
-                duration_hours=None,  # Indefinite until user turns it back off
+        else:
+            updated_device = await self._voltalis_module.set_device_temperature_handler.handle(
+                SetDeviceTemperatureCommand(
+                    device=self._current_device,
+                    mode=self.__on_mode,
+                    duration_hours=None,  # Indefinite until user turns it back off
+                )
             )
-        )
 
-        # Refresh coordinator data
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # Availability handling override
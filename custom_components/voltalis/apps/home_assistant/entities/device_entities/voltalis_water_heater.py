@@ -92,14 +92,15 @@ class VoltalisWaterHeater(VoltalisDeviceEntity, WaterHeaterEntity):
 
         self._attr_is_away_mode_on = False
 
-        await self._voltalis_module.set_water_heater_operation_handler.handle(
+        updated_device = await self._voltalis_module.set_water_heater_operation_handler.handle(
             SetWaterHeaterOperationCommand(
                 device=self._current_device,
                 operation_mode=WaterHeaterCurrentOperationEnum(operation_mode),
             )
         )
 
-        await self.coordinator.async_request_refresh()
+        # Publish the expected device state, without fetching all the devices
+        self._voltalis_module.device_coordinator.async_set_device(updated_device)
 
     # ------------------------------------------------------------------
     # Away mode handling
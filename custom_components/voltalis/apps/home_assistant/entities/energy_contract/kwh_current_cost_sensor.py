@@ -3,7 +3,6 @@ from typing import Callable
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.const import CURRENCY_EURO, UnitOfEnergy
-from homeassistant.helpers.event import async_track_time_change
 
 from custom_components.voltalis.apps.home_assistant.entities.base_entities.voltalis_energy_contract_entity import (
     VoltalisEnergyContractEntity,
@@ -83,12 +82,8 @@ class VoltalisEnergyContractKwhCurrentCostSensor(VoltalisEnergyContractEntity, S
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        # Start periodic updates every minute
-        self.__unsub = async_track_time_change(
-            self.hass,
-            self.__update,
-            second=0,  # Start every minute at second 0
-        )
+        # Update on each peak / offpeak transition, instead of every minute
+        self.__unsub = self._voltalis_module.tariff_clock.async_add_listener(self.__update)
 
         await self.__update(self.__date_provider.get_now())
 
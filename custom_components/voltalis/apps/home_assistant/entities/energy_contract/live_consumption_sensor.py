@@ -24,8 +24,12 @@ class VoltalisEnergyContractLiveConsumptionSensor(VoltalisEnergyContractEntity,
 
     def __init__(self, entry: VoltalisConfigEntry, energy_contract: EnergyContract) -> None:
         """Initialize the sensor entity."""
+        # The live consumption is stored under the key 0 in the coordinator data
         super().__init__(
-            entry, energy_contract, entry.runtime_data.voltalis_home_assistant_module.live_consumption_coordinator
+            entry,
+            energy_contract,
+            entry.runtime_data.voltalis_home_assistant_module.live_consumption_coordinator,
+            context=0,
         )
 
     @callback
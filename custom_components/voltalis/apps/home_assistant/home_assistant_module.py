@@ -1,13 +1,20 @@
 import asyncio
 import logging
+from datetime import datetime, timedelta
+from typing import Any
 
+from aiohttp import ClientSession
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util.ssl import get_default_context
 from pydantic import SecretStr
 
 from custom_components.voltalis.apps.home_assistant.coordinators.base import BaseVoltalisCoordinator
+from custom_components.voltalis.apps.home_assistant.coordinators.circuit_breaker import VoltalisCircuitBreaker
 from custom_components.voltalis.apps.home_assistant.coordinators.device import VoltalisDeviceCoordinator
 from custom_components.voltalis.apps.home_assistant.coordinators.device_daily_consumption import (
     VoltalisDeviceDailyConsumptionCoordinator,
@@ -20,32 +27,68 @@ from custom_components.voltalis.apps.home_assistant.coordinators.energy_contract
     VoltalisEnergyContractCoordinator,
 )
 from custom_components.voltalis.apps.home_assistant.coordinators.program import VoltalisProgramCoordinator
+from custom_components.voltalis.apps.home_assistant.coordinators.site_snapshot import VoltalisSiteSnapshotCoordinator
+from custom_components.voltalis.apps.home_assistant.coordinators.tariff_clock import VoltalisTariffClock
 from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import (
     VoltalisConfigEntry,
     VoltalisConfigEntryData,
+    VoltalisSessionData,
+)
+from custom_components.voltalis.apps.home_assistant.providers.consumption_statistics_provider_recorder import (
+    ConsumptionStatisticsProviderRecorder,
 )
 from custom_components.voltalis.const import (
+    CIRCUIT_BREAKER_BASE_BACKOFF,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_MAX_BACKOFF,
     CONF_CLIMATE_MAX_TEMP,
     CONF_CLIMATE_MIN_TEMP,
+    CONF_CONSUMPTION_BACKFILL_DAYS,
+    CONF_CONSUMPTION_CACHE_RETENTION_DAYS,
+    CONF_DEDICATED_SESSION,
     CONF_DEFAULT_AWAY_TEMP,
     CONF_DEFAULT_COMFORT_TEMP,
     CONF_DEFAULT_ECO_TEMP,
     CONF_DEFAULT_TEMP,
     CONF_DEFAULT_WATER_HEATER_TEMP,
     CONF_LOG_LEVEL,
+    CONSUMPTION_BACKFILL_MAX_CONCURRENCY,
+    CONSUMPTION_BACKFILL_STORAGE_KEY,
+    CONSUMPTION_BACKFILL_STORAGE_VERSION,
+    CONSUMPTION_CACHE_MAX_SIZE,
+    CONSUMPTION_CACHE_STORAGE_KEY,
+    CONSUMPTION_CACHE_STORAGE_VERSION,
     DEFAULT_AWAY_TEMP,
     DEFAULT_CLIMATE_MAX_TEMP,
     DEFAULT_CLIMATE_MIN_TEMP,
     DEFAULT_COMFORT_TEMP,
+    DEFAULT_CONSUMPTION_BACKFILL_DAYS,
+    DEFAULT_CONSUMPTION_CACHE_RETENTION_DAYS,
+    DEFAULT_DEDICATED_SESSION,
     DEFAULT_ECO_TEMP,
     DEFAULT_LOG_LEVEL,
     DEFAULT_TEMP,
     DEFAULT_WATER_HEATER_TEMP,
     DOMAIN,
+    SESSION_STORAGE_KEY,
+    SESSION_STORAGE_VERSION,
     VOLTALIS_API_BASE_URL,
+    VOLTALIS_SESSION_CONNECTIONS_LIMIT,
+    VOLTALIS_SESSION_DNS_CACHE_TTL,
+    VOLTALIS_SESSION_KEEPALIVE_TIMEOUT,
     LogLevelEnum,
 )
+from custom_components.voltalis.lib.application.devices_management.queries.backfill_devices_consumption_command import (  # noqa: E501
+    BackfillDevicesConsumptionCommand,
+)
+from custom_components.voltalis.lib.domain.shared.exceptions import VoltalisException
+from custom_components.voltalis.lib.infrastructure.providers.consumption_cache_persistent import (
+    ConsumptionCachePersistent,
+)
 from custom_components.voltalis.lib.infrastructure.providers.date_provider_real import DateProviderReal
+from custom_components.voltalis.lib.infrastructure.providers.http_client_aiohttp import HttpClientAiohttp
+from custom_components.voltalis.lib.infrastructure.providers.http_rate_limiter import HttpRateLimiter
+from custom_components.voltalis.lib.infrastructure.providers.http_retry_policy import HttpRetryPolicy
 from custom_components.voltalis.lib.infrastructure.providers.voltalis_client_aiohttp import VoltalisClientAiohttp
 from custom_components.voltalis.lib.infrastructure.providers.voltalis_provider_voltalis_api import (
     VoltalisProviderVoltalisApi,
@@ -64,6 +107,12 @@ class VoltalisHomeAssistantModule(VoltalisModule):
         Platform.SWITCH,
     ]
 
+    # Delay before writing the consumption cache, the days fetched together are written at once
+    CONSUMPTION_CACHE_SAVE_DELAY = 10  # in seconds
+    # Time of the daily import of the past days consumption into the long-term statistics
+    CONSUMPTION_BACKFILL_HOUR = 3
+    CONSUMPTION_BACKFILL_MINUTE = 15
+
     def __init__(self) -> None:
         """
         We can't do anything in the constructor,
@@ -74,10 +123,26 @@ class VoltalisHomeAssistantModule(VoltalisModule):
     async def async_setup_entry(self, *, hass: HomeAssistant, entry: VoltalisConfigEntry) -> bool:
         """Initialize the module. used in async_setup_entry"""
 
+        # The dedicated session keeps its connections to Voltalis open between the polls, the shared one doesn't
+        self._dedicated_session: ClientSession | None = None
+        if entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION):
+            self._dedicated_session = HttpClientAiohttp.create_session(
+                connections_limit=VOLTALIS_SESSION_CONNECTIONS_LIMIT,
+                keepalive_timeout=VOLTALIS_SESSION_KEEPALIVE_TIMEOUT,
+                dns_cache_ttl=VOLTALIS_SESSION_DNS_CACHE_TTL,
+                ssl_context=get_default_context(),
+            )
+            # async_unload_entry is not called when the setup fails
+            entry.async_on_unload(self.__close_dedicated_session)
+
         # Initialize the module
         self._voltalis_client = VoltalisClientAiohttp(
-            session=async_get_clientsession(hass),
+            session=self._dedicated_session or async_get_clientsession(hass),
             base_url=VOLTALIS_API_BASE_URL,
+            use_conditional_cache=True,
+            retry_policy=HttpRetryPolicy(),
+            # The user commands are not delayed by the polls of the coordinators
+            rate_limiter=HttpRateLimiter(),
         )
 
         logger = logging.getLogger("voltalis-home_assistant")
@@ -92,11 +157,33 @@ class VoltalisHomeAssistantModule(VoltalisModule):
         }
         logger.setLevel(log_level_mapping.get(log_level, logging.INFO))
 
+        # Keep the consumption of the past days on disk, it never changes once the day is complete
+        date_provider = DateProviderReal()
+        consumption_cache_store = VoltalisHomeAssistantModule.get_consumption_cache_store(hass=hass, entry=entry)
+        consumption_cache = ConsumptionCachePersistent(
+            date_provider=date_provider,
+            load=consumption_cache_store.async_load,
+            save=lambda data: consumption_cache_store.async_delay_save(lambda: data, self.CONSUMPTION_CACHE_SAVE_DELAY),
+            retention_days=entry.options.get(
+                CONF_CONSUMPTION_CACHE_RETENTION_DAYS, DEFAULT_CONSUMPTION_CACHE_RETENTION_DAYS
+            ),
+            max_size=CONSUMPTION_CACHE_MAX_SIZE,
+        )
+
         super().__init__(
             # Providers
-            date_provider=DateProviderReal(),
+            date_provider=date_provider,
             logger=logger,
-            voltalis_provider=VoltalisProviderVoltalisApi(http_client=self._voltalis_client),
+            voltalis_provider=VoltalisProviderVoltalisApi(
+                http_client=self._voltalis_client,
+                date_provider=date_provider,
+                consumption_cache=consumption_cache,
+            ),
+            consumption_statistics_provider=ConsumptionStatisticsProviderRecorder(
+                hass=hass,
+                checkpoint_store=VoltalisHomeAssistantModule.get_consumption_backfill_store(hass=hass, entry=entry),
+                get_device_name=self.__get_device_name,
+            ),
             config=VoltalisModuleConfig(
                 climate_min_temp=entry.options.get(CONF_CLIMATE_MIN_TEMP, DEFAULT_CLIMATE_MIN_TEMP),
                 climate_max_temp=entry.options.get(CONF_CLIMATE_MAX_TEMP, DEFAULT_CLIMATE_MAX_TEMP),
@@ -122,9 +209,30 @@ class VoltalisHomeAssistantModule(VoltalisModule):
         username = self.entry.data["username"]
         password = SecretStr(self.entry.data["password"])
 
-        await self._voltalis_client.login(
-            username=username,
-            password=password,
+        # Reuse the token of the previous run, the client logs in again on the first 401
+        self.__session_store = VoltalisHomeAssistantModule.get_session_store(hass=hass, entry=entry)
+        self.entry.async_on_unload(self._voltalis_client.add_login_listener(self.__save_session))
+
+        session = await self.__session_store.async_load()
+        if session is not None and session["username"] == username:
+            self._voltalis_client.restore_session(
+                username=username,
+                password=password,
+                auth_token=SecretStr(session["auth_token"]),
+                default_site_id=session["default_site_id"],
+            )
+        else:
+            await self._voltalis_client.login(
+                username=username,
+                password=password,
+            )
+
+        # The coordinators of the entry stop polling together while the API is unavailable
+        self.circuit_breaker = VoltalisCircuitBreaker(
+            logger=logger,
+            failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            base_backoff=timedelta(minutes=CIRCUIT_BREAKER_BASE_BACKOFF),
+            max_backoff=timedelta(minutes=CIRCUIT_BREAKER_MAX_BACKOFF),
         )
 
         await self.__load_coordinators()
@@ -135,6 +243,23 @@ class VoltalisHomeAssistantModule(VoltalisModule):
         # Cleanup devices without entities to prevent shadow devices after initial setup
         self.cleanup_empty_devices()
 
+        # Import the consumption of the past days into the long-term statistics, now and then every day
+        self.__consumption_backfill_days: int = entry.options.get(
+            CONF_CONSUMPTION_BACKFILL_DAYS, DEFAULT_CONSUMPTION_BACKFILL_DAYS
+        )
+        self.__consumption_backfill_task: asyncio.Task[None] | None = None
+        if self.__consumption_backfill_days > 0 and "recorder" in hass.config.components:
+            self.__start_consumption_backfill()
+            self.entry.async_on_unload(
+                async_track_time_change(
+                    hass,
+                    self.__on_consumption_backfill_time,
+                    hour=self.CONSUMPTION_BACKFILL_HOUR,
+                    minute=self.CONSUMPTION_BACKFILL_MINUTE,
+                    second=0,
+                )
+            )
+
         return True
 
     async def async_unload_entry(self) -> bool:
@@ -146,15 +271,86 @@ class VoltalisHomeAssistantModule(VoltalisModule):
         # Then unload coordinators
         await self.__unload_coordinators()
 
-        # Finally, close the client session
-        try:
-            await self._voltalis_client.logout()
-        except RuntimeError:
-            # Session might already be closed, this is acceptable during cleanup
-            pass
+        # Finally, close the client without logging out, the persisted session is reused on the next setup
+        self._voltalis_client.close()
+        await self.__close_dedicated_session()
 
         return unload_ok
 
+    async def __close_dedicated_session(self) -> None:
+        if self._dedicated_session is not None:
+            await self._dedicated_session.close()
+            self._dedicated_session = None
+
+    @staticmethod
+    def get_session_store(*, hass: HomeAssistant, entry: VoltalisConfigEntry) -> Store[VoltalisSessionData]:
+        """Get the store of the Voltalis session of a config entry."""
+        return Store(hass, SESSION_STORAGE_VERSION, f"{SESSION_STORAGE_KEY}.{entry.entry_id}")
+
+    @staticmethod
+    def get_consumption_cache_store(*, hass: HomeAssistant, entry: VoltalisConfigEntry) -> Store[dict[str, Any]]:
+        """Get the store of the past days consumption of a config entry."""
+        return Store(hass, CONSUMPTION_CACHE_STORAGE_VERSION, f"{CONSUMPTION_CACHE_STORAGE_KEY}.{entry.entry_id}")
+
+    @staticmethod
+    def get_consumption_backfill_store(*, hass: HomeAssistant, entry: VoltalisConfigEntry) -> Store[dict[str, Any]]:
+        """Get the store of the consumption backfill progress of a config entry."""
+        return Store(hass, CONSUMPTION_BACKFILL_STORAGE_VERSION, f"{CONSUMPTION_BACKFILL_STORAGE_KEY}.{entry.entry_id}")
+
+    def __get_device_name(self, device_id: int) -> str | None:
+        """Get the name of a device, None if it is unknown."""
+
+        device = (self.device_coordinator.data or {}).get(device_id)
+        return device.name if device is not None else None
+
+    @callback
+    def __on_consumption_backfill_time(self, now: datetime) -> None:
+        self.__start_consumption_backfill()
+
+    @callback
+    def __start_consumption_backfill(self) -> None:
+        """Start the import of the past days consumption in the background, cancelled on unload."""
+
+        # The previous import is still running, the next days are imported on the next run
+        if self.__consumption_backfill_task is not None and not self.__consumption_backfill_task.done():
+            return
+
+        self.__consumption_backfill_task = self.entry.async_create_background_task(
+            self.hass,
+            self.__backfill_consumption(),
+            name=f"{DOMAIN} consumption backfill {self.entry.entry_id}",
+        )
+
+    async def __backfill_consumption(self) -> None:
+        """Import the past days consumption, an error is retried from the last imported day on the next run."""
+
+        try:
+            imported_days = await self.backfill_devices_consumption_handler.handle(
+                BackfillDevicesConsumptionCommand(
+                    days=self.__consumption_backfill_days,
+                    max_concurrency=CONSUMPTION_BACKFILL_MAX_CONCURRENCY,
+                )
+            )
+        except VoltalisException as err:
+            self.logger.warning("Error importing the past days consumption into the statistics: %s", err)
+            return
+        self.logger.debug("Past days consumption imported into the statistics: %s days", imported_days)
+
+    @callback
+    def __save_session(self) -> None:
+        """Persist the Voltalis session after a login."""
+
+        storage = self._voltalis_client.storage
+        if storage["username"] is None or storage["auth_token"] is None or storage["default_site_id"] is None:
+            return
+
+        session = VoltalisSessionData(
+            username=storage["username"],
+            auth_token=storage["auth_token"].get_secret_value(),
+            default_site_id=storage["default_site_id"],
+        )
+        self.hass.async_create_task(self.__session_store.async_save(session))
+
     async def __load_coordinators(self) -> None:
         """Set up all coordinators."""
 
@@ -175,18 +371,36 @@ class VoltalisHomeAssistantModule(VoltalisModule):
             self.programs_coordinator,
         ]
 
-        await asyncio.gather(*(coordinator.async_config_entry_first_refresh() for coordinator in arr))
+        # The energy contract is loaded first, the daily consumption uses it to compute the devices costs
+        await self.energy_contract_coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            *(
+                coordinator.async_config_entry_first_refresh()
+                for coordinator in arr
+                if coordinator is not self.energy_contract_coordinator
+            )
+        )
 
-        # For consumption, start time-based scheduling after initial refresh
-        self.device_daily_consumption_coordinator.start_time_tracking()
-        self.live_consumption_coordinator.start_time_tracking()
+        # A single scheduled tick refreshes all the due coordinators, started after initial refresh
+        self.site_snapshot_coordinator = VoltalisSiteSnapshotCoordinator(entry=self.entry, slices=arr)
+        self.site_snapshot_coordinator.start_time_tracking()
+
+        # A single clock wakes the tariff sensors on each peak / offpeak transition
+        self.tariff_clock = VoltalisTariffClock(
+            entry=self.entry,
+            energy_contract_coordinator=self.energy_contract_coordinator,
+        )
+        await self.tariff_clock.async_start_time_tracking()
 
     async def __unload_coordinators(self) -> None:
         """Unload all coordinators."""
 
-        # Stop time tracking for consumption coordinators
-        self.device_daily_consumption_coordinator.stop_time_tracking()
-        self.live_consumption_coordinator.stop_time_tracking()
+        # Stop the site snapshot time tracking
+        self.site_snapshot_coordinator.stop_time_tracking()
+        self.tariff_clock.stop_time_tracking()
+
+        # Drop the pending reconciliation of the optimistic device updates
+        self.device_coordinator.cancel_reconciliation()
 
     def cleanup_empty_devices(self) -> None:
         """Cleanup devices with no entities to prevent shadow devices"""
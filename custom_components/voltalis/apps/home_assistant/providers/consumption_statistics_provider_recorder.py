@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Any, Callable
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from custom_components.voltalis.const import DOMAIN
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_statistic import (
+    ConsumptionStatistic,
+)
+from custom_components.voltalis.lib.domain.shared.providers.consumption_statistics_provider import (
+    ConsumptionStatisticsProvider,
+)
+
+
+class ConsumptionStatisticsProviderRecorder(ConsumptionStatisticsProvider):
+    """Provider importing the devices consumption into the external statistics of the Home Assistant recorder."""
+
+    def __init__(
+        self,
+        *,
+        hass: HomeAssistant,
+        checkpoint_store: Store[dict[str, Any]],
+        get_device_name: Callable[[int], str | None],
+    ) -> None:
+        self.__hass = hass
+        self.__checkpoint_store = checkpoint_store
+        self.__get_device_name = get_device_name
+
+    @staticmethod
+    def get_statistic_id(device_id: int) -> str:
+        """Get the id of the external statistic of the consumption of a device."""
+        return f"{DOMAIN}:device_{device_id}_consumption"
+
+    async def get_checkpoint(self) -> ConsumptionBackfillCheckpoint:
+        data = await self.__checkpoint_store.async_load()
+        if data is None:
+            return ConsumptionBackfillCheckpoint()
+        return ConsumptionBackfillCheckpoint.model_validate(data)
+
+    async def save_checkpoint(self, checkpoint: ConsumptionBackfillCheckpoint) -> None:
+        await self.__checkpoint_store.async_save(checkpoint.model_dump(mode="json"))
+
+    async def import_statistics(self, devices_statistics: dict[int, list[ConsumptionStatistic]]) -> None:
+        for device_id, statistics in devices_statistics.items():
+            if not statistics:
+                continue
+
+            device_name = self.__get_device_name(device_id) or f"Device {device_id}"
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.NONE,
+                has_sum=True,
+                name=f"{device_name} consumption",
+                source=DOMAIN,
+                statistic_id=ConsumptionStatisticsProviderRecorder.get_statistic_id(device_id),
+                unit_class=EnergyConverter.UNIT_CLASS,
+                unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+            )
+            # All the hours of a device are imported at once, the recorder replaces the hours already imported
+            async_add_external_statistics(
+                self.__hass,
+                metadata,
+                [
+                    StatisticData(
+                        start=ConsumptionStatisticsProviderRecorder.__to_utc(statistic.start),
+                        state=statistic.consumption,
+                        sum=statistic.sum,
+                    )
+                    for statistic in statistics
+                ],
+            )
+
+    @staticmethod
+    def __to_utc(start: datetime) -> datetime:
+        """The steps of the Voltalis API are in the local time of the site, without timezone."""
+
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=dt_util.get_default_time_zone())
+        return dt_util.as_utc(start)
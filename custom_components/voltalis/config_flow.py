@@ -11,6 +11,9 @@ from pydantic import SecretStr
 from custom_components.voltalis.const import (
     CONF_CLIMATE_MAX_TEMP,
     CONF_CLIMATE_MIN_TEMP,
+    CONF_CONSUMPTION_BACKFILL_DAYS,
+    CONF_CONSUMPTION_CACHE_RETENTION_DAYS,
+    CONF_DEDICATED_SESSION,
     CONF_DEFAULT_AWAY_TEMP,
     CONF_DEFAULT_COMFORT_TEMP,
     CONF_DEFAULT_ECO_TEMP,
@@ -21,6 +24,9 @@ from custom_components.voltalis.const import (
     DEFAULT_CLIMATE_MAX_TEMP,
     DEFAULT_CLIMATE_MIN_TEMP,
     DEFAULT_COMFORT_TEMP,
+    DEFAULT_CONSUMPTION_BACKFILL_DAYS,
+    DEFAULT_CONSUMPTION_CACHE_RETENTION_DAYS,
+    DEFAULT_DEDICATED_SESSION,
     DEFAULT_ECO_TEMP,
     DEFAULT_LOG_LEVEL,
     DEFAULT_TEMP,
@@ -278,6 +284,24 @@ class VoltalisOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_DEFAULT_WATER_HEATER_TEMP,
                     default=self._config_entry.options.get(CONF_DEFAULT_WATER_HEATER_TEMP, DEFAULT_WATER_HEATER_TEMP),
                 ): vol.Coerce(float),
+                # Consumption cache options
+                vol.Optional(
+                    CONF_CONSUMPTION_CACHE_RETENTION_DAYS,
+                    default=self._config_entry.options.get(
+                        CONF_CONSUMPTION_CACHE_RETENTION_DAYS, DEFAULT_CONSUMPTION_CACHE_RETENTION_DAYS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_CONSUMPTION_BACKFILL_DAYS,
+                    default=self._config_entry.options.get(
+                        CONF_CONSUMPTION_BACKFILL_DAYS, DEFAULT_CONSUMPTION_BACKFILL_DAYS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                # Connection options
+                vol.Optional(
+                    CONF_DEDICATED_SESSION,
+                    default=self._config_entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION),
+                ): bool,
             }
         )
 
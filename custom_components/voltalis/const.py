@@ -12,6 +12,29 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 VOLTALIS_API_BASE_URL = "https://api.myvoltalis.com"
 VOLTALIS_API_LOGIN_ROUTE = "/auth/login"
 
+# Connection pool of the dedicated session, its connections stay open between two polls
+VOLTALIS_SESSION_CONNECTIONS_LIMIT = 10
+VOLTALIS_SESSION_KEEPALIVE_TIMEOUT = 75  # in seconds
+VOLTALIS_SESSION_DNS_CACHE_TTL = 300  # in seconds
+
+SESSION_STORAGE_KEY = f"{DOMAIN}.session"
+SESSION_STORAGE_VERSION = 1
+
+CONSUMPTION_CACHE_STORAGE_KEY = f"{DOMAIN}.consumption_cache"
+CONSUMPTION_CACHE_STORAGE_VERSION = 1
+CONSUMPTION_CACHE_MAX_SIZE = 5 * 1024 * 1024  # in bytes
+
+CONSUMPTION_BACKFILL_STORAGE_KEY = f"{DOMAIN}.consumption_backfill"
+CONSUMPTION_BACKFILL_STORAGE_VERSION = 1
+CONSUMPTION_BACKFILL_MAX_CONCURRENCY = 4
+
+CONSUMPTION_RANGE_MAX_CONCURRENCY = 4
+CONSUMPTION_RANGE_MAX_DAYS = 366
+
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_BASE_BACKOFF = 2  # in minutes
+CIRCUIT_BREAKER_MAX_BACKOFF = 60  # in minutes
+
 CLIMATE_UNIT = UnitOfTemperature.CELSIUS
 CLIMATE_TEMP_STEP = 0.5
 CLIMATE_BOOST_TEMP_INCREASE = 2.0
@@ -25,6 +48,9 @@ CONF_DEFAULT_AWAY_TEMP = "default_away_temp"
 CONF_DEFAULT_ECO_TEMP = "default_eco_temp"
 CONF_DEFAULT_COMFORT_TEMP = "default_comfort_temp"
 CONF_DEFAULT_WATER_HEATER_TEMP = "default_water_heater_temp"
+CONF_CONSUMPTION_CACHE_RETENTION_DAYS = "consumption_cache_retention_days"
+CONF_CONSUMPTION_BACKFILL_DAYS = "consumption_backfill_days"
+CONF_DEDICATED_SESSION = "dedicated_session"
 
 
 class LogLevelEnum(StrEnum):
@@ -49,3 +75,10 @@ DEFAULT_AWAY_TEMP = 7.0
 DEFAULT_ECO_TEMP = 15.5
 DEFAULT_COMFORT_TEMP = 21.0
 DEFAULT_WATER_HEATER_TEMP = 55.0
+
+# Number of past days whose consumption is kept on disk
+DEFAULT_CONSUMPTION_CACHE_RETENTION_DAYS = 365
+# Number of past days whose consumption is imported into the long-term statistics
+DEFAULT_CONSUMPTION_BACKFILL_DAYS = 30
+# The Voltalis requests use the session shared with the other integrations by default
+DEFAULT_DEDICATED_SESSION = False
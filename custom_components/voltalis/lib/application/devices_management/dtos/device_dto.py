@@ -1,5 +1,6 @@
 from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import ManualSetting
 from custom_components.voltalis.lib.domain.devices_management.devices.device import Device
+from custom_components.voltalis.lib.domain.programs_management.programs.program_enum import ProgramTypeEnum
 
 
 class DeviceDto(Device):
@@ -14,3 +15,27 @@ class DeviceDto(Device):
             **device.model_dump(),
             manual_setting=manual_setting,
         )
+
+    def with_manual_setting(self, manual_setting: ManualSetting) -> "DeviceDto":
+        """Get the device as it is expected once the manual setting is applied by the API."""
+
+        if manual_setting.enabled:
+            programming_update = {
+                "prog_type": ProgramTypeEnum.MANUAL,
+                "is_on": manual_setting.is_on,
+                "mode": manual_setting.mode,
+                "temperature_target": manual_setting.temperature_target,
+            }
+        else:
+            # Back to the automatic programming, its mode is only known after the next fetch
+            programming_update = {
+                "prog_type": ProgramTypeEnum.DEFAULT,
+                "is_on": manual_setting.is_on,
+            }
+
+        return self.model_copy(
+            update={
+                "programming": self.programming.model_copy(update=programming_update),
+                "manual_setting": manual_setting,
+            }
+        )
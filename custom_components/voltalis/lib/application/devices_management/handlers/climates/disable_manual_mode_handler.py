@@ -3,12 +3,16 @@ from logging import Logger
 from custom_components.voltalis.lib.application.devices_management.commands.disable_manual_mode_command import (
     DisableManualModeCommand,
 )
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
@@ -27,18 +31,20 @@ class DisableManualModeHandler:
         default_away_temp: float,
         default_eco_temp: float,
         default_comfort_temp: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_temperature = default_temperature
         self.__default_away_temp = default_away_temp
         self.__default_eco_temp = default_eco_temp
         self.__default_comfort_temp = default_comfort_temp
 
-    async def handle(self, command: DisableManualModeCommand) -> None:
+    async def handle(self, command: DisableManualModeCommand) -> DeviceDto:
         """Handle the request to disable manual mode for a device."""
 
         if command.device.manual_setting is None:
@@ -56,10 +62,12 @@ class DisableManualModeHandler:
             temperature=command.fallback_temperature,
         )
 
-        await self.__climate_service.disable_manual_mode(
+        manual_setting = await self.__climate_service.disable_manual_mode(
             manual_setting_id=command.device.manual_setting.id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
             fallback_mode=command.fallback_mode or command.device.programming.mode or DeviceModeEnum.ECO,
             fallback_temperature=target_temp,
         )
+
+        return command.device.with_manual_setting(manual_setting)
@@ -2,6 +2,7 @@ from logging import Logger
 
 from homeassistant.components.climate.const import HVACAction
 
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
@@ -11,6 +12,9 @@ from custom_components.voltalis.lib.application.devices_management.queries.set_c
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
@@ -29,11 +33,13 @@ class SetClimateActionHandler:
         default_away_temperature: float,
         default_eco_temperature: float,
         default_comfort_temperature: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_temperature = default_temperature
         self.__default_away_temperature = default_away_temperature
@@ -43,7 +49,7 @@ class SetClimateActionHandler:
     async def handle(
         self,
         command: SetClimateActionCommand,
-    ) -> None:
+    ) -> DeviceDto:
         """Handle the request to set climate action for a device."""
 
         if command.device.manual_setting is None:
@@ -61,28 +67,30 @@ class SetClimateActionHandler:
         )
 
         if command.action is HVACAction.HEATING:
-            await self.__climate_service.set_manual_mode(
+            manual_setting = await self.__climate_service.set_manual_mode(
                 manual_setting_id=command.device.manual_setting.id,
                 device_id=command.device.id,
                 has_device_ecov=command.device.has_ecov,
                 mode=target_mode,
                 temperature_target=target_temp,
             )
-            return
+            return command.device.with_manual_setting(manual_setting)
         if command.action is HVACAction.IDLE:
-            await self.__climate_service.disable_manual_mode(
+            manual_setting = await self.__climate_service.disable_manual_mode(
                 manual_setting_id=command.device.manual_setting.id,
                 device_id=command.device.id,
                 has_device_ecov=command.device.has_ecov,
                 fallback_mode=target_mode,
                 fallback_temperature=target_temp,
             )
-            return
+            return command.device.with_manual_setting(manual_setting)
 
-        await self.__climate_service.turn_off(
+        manual_setting = await self.__climate_service.turn_off(
             manual_setting_id=command.device.manual_setting.id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
             fallback_mode=target_mode,
             fallback_temperature=target_temp,
         )
+
+        return command.device.with_manual_setting(manual_setting)
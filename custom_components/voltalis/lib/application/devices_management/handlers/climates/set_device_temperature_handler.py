@@ -3,12 +3,16 @@ from logging import Logger
 from custom_components.voltalis.lib.application.devices_management.commands.set_device_temperature_command import (
     SetDeviceTemperatureCommand,
 )
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
@@ -27,11 +31,13 @@ class SetDeviceTemperatureHandler:
         default_away_temperature: float,
         default_eco_temperature: float,
         default_comfort_temperature: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_temperature = default_temperature
         self.__default_away_temperature = default_away_temperature
@@ -41,7 +47,7 @@ class SetDeviceTemperatureHandler:
     async def handle(
         self,
         command: SetDeviceTemperatureCommand,
-    ) -> None:
+    ) -> DeviceDto:
         """Handle the request to set target temperature for a device."""
 
         if command.device.manual_setting is None:
@@ -58,7 +64,7 @@ class SetDeviceTemperatureHandler:
             temperature=command.temperature,
         )
 
-        await self.__climate_service.set_manual_mode(
+        manual_setting = await self.__climate_service.set_manual_mode(
             manual_setting_id=command.device.manual_setting.id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
@@ -66,3 +72,5 @@ class SetDeviceTemperatureHandler:
             temperature_target=target_temp,
             duration_hours=command.duration_hours,
         )
+
+        return command.device.with_manual_setting(manual_setting)
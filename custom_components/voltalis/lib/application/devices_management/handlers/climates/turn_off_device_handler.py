@@ -3,12 +3,16 @@ from logging import Logger
 from custom_components.voltalis.lib.application.devices_management.commands.turn_off_device_command import (
     TurnOffDeviceCommand,
 )
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
@@ -27,18 +31,20 @@ class TurnOffDeviceHandler:
         default_away_temperature: float,
         default_eco_temperature: float,
         default_comfort_temperature: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_temperature = default_temperature
         self.__default_away_temperature = default_away_temperature
         self.__default_eco_temperature = default_eco_temperature
         self.__default_comfort_temperature = default_comfort_temperature
 
-    async def handle(self, command: TurnOffDeviceCommand) -> None:
+    async def handle(self, command: TurnOffDeviceCommand) -> DeviceDto:
         """Handle the request to turn off a device for a specified duration."""
 
         if command.device.manual_setting is None:
@@ -56,7 +62,7 @@ class TurnOffDeviceHandler:
             temperature=command.fallback_temperature,
         )
 
-        await self.__climate_service.turn_off(
+        manual_setting = await self.__climate_service.turn_off(
             manual_setting_id=command.device.manual_setting.id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
@@ -64,3 +70,5 @@ class TurnOffDeviceHandler:
             fallback_mode=target_mode,
             duration_hours=command.duration_hours,
         )
+
+        return command.device.with_manual_setting(manual_setting)
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from logging import Logger
+
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_consumption_range_handler import (  # noqa: E501
+    DevicesDayConsumptions,
+    GetDevicesConsumptionRangeHandler,
+)
+from custom_components.voltalis.lib.application.devices_management.queries.backfill_devices_consumption_command import (  # noqa: E501
+    BackfillDevicesConsumptionCommand,
+)
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_consumption_range_query import (  # noqa: E501
+    GetDevicesConsumptionRangeQuery,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_statistic import (
+    ConsumptionStatistic,
+)
+from custom_components.voltalis.lib.domain.shared.providers.consumption_statistics_provider import (
+    ConsumptionStatisticsProvider,
+)
+from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
+
+
+class BackfillDevicesConsumptionHandler:
+    """Handler to import the hourly consumption of the past days of all devices into the long-term statistics.
+
+    The days are fetched concurrently and imported by batches in chronological order, the progress is saved after
+    each batch so a restart continues after the last imported day. An hour imported again replaces the previous one,
+    so when the range starts before the first imported day, the days are imported again with their sums from this start.
+    """
+
+    # Number of days after which the consumption of a day is complete
+    COMPLETE_DAY_DELAY = timedelta(days=2)
+    # Number of days imported at once, the progress is saved after each batch
+    BATCH_DAYS = 7
+
+    def __init__(
+        self,
+        *,
+        logger: Logger,
+        date_provider: DateProvider,
+        consumption_statistics_provider: ConsumptionStatisticsProvider,
+        get_devices_consumption_range_handler: GetDevicesConsumptionRangeHandler,
+    ):
+        self.__logger = logger
+        self.__date_provider = date_provider
+        self.__consumption_statistics_provider = consumption_statistics_provider
+        self.__get_devices_consumption_range_handler = get_devices_consumption_range_handler
+
+    async def handle(self, command: BackfillDevicesConsumptionCommand) -> int:
+        """Handle the request to backfill the consumption of the past days, returns the number of days imported."""
+
+        today = self.__date_provider.get_now().date()
+        start = today - timedelta(days=command.days)
+        end = today - BackfillDevicesConsumptionHandler.COMPLETE_DAY_DELAY
+
+        checkpoint = await self.__consumption_statistics_provider.get_checkpoint()
+        if checkpoint.first_day is None or start < checkpoint.first_day:
+            # The sums of the days already imported are rebased on the older days, the import starts over
+            checkpoint = ConsumptionBackfillCheckpoint()
+        elif checkpoint.last_day is not None:
+            start = max(start, checkpoint.last_day + timedelta(days=1))
+
+        # The days are imported by batches, the next days are fetched while a batch is imported
+        imported_days = 0
+        batch: list[DevicesDayConsumptions] = []
+        async for day_consumptions in self.__get_devices_consumption_range_handler.handle(
+            GetDevicesConsumptionRangeQuery(start=start, end=end, max_concurrency=command.max_concurrency)
+        ):
+            batch.append(day_consumptions)
+            if len(batch) >= BackfillDevicesConsumptionHandler.BATCH_DAYS:
+                checkpoint = await self.__import_batch(batch, checkpoint)
+                imported_days += len(batch)
+                batch = []
+
+        if batch:
+            checkpoint = await self.__import_batch(batch, checkpoint)
+            imported_days += len(batch)
+
+        return imported_days
+
+    async def __import_batch(
+        self,
+        batch: list[DevicesDayConsumptions],
+        checkpoint: ConsumptionBackfillCheckpoint,
+    ) -> ConsumptionBackfillCheckpoint:
+        """Import the hourly consumption of a batch of days, then save and return the new checkpoint."""
+
+        sums = dict(checkpoint.sums)
+        devices_statistics: dict[int, list[ConsumptionStatistic]] = {}
+        for _, devices_consumptions in batch:
+            for device_id, consumption_records in devices_consumptions.items():
+                statistics = devices_statistics.setdefault(device_id, [])
+                device_sum = sums.get(device_id, 0.0)
+                hourly_consumptions = BackfillDevicesConsumptionHandler.__get_hourly_consumptions(consumption_records)
+                for hour, consumption in hourly_consumptions:
+                    device_sum += consumption
+                    statistics.append(ConsumptionStatistic(start=hour, consumption=consumption, sum=device_sum))
+                sums[device_id] = device_sum
+
+        await self.__consumption_statistics_provider.import_statistics(devices_statistics)
+        checkpoint = ConsumptionBackfillCheckpoint(
+            first_day=checkpoint.first_day or batch[0][0],
+            last_day=batch[-1][0],
+            sums=sums,
+        )
+        await self.__consumption_statistics_provider.save_checkpoint(checkpoint)
+        self.__logger.debug("Consumption imported into the statistics until %s", checkpoint.last_day)
+        return checkpoint
+
+    @staticmethod
+    def __get_hourly_consumptions(consumption_records: ConsumptionSeries) -> list[tuple[datetime, float]]:
+        """Sum the consumption steps of each hour, the steps are in chronological order."""
+
+        hourly_consumptions: list[tuple[datetime, float]] = []
+        for step, consumption in consumption_records:
+            hour = step.replace(minute=0, second=0, microsecond=0)
+            if hourly_consumptions and hourly_consumptions[-1][0] == hour:
+                hourly_consumptions[-1] = (hour, hourly_consumptions[-1][1] + consumption)
+            else:
+                hourly_consumptions.append((hour, consumption))
+        return hourly_consumptions
@@ -1,6 +1,8 @@
+import asyncio
 from logging import Logger
 
 from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import ManualSetting
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceTypeEnum
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
 
@@ -16,13 +18,33 @@ class GetDevicesHandler:
     ):
         self.__logger = logger
         self.__voltalis_provider = voltalis_provider
+        self.__last_manual_settings: dict[int, ManualSetting] = {}
 
     async def handle(self) -> dict[int, DeviceDto]:
         """Handle the request to get the devices."""
 
-        # Fetch devices and manual settings
-        devices = await self.__voltalis_provider.get_devices()
-        devices_manual_settings = await self.__voltalis_provider.get_manual_settings()
+        # Fetch devices and manual settings concurrently
+        devices, manual_settings_result = await asyncio.gather(
+            self.__voltalis_provider.get_devices(),
+            self.__voltalis_provider.get_manual_settings(),
+            return_exceptions=True,
+        )
+
+        # The devices are mandatory, there is nothing to fall back on
+        if isinstance(devices, BaseException):
+            raise devices
+
+        # The devices are still returned with the last known manual settings if they can't be fetched
+        if isinstance(manual_settings_result, Exception):
+            self.__logger.warning(
+                "Failed to fetch manual settings, using the last known ones: %s", manual_settings_result
+            )
+            devices_manual_settings = dict(self.__last_manual_settings)
+        elif isinstance(manual_settings_result, BaseException):
+            raise manual_settings_result
+        else:
+            devices_manual_settings = manual_settings_result
+        self.__last_manual_settings = devices_manual_settings
 
         result: dict[int, DeviceDto] = {}
         for device_id, device in devices.items():
@@ -0,0 +1,52 @@
+import asyncio
+from collections import deque
+from datetime import date, timedelta
+from typing import AsyncGenerator
+
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_consumption_range_query import (  # noqa: E501
+    GetDevicesConsumptionRangeQuery,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
+
+DevicesDayConsumptions = tuple[date, dict[int, ConsumptionSeries]]
+
+
+class GetDevicesConsumptionRangeHandler:
+    """Handler to get the consumption of all devices for each day of a range.
+
+    The days are fetched concurrently, at most max_concurrency at the same time, and yielded in chronological
+    order as soon as they are received, so only the days being fetched are kept in memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        voltalis_provider: VoltalisProvider,
+    ):
+        self.__voltalis_provider = voltalis_provider
+
+    async def handle(self, query: GetDevicesConsumptionRangeQuery) -> AsyncGenerator[DevicesDayConsumptions, None]:
+        """Handle the request to get the consumption of the days of the range, yields each day with its consumption."""
+
+        pending: deque[tuple[date, asyncio.Task[dict[int, ConsumptionSeries]]]] = deque()
+        try:
+            for index in range((query.end - query.start).days + 1):
+                day = query.start + timedelta(days=index)
+                task = asyncio.ensure_future(self.__voltalis_provider.get_devices_daily_consumptions(day))
+                pending.append((day, task))
+
+                # The next day is only fetched once the oldest pending day is yielded
+                if len(pending) >= max(query.max_concurrency, 1):
+                    pending_day, pending_task = pending.popleft()
+                    yield pending_day, await pending_task
+
+            while pending:
+                pending_day, pending_task = pending.popleft()
+                yield pending_day, await pending_task
+        finally:
+            # The consumer stopped early or a day failed, the days still being fetched are dropped
+            for _, pending_task in pending:
+                pending_task.cancel()
@@ -1,8 +1,21 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_daily_consumption_query import (  # noqa: E501
+    GetDevicesDailyConsumptionQuery,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_cost_engine import (
+    ConsumptionCostEngine,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.daily_consumption_series import (
+    DailyConsumptionSeries,
+)
 from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption import (
     DeviceConsumption,
 )
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption_cost import (
+    DeviceConsumptionCost,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_service import EnergyContractService
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
 
@@ -10,6 +23,9 @@ from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider im
 class GetDevicesDailyConsumptionHandler:
     """Handler to get the daily consumption for all devices."""
 
+    # Duration of the consumption steps of the days fetched from Voltalis
+    STEP_DURATION = timedelta(minutes=10)
+
     def __init__(
         self,
         *,
@@ -18,40 +34,46 @@ class GetDevicesDailyConsumptionHandler:
     ):
         self.__date_provider = date_provider
         self.__voltalis_provider = voltalis_provider
+        self.__devices_series: dict[int, DailyConsumptionSeries] = {}
+        self.__consumption_cost_engine = ConsumptionCostEngine(
+            energy_contract_service=EnergyContractService(date_provider=date_provider),
+            step_duration=GetDevicesDailyConsumptionHandler.STEP_DURATION,
+        )
 
-    async def handle(self) -> dict[int, DeviceConsumption]:
+    async def handle(self, query: GetDevicesDailyConsumptionQuery | None = None) -> dict[int, DeviceConsumption]:
         """Handle the request to get the daily consumption for all devices."""
 
         # We remove 1 hour because we can't fetch data from the current hour
         target_datetime = self.__date_provider.get_now() - timedelta(hours=1)
+        target_day = target_datetime.date()
+        # Only the steps of the hours before the current one are complete
+        until = target_datetime.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+        devices_daily_consumptions = await self.__voltalis_provider.get_devices_daily_consumptions(target_day)
+
+        # Merge the new and revised steps into the series of the day, the unchanged steps are not summed again
+        devices_series: dict[int, DailyConsumptionSeries] = {}
+        for device_id, consumption_records in devices_daily_consumptions.items():
+            series = self.__devices_series.get(device_id)
+            if series is None or series.day != target_day:
+                series = DailyConsumptionSeries(day=target_day)
+            series.append(consumption_records, until=until)
+            devices_series[device_id] = series
+        self.__devices_series = devices_series
+
+        devices_costs: dict[int, DeviceConsumptionCost] = {}
+        if query is not None and query.energy_contract is not None:
+            devices_costs = self.__consumption_cost_engine.update(
+                day=target_day,
+                energy_contract=query.energy_contract,
+                devices_series=devices_series,
+            )
 
-        devices_daily_consumptions = await self.__voltalis_provider.get_devices_daily_consumptions(
-            target_datetime.date()
-        )
         devices_consumptions = {
             device_id: DeviceConsumption(
-                daily_consumption=self.get_consumption_for_hour(
-                    consumptions=consumption_records,
-                    target_datetime=target_datetime,
-                )
+                daily_consumption=series.get_consumption_before(until),
+                daily_cost=devices_costs.get(device_id),
             )
-            for device_id, consumption_records in devices_daily_consumptions.items()
+            for device_id, series in devices_series.items()
         }
         return devices_consumptions
-
-    def get_consumption_for_hour(
-        self,
-        *,
-        consumptions: list[tuple[datetime, float]],
-        target_datetime: datetime,
-    ) -> float:
-        target_hour = target_datetime.replace(minute=0, second=0, microsecond=0)
-
-        return sum(
-            [
-                consumption
-                for (date, consumption) in consumptions
-                if date.replace(minute=0, second=0, microsecond=0) <= target_hour
-            ],
-            0.0,
-        )
@@ -3,12 +3,16 @@ from logging import Logger
 from custom_components.voltalis.lib.application.devices_management.commands.set_device_preset_command import (
     SetDevicePresetCommand,
 )
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.devices_management.presets.preset_enum import DeviceCurrentPresetEnum
 from custom_components.voltalis.lib.domain.devices_management.presets.presets_mappings import PRESET_MODE_MAPPING
@@ -29,18 +33,20 @@ class SetDevicePresetHandler:
         default_away_temperature: float,
         default_eco_temperature: float,
         default_comfort_temperature: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_temperature = default_temperature
         self.__default_away_temperature = default_away_temperature
         self.__default_eco_temperature = default_eco_temperature
         self.__default_comfort_temperature = default_comfort_temperature
 
-    async def handle(self, command: SetDevicePresetCommand) -> None:
+    async def handle(self, command: SetDevicePresetCommand) -> DeviceDto:
         """Handle the request to set a preset for a device."""
 
         if command.device.manual_setting is None:
@@ -53,17 +59,17 @@ class SetDevicePresetHandler:
 
         # Handle AUTO preset - disable manual mode
         if command_preset == DeviceCurrentPresetEnum.AUTO:
-            await self.__climate_service.disable_manual_mode(
+            manual_setting = await self.__climate_service.disable_manual_mode(
                 manual_setting_id=command.device.manual_setting.id,
                 device_id=command.device.id,
                 has_device_ecov=command.device.has_ecov,
                 fallback_temperature=command.temperature or 16.0,
             )
-            return
+            return command.device.with_manual_setting(manual_setting)
 
         # Handle OFF preset
         if command_preset == DeviceCurrentPresetEnum.OFF:
-            await self.__climate_service.turn_off(
+            manual_setting = await self.__climate_service.turn_off(
                 manual_setting_id=command.device.manual_setting.id,
                 device_id=command.device.id,
                 has_device_ecov=command.device.has_ecov,
@@ -73,7 +79,7 @@ class SetDevicePresetHandler:
                 fallback_temperature=command.temperature or 16.0,
                 duration_hours=command.duration_hours,
             )
-            return
+            return command.device.with_manual_setting(manual_setting)
 
         if command.has_on_mode and command_preset == DeviceCurrentPresetEnum.ON:
             target_mode = DeviceModeEnum.ON
@@ -92,7 +98,7 @@ class SetDevicePresetHandler:
             temperature=command.temperature,
         )
 
-        await self.__climate_service.set_manual_mode(
+        manual_setting = await self.__climate_service.set_manual_mode(
             manual_setting_id=command.device.manual_setting.id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
@@ -100,3 +106,5 @@ class SetDevicePresetHandler:
             temperature_target=temperature,
             duration_hours=command.duration_hours,
         )
+
+        return command.device.with_manual_setting(manual_setting)
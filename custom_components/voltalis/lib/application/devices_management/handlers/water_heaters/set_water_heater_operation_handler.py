@@ -3,12 +3,16 @@ from logging import Logger
 from custom_components.voltalis.lib.application.devices_management.commands.set_water_heater_operation_command import (
     SetWaterHeaterOperationCommand,
 )
+from custom_components.voltalis.lib.application.devices_management.dtos.device_dto import DeviceDto
 from custom_components.voltalis.lib.application.devices_management.helpers.get_appropriate_temperature import (
     get_appropriate_temperature,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.climate_management_service import (
     ClimateManagementService,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.devices_management.water_heaters.water_heater_current_operations_enum import (  # noqa: E501
     WaterHeaterCurrentOperationEnum,
@@ -27,28 +31,28 @@ class SetWaterHeaterOperationHandler:
         date_provider: DateProvider,
         voltalis_provider: VoltalisProvider,
         default_water_heater_temp: float,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__climate_service = ClimateManagementService(
             logger=logger,
             date_provider=date_provider,
             voltalis_provider=voltalis_provider,
+            manual_setting_write_coalescer=manual_setting_write_coalescer,
         )
         self.__default_water_heater_temp = default_water_heater_temp
 
-    async def handle(self, command: SetWaterHeaterOperationCommand) -> None:
+    async def handle(self, command: SetWaterHeaterOperationCommand) -> DeviceDto:
 
         if command.device.manual_setting is None:
             raise ValueError(f"Device {command.device.id} does not support manual settings")
 
         if command.operation_mode is WaterHeaterCurrentOperationEnum.ON:
-            await self.__turn_on(command, command.device.manual_setting.id)
-            return
+            return await self.__turn_on(command, command.device.manual_setting.id)
         if command.operation_mode is WaterHeaterCurrentOperationEnum.AUTO:
-            await self.__turn_auto_mode(command, command.device.manual_setting.id)
-            return
-        await self.__turn_off(command, command.device.manual_setting.id)
+            return await self.__turn_auto_mode(command, command.device.manual_setting.id)
+        return await self.__turn_off(command, command.device.manual_setting.id)
 
-    async def __turn_on(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> None:
+    async def __turn_on(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> DeviceDto:
         """Set OFF mode by turning off the water heater with a manual mode."""
 
         target_mode = DeviceModeEnum.ON
@@ -62,7 +66,7 @@ class SetWaterHeaterOperationHandler:
             default_comfort_temperature=self.__default_water_heater_temp,
         )
 
-        await self.__climate_service.set_manual_mode(
+        manual_setting = await self.__climate_service.set_manual_mode(
             manual_setting_id=manual_setting_id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
@@ -71,7 +75,9 @@ class SetWaterHeaterOperationHandler:
             duration_hours=None,
         )
 
-    async def __turn_off(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> None:
+        return command.device.with_manual_setting(manual_setting)
+
+    async def __turn_off(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> DeviceDto:
         """Set OFF mode by turning off the water heater with a manual mode."""
 
         target_mode = DeviceModeEnum.ON
@@ -85,7 +91,7 @@ class SetWaterHeaterOperationHandler:
             default_comfort_temperature=self.__default_water_heater_temp,
         )
 
-        await self.__climate_service.turn_off(
+        manual_setting = await self.__climate_service.turn_off(
             manual_setting_id=manual_setting_id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
@@ -94,7 +100,9 @@ class SetWaterHeaterOperationHandler:
             duration_hours=None,
         )
 
-    async def __turn_auto_mode(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> None:
+        return command.device.with_manual_setting(manual_setting)
+
+    async def __turn_auto_mode(self, command: SetWaterHeaterOperationCommand, manual_setting_id: int) -> DeviceDto:
         """Set AUTO mode to return to automatic planning."""
 
         target_mode = DeviceModeEnum.ON
@@ -110,10 +118,12 @@ class SetWaterHeaterOperationHandler:
             default_comfort_temperature=self.__default_water_heater_temp,
         )
 
-        await self.__climate_service.disable_manual_mode(
+        manual_setting = await self.__climate_service.disable_manual_mode(
             manual_setting_id=manual_setting_id,
             device_id=command.device.id,
             has_device_ecov=command.device.has_ecov,
             fallback_mode=target_mode,
             fallback_temperature=target_temp,
         )
+
+        return command.device.with_manual_setting(manual_setting)
@@ -0,0 +1,10 @@
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class BackfillDevicesConsumptionCommand(CustomModel):
+    """Command to import the consumption of the past days of all devices into the long-term statistics."""
+
+    # Number of past days to import
+    days: int
+    # Maximum number of days fetched at the same time
+    max_concurrency: int = 4
@@ -0,0 +1,13 @@
+from datetime import date
+
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class GetDevicesConsumptionRangeQuery(CustomModel):
+    """Query to get the consumption of all devices for each day of a range."""
+
+    # First and last days of the range, both included
+    start: date
+    end: date
+    # Maximum number of days fetched at the same time
+    max_concurrency: int = 4
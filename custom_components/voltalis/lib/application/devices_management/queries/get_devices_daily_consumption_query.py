@@ -0,0 +1,9 @@
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract import EnergyContract
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class GetDevicesDailyConsumptionQuery(CustomModel):
+    """Query to get the daily consumption of all devices."""
+
+    # Energy contract used to compute the daily cost of the devices, no cost without it
+    energy_contract: EnergyContract | None = None
@@ -26,10 +26,16 @@ from custom_components.voltalis.lib.application.devices_management.handlers.clim
 from custom_components.voltalis.lib.application.devices_management.handlers.climates.turn_off_device_handler import (
     TurnOffDeviceHandler,
 )
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.backfill_devices_consumption_handler import (  # noqa: E501
+    BackfillDevicesConsumptionHandler,
+)
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_device_mode_handler import (
     GetDeviceModeHandler,
 )
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices import GetDevicesHandler
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_consumption_range_handler import (  # noqa: E501
+    GetDevicesConsumptionRangeHandler,
+)
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_daily_consumption_handler import (  # noqa: E501
     GetDevicesDailyConsumptionHandler,
 )
@@ -52,8 +58,14 @@ from custom_components.voltalis.lib.application.devices_management.handlers.wate
     SetWaterHeaterOperationHandler,
 )
 from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import ManualSetting
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device import Device
 from custom_components.voltalis.lib.domain.devices_management.health.device_health import DeviceHealth
+from custom_components.voltalis.lib.infrastructure.providers.consumption_statistics_provider_stub import (
+    ConsumptionStatisticsProviderStub,
+)
 from custom_components.voltalis.lib.infrastructure.providers.date_provider_stub import DateProviderStub
 from custom_components.voltalis.lib.infrastructure.providers.voltalis_provider_stub import VoltalisProviderStub
 from custom_components.voltalis.tests.utils.base_fixture import BaseFixture
@@ -68,6 +80,7 @@ class DeviceManagementFixture(BaseFixture):
         # Providers
         self.date_provider = DateProviderStub()
         self.voltalis_provider = VoltalisProviderStub()
+        self.consumption_statistics_provider = ConsumptionStatisticsProviderStub()
 
         # Config
         self.default_temperature = DEFAULT_TEMP
@@ -88,6 +101,15 @@ class DeviceManagementFixture(BaseFixture):
             date_provider=self.date_provider,
             voltalis_provider=self.voltalis_provider,
         )
+        self.get_devices_consumption_range_handler = GetDevicesConsumptionRangeHandler(
+            voltalis_provider=self.voltalis_provider,
+        )
+        self.backfill_devices_consumption_handler = BackfillDevicesConsumptionHandler(
+            logger=self.logger,
+            date_provider=self.date_provider,
+            consumption_statistics_provider=self.consumption_statistics_provider,
+            get_devices_consumption_range_handler=self.get_devices_consumption_range_handler,
+        )
         self.get_device_mode_handler = GetDeviceModeHandler()
 
         # Device presets
@@ -182,11 +204,21 @@ class DeviceManagementFixture(BaseFixture):
 
         self.voltalis_provider.set_devices_consumptions(devices_consumptions)
 
+    def given_consumption_backfill_checkpoint(self, checkpoint: ConsumptionBackfillCheckpoint) -> None:
+        """Set the progress of the consumption backfill."""
+
+        self.consumption_statistics_provider.set_checkpoint(checkpoint)
+
     def given_manual_settings(self, manual_settings: list[ManualSetting]) -> None:
         """Set the devices manual settings to be returned by the provider."""
 
         self.voltalis_provider.set_manual_settings(manual_settings)
 
+    def given_manual_settings_error(self, error: Exception | None) -> None:
+        """Set the error raised by the provider when fetching the manual settings."""
+
+        self.voltalis_provider.set_manual_settings_error(error)
+
     # ------------------------------------------------------------
     # Assertions
     # ------------------------------------------------------------
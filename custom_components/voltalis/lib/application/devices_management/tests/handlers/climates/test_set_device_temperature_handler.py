@@ -14,6 +14,7 @@ from custom_components.voltalis.lib.domain.devices_management.climates.manual_se
 )
 from custom_components.voltalis.lib.domain.devices_management.devices.device_builder import DeviceBuilder
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
+from custom_components.voltalis.lib.domain.programs_management.programs.program_enum import ProgramTypeEnum
 
 
 @pytest.mark.unit
@@ -121,6 +122,34 @@ async def test_set_device_temperature_using_default_temperature_from_programming
     fixture.then_manual_settings_should_be({expected.id: expected})
 
 
+@pytest.mark.unit
+async def test_set_device_temperature_returns_expected_device(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test set device temperature returns the device as expected once the manual setting is applied."""
+
+    # Given
+    device = DeviceBuilder().with_id(1).with_programming_type(ProgramTypeEnum.DEFAULT).build()
+    manual_setting = ManualSettingBuilder().with_id(1).with_id_appliance(device.id).build()
+    fixture.given_manual_settings([manual_setting])
+
+    # When
+    result = await fixture.set_device_temperature_handler.handle(
+        SetDeviceTemperatureCommand(
+            device=DeviceDto.from_device(device, manual_setting),
+            temperature=22.5,
+            mode=DeviceModeEnum.TEMPERATURE,
+        )
+    )
+
+    # Then
+    fixture.compare_data(result.programming.prog_type, ProgramTypeEnum.MANUAL)
+    fixture.compare_data(result.programming.is_on, True)
+    fixture.compare_data(result.programming.mode, DeviceModeEnum.TEMPERATURE)
+    fixture.compare_data(result.programming.temperature_target, 22.5)
+    fixture.compare_data(result.manual_setting, fixture.voltalis_provider._manual_settings[manual_setting.id])
+
+
 @pytest.mark.unit
 async def test_set_device_temperature_requires_manual_setting(
     fixture: DeviceManagementFixture,
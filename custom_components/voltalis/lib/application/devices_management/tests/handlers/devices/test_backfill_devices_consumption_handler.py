@@ -0,0 +1,157 @@
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.voltalis.lib.application.devices_management.queries.backfill_devices_consumption_command import (  # noqa: E501
+    BackfillDevicesConsumptionCommand,
+)
+from custom_components.voltalis.lib.application.devices_management.tests.device_management_fixture import (
+    DeviceManagementFixture,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_statistic import (
+    ConsumptionStatistic,
+)
+
+
+@pytest.mark.unit
+async def test_backfill_devices_consumption_imports_hourly_sums(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test the backfill imports the hourly consumption of the complete past days, with the running sum."""
+
+    # Given
+    fixture.given_now(datetime(2024, 1, 5, 10, 0, 0))
+    fixture.given_devices_consumptions(
+        {
+            1: [
+                (datetime(2024, 1, 1, 8, 0, 0), 1.0),
+                (datetime(2024, 1, 1, 8, 30, 0), 2.0),
+                (datetime(2024, 1, 3, 9, 0, 0), 4.0),
+                # The last days are not complete yet
+                (datetime(2024, 1, 4, 9, 0, 0), 8.0),
+            ]
+        }
+    )
+
+    # When
+    result = await fixture.backfill_devices_consumption_handler.handle(BackfillDevicesConsumptionCommand(days=4))
+
+    # Then
+    assert result == 3
+    fixture.compare_dicts(
+        fixture.consumption_statistics_provider._statistics[1],
+        {
+            "2024-01-01T08:00:00": ConsumptionStatistic(start=datetime(2024, 1, 1, 8), consumption=3.0, sum=3.0),
+            "2024-01-03T09:00:00": ConsumptionStatistic(start=datetime(2024, 1, 3, 9), consumption=4.0, sum=7.0),
+        },
+    )
+    assert fixture.consumption_statistics_provider._checkpoint == ConsumptionBackfillCheckpoint(
+        first_day=date(2024, 1, 1), last_day=date(2024, 1, 3), sums={1: 7.0}
+    )
+
+
+@pytest.mark.unit
+async def test_backfill_devices_consumption_resumes_after_checkpoint(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test the backfill starts after the last imported day, from the saved sums."""
+
+    # Given
+    fixture.given_now(datetime(2024, 1, 5, 10, 0, 0))
+    fixture.given_consumption_backfill_checkpoint(
+        ConsumptionBackfillCheckpoint(first_day=date(2023, 12, 6), last_day=date(2024, 1, 2), sums={1: 10.0})
+    )
+    fixture.given_devices_consumptions(
+        {
+            1: [
+                (datetime(2024, 1, 2, 8, 0, 0), 1.0),
+                (datetime(2024, 1, 3, 8, 0, 0), 2.0),
+            ]
+        }
+    )
+
+    # When
+    result = await fixture.backfill_devices_consumption_handler.handle(BackfillDevicesConsumptionCommand(days=30))
+
+    # Then
+    assert result == 1
+    fixture.compare_dicts(
+        fixture.consumption_statistics_provider._statistics[1],
+        {"2024-01-03T08:00:00": ConsumptionStatistic(start=datetime(2024, 1, 3, 8), consumption=2.0, sum=12.0)},
+    )
+
+    # A new run has nothing to import
+    imports_count = fixture.consumption_statistics_provider._imports_count
+    result = await fixture.backfill_devices_consumption_handler.handle(BackfillDevicesConsumptionCommand(days=30))
+
+    assert result == 0
+    assert fixture.consumption_statistics_provider._imports_count == imports_count
+
+
+@pytest.mark.unit
+async def test_backfill_devices_consumption_imports_older_days_again(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test the backfill of a range starting before the first imported day imports it again with rebased sums."""
+
+    # Given
+    fixture.given_now(datetime(2024, 1, 5, 10, 0, 0))
+    fixture.given_consumption_backfill_checkpoint(
+        ConsumptionBackfillCheckpoint(first_day=date(2024, 1, 3), last_day=date(2024, 1, 3), sums={1: 2.0})
+    )
+    fixture.given_devices_consumptions(
+        {
+            1: [
+                (datetime(2024, 1, 1, 8, 0, 0), 1.0),
+                (datetime(2024, 1, 3, 8, 0, 0), 2.0),
+            ]
+        }
+    )
+
+    # When
+    result = await fixture.backfill_devices_consumption_handler.handle(BackfillDevicesConsumptionCommand(days=4))
+
+    # Then
+    assert result == 3
+    fixture.compare_dicts(
+        fixture.consumption_statistics_provider._statistics[1],
+        {
+            "2024-01-01T08:00:00": ConsumptionStatistic(start=datetime(2024, 1, 1, 8), consumption=1.0, sum=1.0),
+            "2024-01-03T08:00:00": ConsumptionStatistic(start=datetime(2024, 1, 3, 8), consumption=2.0, sum=3.0),
+        },
+    )
+    assert fixture.consumption_statistics_provider._checkpoint == ConsumptionBackfillCheckpoint(
+        first_day=date(2024, 1, 1), last_day=date(2024, 1, 3), sums={1: 3.0}
+    )
+
+
+@pytest.mark.unit
+async def test_backfill_devices_consumption_saves_progress_by_batch(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test the backfill imports the days by batches and saves the progress after each one."""
+
+    # Given
+    fixture.given_now(datetime(2024, 1, 31, 10, 0, 0))
+    fixture.given_devices_consumptions({1: [(datetime(2024, 1, day, 12, 0, 0), 1.0) for day in range(1, 30)]})
+
+    # When
+    result = await fixture.backfill_devices_consumption_handler.handle(
+        BackfillDevicesConsumptionCommand(days=30, max_concurrency=2)
+    )
+
+    # Then
+    assert result == 29
+    assert fixture.consumption_statistics_provider._imports_count == 5
+    assert len(fixture.consumption_statistics_provider._statistics[1]) == 29
+    assert fixture.consumption_statistics_provider._checkpoint == ConsumptionBackfillCheckpoint(
+        first_day=date(2024, 1, 1), last_day=date(2024, 1, 29), sums={1: 29.0}
+    )
+
+
+@pytest.fixture
+def fixture() -> DeviceManagementFixture:
+    return DeviceManagementFixture()
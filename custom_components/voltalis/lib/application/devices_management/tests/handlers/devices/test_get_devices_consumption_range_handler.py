@@ -0,0 +1,116 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_consumption_range_handler import (  # noqa: E501
+    GetDevicesConsumptionRangeHandler,
+)
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_consumption_range_query import (  # noqa: E501
+    GetDevicesConsumptionRangeQuery,
+)
+from custom_components.voltalis.lib.application.devices_management.tests.device_management_fixture import (
+    DeviceManagementFixture,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.infrastructure.providers.voltalis_provider_stub import VoltalisProviderStub
+
+
+class SlowVoltalisProviderStub(VoltalisProviderStub):
+    """Stub provider answering the daily consumption requests after a delay, counting the concurrent requests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_devices_daily_consumptions(self, target_date: date) -> dict[int, ConsumptionSeries]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().get_devices_daily_consumptions(target_date)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.unit
+async def test_get_devices_consumption_range_yields_each_day_in_order(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test the range handler yields the consumption of each day of the range in chronological order."""
+
+    # Given
+    fixture.given_devices_consumptions(
+        {
+            1: [
+                (datetime(2024, 1, 1, 8, 0, 0), 1.0),
+                (datetime(2024, 1, 2, 8, 0, 0), 2.0),
+                (datetime(2024, 1, 4, 8, 0, 0), 4.0),
+            ]
+        }
+    )
+
+    # When
+    result = [
+        day_consumptions
+        async for day_consumptions in fixture.get_devices_consumption_range_handler.handle(
+            GetDevicesConsumptionRangeQuery(start=date(2024, 1, 1), end=date(2024, 1, 3))
+        )
+    ]
+
+    # Then
+    assert result == [
+        (date(2024, 1, 1), {1: [(datetime(2024, 1, 1, 8, 0, 0), 1.0)]}),
+        (date(2024, 1, 2), {1: [(datetime(2024, 1, 2, 8, 0, 0), 2.0)]}),
+        (date(2024, 1, 3), {1: []}),
+    ]
+
+
+@pytest.mark.unit
+async def test_get_devices_consumption_range_limits_concurrency() -> None:
+    """Test the range handler fetches the days concurrently, at most max_concurrency at the same time."""
+
+    # Given
+    voltalis_provider = SlowVoltalisProviderStub()
+    handler = GetDevicesConsumptionRangeHandler(voltalis_provider=voltalis_provider)
+
+    # When
+    days = [
+        day
+        async for day, _ in handler.handle(
+            GetDevicesConsumptionRangeQuery(start=date(2024, 1, 1), end=date(2024, 1, 20), max_concurrency=3)
+        )
+    ]
+
+    # Then
+    assert len(days) == 20
+    assert voltalis_provider.max_in_flight == 3
+
+
+@pytest.mark.unit
+async def test_get_devices_consumption_range_cancels_pending_days_on_early_exit() -> None:
+    """Test the days still being fetched are cancelled when the consumer stops early."""
+
+    # Given
+    voltalis_provider = SlowVoltalisProviderStub()
+    handler = GetDevicesConsumptionRangeHandler(voltalis_provider=voltalis_provider)
+    days = handler.handle(
+        GetDevicesConsumptionRangeQuery(start=date(2024, 1, 1), end=date(2024, 1, 20), max_concurrency=3)
+    )
+
+    # When
+    first_day, _ = await anext(days)
+    await days.aclose()
+    await asyncio.sleep(0)
+
+    # Then
+    assert first_day == date(2024, 1, 1)
+    assert voltalis_provider.in_flight == 0
+
+
+@pytest.fixture
+def fixture() -> DeviceManagementFixture:
+    return DeviceManagementFixture()
@@ -2,12 +2,22 @@ from datetime import datetime
 
 import pytest
 
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_daily_consumption_query import (  # noqa: E501
+    GetDevicesDailyConsumptionQuery,
+)
 from custom_components.voltalis.lib.application.devices_management.tests.device_management_fixture import (
     DeviceManagementFixture,
 )
 from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption import (
     DeviceConsumption,
 )
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption_cost import (
+    DeviceConsumptionCost,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_builder import EnergyContractBuilder
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
 
 
 @pytest.mark.unit
@@ -37,6 +47,74 @@ async def test_get_devices_daily_consumption_uses_previous_hour(
     fixture.compare_dicts(result, expected)
 
 
+@pytest.mark.unit
+async def test_get_devices_daily_consumption_is_incremental(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test daily consumption handler only adds the new steps, and starts again on a new day."""
+
+    # Given
+    records = [
+        (datetime(2024, 1, 1, 8, 0, 0), 1.0),
+        (datetime(2024, 1, 1, 9, 0, 0), 2.0),
+        (datetime(2024, 1, 1, 10, 0, 0), 4.0),
+        (datetime(2024, 1, 1, 23, 0, 0), 8.0),
+    ]
+    fixture.given_devices_consumptions({1: records})
+
+    # When
+    fixture.given_now(datetime(2024, 1, 1, 10, 5, 0))
+    first_result = await fixture.get_devices_daily_consumption_handler.handle()
+    fixture.given_now(datetime(2024, 1, 1, 11, 5, 0))
+    second_result = await fixture.get_devices_daily_consumption_handler.handle()
+    fixture.given_devices_consumptions({1: [*records, (datetime(2024, 1, 2, 0, 0, 0), 16.0)]})
+    fixture.given_now(datetime(2024, 1, 2, 1, 5, 0))
+    next_day_result = await fixture.get_devices_daily_consumption_handler.handle()
+
+    # Then
+    fixture.compare_dicts(first_result, {1: DeviceConsumption(daily_consumption=3.0)})
+    fixture.compare_dicts(second_result, {1: DeviceConsumption(daily_consumption=7.0)})
+    fixture.compare_dicts(next_day_result, {1: DeviceConsumption(daily_consumption=16.0)})
+
+
+@pytest.mark.unit
+async def test_get_devices_daily_consumption_with_cost(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test daily consumption handler prices the consumption with the energy contract."""
+
+    # Given
+    now = datetime(2024, 1, 1, 10, 30, 0)
+    fixture.given_now(now)
+    fixture.given_devices_consumptions(
+        {
+            1: [
+                (datetime(2024, 1, 1, 8, 0, 0), 1000.0),
+                (datetime(2024, 1, 1, 9, 0, 0), 500.0),
+                (datetime(2024, 1, 1, 10, 0, 0), 3000.0),
+            ]
+        }
+    )
+    energy_contract = EnergyContractBuilder().build()
+
+    # When
+    result = await fixture.get_devices_daily_consumption_handler.handle(
+        GetDevicesDailyConsumptionQuery(energy_contract=energy_contract)
+    )
+
+    # Then
+    expected = {
+        1: DeviceConsumption(
+            daily_consumption=1500.0,
+            daily_cost=DeviceConsumptionCost(
+                consumptions={EnergyContractCurrentModeEnum.BASE: 1500.0},
+                cost=1.5 * 0.2,
+            ),
+        )
+    }
+    fixture.compare_dicts(result, expected)
+
+
 @pytest.fixture
 def fixture() -> DeviceManagementFixture:
     return DeviceManagementFixture()
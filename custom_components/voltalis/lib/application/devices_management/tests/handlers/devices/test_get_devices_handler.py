@@ -11,6 +11,7 @@ from custom_components.voltalis.lib.domain.devices_management.devices.device_bui
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import (
     DeviceTypeEnum,
 )
+from custom_components.voltalis.lib.domain.shared.exceptions import VoltalisConnectionException
 
 
 @pytest.mark.unit
@@ -38,6 +39,47 @@ async def test_get_devices_filters_supported_types_and_attaches_manual_settings(
     fixture.compare_dicts(result, expected)
 
 
+@pytest.mark.unit
+async def test_get_devices_keeps_last_known_manual_settings_on_failure(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test get devices handler falls back on the last known manual settings when they can't be fetched."""
+
+    # Given
+    heater = DeviceBuilder().with_id(1).build()
+    manual_setting = ManualSettingBuilder().with_id(10).with_id_appliance(heater.id).build()
+    fixture.given_devices([heater])
+    fixture.given_manual_settings([manual_setting])
+    await fixture.get_devices_handler.handle()
+    fixture.given_manual_settings_error(VoltalisConnectionException("Connection error"))
+
+    # When
+    result = await fixture.get_devices_handler.handle()
+
+    # Then
+    expected = {heater.id: DeviceDto.from_device(heater, manual_setting)}
+    fixture.compare_dicts(result, expected)
+
+
+@pytest.mark.unit
+async def test_get_devices_without_known_manual_settings_on_failure(
+    fixture: DeviceManagementFixture,
+) -> None:
+    """Test get devices handler still returns the devices when the manual settings were never fetched."""
+
+    # Given
+    heater = DeviceBuilder().with_id(1).build()
+    fixture.given_devices([heater])
+    fixture.given_manual_settings_error(VoltalisConnectionException("Connection error"))
+
+    # When
+    result = await fixture.get_devices_handler.handle()
+
+    # Then
+    expected = {heater.id: DeviceDto.from_device(heater, None)}
+    fixture.compare_dicts(result, expected)
+
+
 @pytest.fixture
 def fixture() -> DeviceManagementFixture:
     return DeviceManagementFixture()
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from custom_components.voltalis.lib.application.energy_contracts.queries.get_energy_contract_next_mode_change_query import (  # noqa: E501
+    GetEnergyContractNextModeChangeQuery,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_service import EnergyContractService
+from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
+
+
+class GetEnergyContractNextModeChangeHandler:
+    """Handler to get the next instant the current mode of the energy contract may change."""
+
+    def __init__(
+        self,
+        *,
+        date_provider: DateProvider,
+    ):
+        self.__energy_contract_service = EnergyContractService(date_provider=date_provider)
+
+    async def handle(self, query: GetEnergyContractNextModeChangeQuery) -> datetime | None:
+        """Handle the request to get the next instant the current mode of the energy contract may change."""
+
+        return self.__energy_contract_service.get_next_mode_change(
+            contract_type=query.type, offpeak_hours=query.offpeak_hours
+        )
@@ -0,0 +1,13 @@
+from datetime import time
+
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
+
+
+class GetEnergyContractNextModeChangeQuery(CustomModel):
+    """Query to get the next instant the current mode of an energy contract may change."""
+
+    type: EnergyContractTypeEnum
+    # The peak hours are the complement of the offpeak hours, so they don't add any transition
+    offpeak_hours: list[RangeModel[time]]
@@ -10,6 +10,9 @@ from custom_components.voltalis.lib.application.energy_contracts.handlers.get_en
 from custom_components.voltalis.lib.application.energy_contracts.handlers.get_energy_contract_current_mode_handler import (  # noqa: E501
     GetEnergyContractCurrentModeHandler,
 )
+from custom_components.voltalis.lib.application.energy_contracts.handlers.get_energy_contract_next_mode_change_handler import (  # noqa: E501
+    GetEnergyContractNextModeChangeHandler,
+)
 from custom_components.voltalis.lib.application.energy_contracts.handlers.get_live_consumption_handler import (
     GetLiveConsumptionHandler,
 )
@@ -36,6 +39,9 @@ class EnergyContractsFixture(BaseFixture):
         self.get_energy_contract_current_mode_handler = GetEnergyContractCurrentModeHandler(
             date_provider=self.date_provider,
         )
+        self.get_energy_contract_next_mode_change_handler = GetEnergyContractNextModeChangeHandler(
+            date_provider=self.date_provider,
+        )
         self.get_energy_contract_current_kwh_cost_handler = GetEnergyContractCurrentKwhCostHandler()
         self.get_live_consumption_handler = GetLiveConsumptionHandler(
             voltalis_provider=self.voltalis_provider,
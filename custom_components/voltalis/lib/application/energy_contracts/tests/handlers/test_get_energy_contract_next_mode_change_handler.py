@@ -0,0 +1,73 @@
+from datetime import datetime, time
+
+import pytest
+
+from custom_components.voltalis.lib.application.energy_contracts.queries.get_energy_contract_next_mode_change_query import (  # noqa: E501
+    GetEnergyContractNextModeChangeQuery,
+)
+from custom_components.voltalis.lib.application.energy_contracts.tests.energy_contracts_fixture import (
+    EnergyContractsFixture,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
+
+
+@pytest.mark.unit
+async def test_get_energy_contract_next_mode_change_base(
+    fixture: EnergyContractsFixture,
+) -> None:
+    """Test base contracts never change mode."""
+
+    fixture.given_now(datetime(2024, 1, 2, 9, 0, 0))
+
+    result = await fixture.get_energy_contract_next_mode_change_handler.handle(
+        GetEnergyContractNextModeChangeQuery(
+            type=EnergyContractTypeEnum.BASE,
+            offpeak_hours=[RangeModel[time](start=time(1, 0), end=time(6, 0))],
+        )
+    )
+
+    assert result is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "now,expected",
+    [
+        # Before the first offpeak range, the next change is its start
+        (datetime(2024, 1, 2, 0, 45), datetime(2024, 1, 2, 1, 0)),
+        # During an offpeak range, the next change is right after its end
+        (datetime(2024, 1, 2, 2, 0), datetime(2024, 1, 2, 6, 0, 1)),
+        (datetime(2024, 1, 2, 6, 0), datetime(2024, 1, 2, 6, 0, 1)),
+        # On a change, the next change is the following one
+        (datetime(2024, 1, 2, 6, 0, 1), datetime(2024, 1, 2, 12, 0)),
+        # Inside an overnight range, the next change is right after its end on the next day
+        (datetime(2024, 1, 2, 23, 0), datetime(2024, 1, 3, 0, 30, 1)),
+    ],
+)
+async def test_get_energy_contract_next_mode_change_peak_offpeak(
+    fixture: EnergyContractsFixture,
+    now: datetime,
+    expected: datetime,
+) -> None:
+    """Test peak/offpeak contracts change mode at the next boundary of the offpeak ranges."""
+
+    fixture.given_now(now)
+
+    result = await fixture.get_energy_contract_next_mode_change_handler.handle(
+        GetEnergyContractNextModeChangeQuery(
+            type=EnergyContractTypeEnum.PEAK_OFFPEAK,
+            offpeak_hours=[
+                RangeModel[time](start=time(1, 0), end=time(6, 0)),
+                RangeModel[time](start=time(12, 0), end=time(14, 0)),
+                RangeModel[time](start=time(22, 30), end=time(0, 30)),
+            ],
+        )
+    )
+
+    assert result == expected
+
+
+@pytest.fixture
+def fixture() -> EnergyContractsFixture:
+    return EnergyContractsFixture()
@@ -1,7 +1,13 @@
 from datetime import datetime, timedelta
 from logging import Logger
 
-from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import ManualSettingUpdate
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import (
+    ManualSetting,
+    ManualSettingUpdate,
+)
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
@@ -16,10 +22,12 @@ class ClimateManagementService:
         logger: Logger,
         date_provider: DateProvider,
         voltalis_provider: VoltalisProvider,
+        manual_setting_write_coalescer: ManualSettingWriteCoalescer | None = None,
     ):
         self.__logger = logger
         self.__date_provider = date_provider
         self.__voltalis_provider = voltalis_provider
+        self.__manual_setting_write_coalescer = manual_setting_write_coalescer
 
     async def set_manual_mode(
         self,
@@ -31,7 +39,7 @@ class ClimateManagementService:
         temperature_target: float,
         is_on: bool = True,
         duration_hours: int | None = None,
-    ) -> None:
+    ) -> ManualSetting:
         """Set manual mode for a device.
 
         Args:
@@ -41,6 +49,9 @@ class ClimateManagementService:
             temperature_target: The target temperature
             is_on: Whether the device should be turned on (default: True)
             duration_hours: Duration in hours (None = indefinite)
+
+        Returns:
+            The manual setting written
         """
 
         end_date, until_further_notice = self.__calculate_end_date(duration_hours)
@@ -56,7 +67,7 @@ class ClimateManagementService:
             temperature_target=temperature_target,
         )
 
-        await self.__voltalis_provider.set_manual_setting(manual_setting_id, setting)
+        manual_setting = await self.__write_manual_setting(manual_setting_id, setting)
 
         self.__logger.info(
             "Manual mode set for device %s: mode=%s, temperature=%.1f°C, duration=%s hours",
@@ -66,6 +77,8 @@ class ClimateManagementService:
             duration_hours or "indefinite",
         )
 
+        return manual_setting
+
     async def disable_manual_mode(
         self,
         *,
@@ -74,7 +87,7 @@ class ClimateManagementService:
         has_device_ecov: bool,
         fallback_mode: DeviceModeEnum = DeviceModeEnum.ECO,
         fallback_temperature: float = 16.0,
-    ) -> None:
+    ) -> ManualSetting:
         """Disable manual mode and return to automatic programming.
 
         Args:
@@ -82,6 +95,9 @@ class ClimateManagementService:
             device_id: The ID of the device (appliance)
             fallback_mode: The mode to use as fallback (default: ECO)
             fallback_temperature: The temperature to use as fallback (default: 16.0°C)
+
+        Returns:
+            The manual setting written
         """
 
         # End date is now, we want to avoid microsecond differences
@@ -98,13 +114,15 @@ class ClimateManagementService:
             temperature_target=fallback_temperature,
         )
 
-        await self.__voltalis_provider.set_manual_setting(manual_setting_id, setting)
+        manual_setting = await self.__write_manual_setting(manual_setting_id, setting)
 
         self.__logger.info(
             "Manual mode disabled for device %s, returning to automatic programming",
             device_id,
         )
 
+        return manual_setting
+
     async def turn_off(
         self,
         *,
@@ -114,7 +132,7 @@ class ClimateManagementService:
         fallback_mode: DeviceModeEnum = DeviceModeEnum.ECO,
         fallback_temperature: float = 16.0,
         duration_hours: int | None = None,
-    ) -> None:
+    ) -> ManualSetting:
         """Turn off the device.
 
         Args:
@@ -123,6 +141,9 @@ class ClimateManagementService:
             fallback_mode: The mode to use as fallback when turning off
             fallback_temperature: The temperature to use as fallback when turning off
             duration_hours: Duration in hours (None = indefinite)
+
+        Returns:
+            The manual setting written
         """
 
         end_date, until_further_notice = self.__calculate_end_date(duration_hours)
@@ -138,7 +159,23 @@ class ClimateManagementService:
             temperature_target=fallback_temperature,
         )
 
-        await self.__voltalis_provider.set_manual_setting(manual_setting_id, setting)
+        manual_setting = await self.__write_manual_setting(manual_setting_id, setting)
+
+        return manual_setting
+
+    async def __write_manual_setting(self, manual_setting_id: int, setting: ManualSettingUpdate) -> ManualSetting:
+        """Write the manual setting, through the coalescer if any so only the latest of close writes is sent.
+
+        Returns:
+            The manual setting as written, which is a later setting of the device when the write was coalesced
+        """
+
+        if self.__manual_setting_write_coalescer is None:
+            await self.__voltalis_provider.set_manual_setting(manual_setting_id, setting)
+        else:
+            setting = await self.__manual_setting_write_coalescer.set_manual_setting(manual_setting_id, setting)
+
+        return ManualSetting(id=manual_setting_id, **setting.model_dump(exclude={"has_ecov"}))
 
     def __calculate_end_date(self, duration_hours: int | None) -> tuple[datetime | None, bool]:
         """Calculate end date and until_further_notice flag based on duration.
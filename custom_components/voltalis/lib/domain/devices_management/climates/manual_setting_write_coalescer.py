@@ -0,0 +1,74 @@
+import asyncio
+from logging import Logger
+
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import ManualSettingUpdate
+from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
+
+
+class ManualSettingWriteCoalescer:
+    """Coalesce the writes of a manual setting received while one of them is being sent.
+
+    A write is sent right away when no write of the manual setting is in flight. Otherwise it is queued after the
+    write in flight, the writes received meanwhile replace it, so only the latest update is sent once the write
+    in flight is done and all the queued writers are released together.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: Logger,
+        voltalis_provider: VoltalisProvider,
+    ):
+        self.__logger = logger
+        self.__voltalis_provider = voltalis_provider
+
+        # Write being sent for each manual setting, and the write queued after it with its latest update
+        self.__writes_in_flight: dict[int, asyncio.Task[ManualSettingUpdate]] = {}
+        self.__queued_writes: dict[int, asyncio.Task[ManualSettingUpdate]] = {}
+        self.__queued_settings: dict[int, ManualSettingUpdate] = {}
+        self.__collapsed_writes = 0
+
+    @property
+    def collapsed_writes(self) -> int:
+        """Number of writes replaced by a later write of the same manual setting before being sent."""
+        return self.__collapsed_writes
+
+    async def set_manual_setting(self, manual_setting_id: int, setting: ManualSettingUpdate) -> ManualSettingUpdate:
+        """Write the manual setting, returns the update sent in its place once it has been sent."""
+
+        queued_write = self.__queued_writes.get(manual_setting_id)
+        write_in_flight = self.__writes_in_flight.get(manual_setting_id)
+        if queued_write is not None:
+            self.__queued_settings[manual_setting_id] = setting
+            self.__collapsed_writes += 1
+            self.__logger.debug("Manual setting %s write replaced by a newer one", manual_setting_id)
+            write = queued_write
+        elif write_in_flight is not None:
+            self.__queued_settings[manual_setting_id] = setting
+            write = asyncio.create_task(self.__send_after(manual_setting_id, write_in_flight))
+            self.__queued_writes[manual_setting_id] = write
+        else:
+            write = asyncio.create_task(self.__send(manual_setting_id, setting))
+            self.__writes_in_flight[manual_setting_id] = write
+
+        # Shielded so a cancelled writer doesn't cancel the write of the others
+        return await asyncio.shield(write)
+
+    async def __send_after(
+        self,
+        manual_setting_id: int,
+        write_in_flight: asyncio.Task[ManualSettingUpdate],
+    ) -> ManualSettingUpdate:
+        # Sent once the write in flight is done, whatever its result
+        await asyncio.wait([write_in_flight])
+
+        # The writes received from now on are queued after this one
+        self.__writes_in_flight[manual_setting_id] = self.__queued_writes.pop(manual_setting_id)
+        return await self.__send(manual_setting_id, self.__queued_settings.pop(manual_setting_id))
+
+    async def __send(self, manual_setting_id: int, setting: ManualSettingUpdate) -> ManualSettingUpdate:
+        try:
+            await self.__voltalis_provider.set_manual_setting(manual_setting_id, setting)
+        finally:
+            del self.__writes_in_flight[manual_setting_id]
+        return setting
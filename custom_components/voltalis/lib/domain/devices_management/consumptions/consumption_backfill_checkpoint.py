@@ -0,0 +1,14 @@
+from datetime import date
+
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class ConsumptionBackfillCheckpoint(CustomModel):
+    """Class to represent the progress of the devices consumption backfill into the long-term statistics"""
+
+    # First day whose consumption is imported, the sums start from it
+    first_day: date | None = None
+    # Last day whose consumption is imported, None before the first import
+    last_day: date | None = None
+    # Sum of the consumption of each device at the end of the last day in Wh
+    sums: dict[int, float] = {}
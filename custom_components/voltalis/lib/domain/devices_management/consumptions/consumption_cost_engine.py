@@ -0,0 +1,129 @@
+from array import array
+from datetime import date, timedelta
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.daily_consumption_series import (
+    DailyConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption_cost import (
+    DeviceConsumptionCost,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract import (
+    EnergyContract,
+    EnergyContractPrices,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_service import EnergyContractService
+
+
+class ConsumptionCostEngine:
+    """Split the consumption of the devices over a day by energy contract mode, and compute its cost.
+
+    The consumption steps are joined with the tariff timeline of the energy contract: the share of each mode
+    in a step is computed once for all the devices, and a step overlapping a transition is split pro rata.
+    The engine keeps the totals of the day and a copy of the steps they include: when these steps are unchanged
+    only the steps appended since are priced, a late or revised step prices the steps of the device again.
+    """
+
+    def __init__(
+        self,
+        *,
+        energy_contract_service: EnergyContractService,
+        step_duration: timedelta,
+    ):
+        self.__energy_contract_service = energy_contract_service
+        self.__step_duration = step_duration
+
+        # Day and energy contract the totals were computed for
+        self.__key: tuple | None = None
+        # Columns of the priced steps of each device, and their consumption by mode
+        self.__priced_steps: dict[int, tuple[array, array]] = {}
+        self.__consumptions: dict[int, dict[EnergyContractCurrentModeEnum, float]] = {}
+
+    def update(
+        self,
+        *,
+        day: date,
+        energy_contract: EnergyContract,
+        devices_series: dict[int, DailyConsumptionSeries],
+    ) -> dict[int, DeviceConsumptionCost]:
+        """Price the new and changed steps of the devices consumption series of the day, returns the devices costs."""
+
+        key = (
+            day,
+            energy_contract.type,
+            tuple((time_range.start, time_range.end) for time_range in energy_contract.offpeak_hours),
+        )
+        if key != self.__key:
+            # A new day or new offpeak hours, the totals are computed again
+            self.__key = key
+            self.__priced_steps.clear()
+            self.__consumptions.clear()
+
+        tariff_timeline = self.__energy_contract_service.get_tariff_timeline(
+            contract_type=energy_contract.type, offpeak_hours=energy_contract.offpeak_hours
+        )
+        # The devices share the same steps, the modes of a step are computed once
+        steps_shares: dict[int, list[tuple[EnergyContractCurrentModeEnum, float]]] = {}
+
+        for device_id, series in devices_series.items():
+            steps = series.get_steps_after(None)
+            priced_timestamps, priced_values = self.__priced_steps.get(device_id, (array("q"), array("d")))
+            priced_count = len(priced_timestamps)
+            consumptions = self.__consumptions.setdefault(device_id, {})
+
+            # The priced steps are compared in one pass over the columns
+            if steps.timestamps[:priced_count] != priced_timestamps or steps.values[:priced_count] != priced_values:
+                # A late or revised step, the steps of the device are priced again
+                priced_count = 0
+                priced_timestamps, priced_values = array("q"), array("d")
+                consumptions.clear()
+            new_steps = steps[priced_count:]
+
+            for index, (timestamp, consumption) in enumerate(zip(new_steps.timestamps, new_steps.values)):
+                # The consumption of a step is spread over its duration
+                shares = steps_shares.get(timestamp)
+                if shares is None:
+                    step = new_steps[index][0]
+                    durations = tariff_timeline.get_durations(step, step + self.__step_duration)
+                    shares = [(mode, duration / self.__step_duration) for mode, duration in durations.items()]
+                    steps_shares[timestamp] = shares
+
+                for mode, share in shares:
+                    consumptions[mode] = consumptions.get(mode, 0.0) + consumption * share
+
+            priced_timestamps.frombytes(new_steps.timestamps.cast("B"))
+            priced_values.frombytes(new_steps.values.cast("B"))
+            self.__priced_steps[device_id] = (priced_timestamps, priced_values)
+
+        return {
+            device_id: DeviceConsumptionCost(
+                consumptions=dict(self.__consumptions[device_id]),
+                cost=ConsumptionCostEngine.__get_cost(self.__consumptions[device_id], energy_contract.prices),
+            )
+            for device_id in devices_series
+        }
+
+    @staticmethod
+    def __get_cost(
+        consumptions: dict[EnergyContractCurrentModeEnum, float],
+        prices: EnergyContractPrices,
+    ) -> float | None:
+        """Get the cost in euros of the consumptions in Wh, None if a consumed mode has no price."""
+
+        kwh_prices = {
+            EnergyContractCurrentModeEnum.BASE: prices.kwh_base,
+            EnergyContractCurrentModeEnum.PEAK: prices.kwh_peak,
+            EnergyContractCurrentModeEnum.OFFPEAK: prices.kwh_offpeak,
+        }
+
+        cost = 0.0
+        for mode, consumption in consumptions.items():
+            kwh_price = kwh_prices[mode]
+            if kwh_price is None:
+                if consumption > 0:
+                    return None
+                continue
+            cost += consumption / 1000 * kwh_price
+        return cost
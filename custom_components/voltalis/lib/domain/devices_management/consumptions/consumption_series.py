@@ -0,0 +1,222 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Iterable, Iterator, overload
+
+# Origin of the timestamps of the steps without timezone, they are counted in wall clock seconds
+NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+class ConsumptionSeries:
+    """Consumption steps of a device, stored in two columns instead of one tuple and one datetime per step.
+
+    The start of each step is kept in seconds in an array('q') and its consumption in Wh in an array('d').
+    The steps without timezone are counted in wall clock seconds, the others in epoch seconds and are returned
+    in the timezone of the series. When the utc offset changes within the series (on a DST day), the offset of each
+    step is kept in an array('i') and the steps are returned in their own offset.
+    A series is never modified, so its slices are views sharing the same columns.
+    """
+
+    __slots__ = ("__timestamps", "__values", "__tz", "__offsets")
+
+    def __init__(
+        self,
+        timestamps: array | memoryview | None = None,
+        values: array | memoryview | None = None,
+        *,
+        tz: tzinfo | None = None,
+        offsets: array | memoryview | None = None,
+    ) -> None:
+        timestamps = memoryview(timestamps if timestamps is not None else array("q")).toreadonly()
+        values = memoryview(values if values is not None else array("d")).toreadonly()
+        if len(timestamps) != len(values):
+            raise ValueError("The timestamps and the values of a consumption series must have the same length")
+        if offsets is not None:
+            offsets = memoryview(offsets).toreadonly()
+            if len(offsets) != len(timestamps):
+                raise ValueError("The utc offsets of a consumption series must have one value per step")
+
+        self.__timestamps = timestamps
+        self.__values = values
+        self.__tz = tz
+        self.__offsets = offsets
+
+    @staticmethod
+    def from_records(records: Iterable[tuple[datetime, float]]) -> "ConsumptionSeries":
+        """Build a series from steps in chronological order, in the timezone of the first step."""
+
+        timestamps = array("q")
+        values = array("d")
+        offsets = array("i")
+        tz: tzinfo | None = None
+        for index, (step, consumption) in enumerate(records):
+            if index == 0:
+                tz = step.tzinfo
+            timestamps.append(ConsumptionSeries.to_timestamp(step))
+            values.append(consumption)
+            if tz is not None:
+                offsets.append(ConsumptionSeries.__get_utc_offset(step))
+        return ConsumptionSeries.from_columns(timestamps, values, tz=tz, offsets=offsets if tz is not None else None)
+
+    @staticmethod
+    def from_columns(
+        timestamps: array | memoryview,
+        values: array | memoryview,
+        *,
+        tz: tzinfo | None = None,
+        offsets: array | memoryview | None = None,
+    ) -> "ConsumptionSeries":
+        """Build a series from its columns, the utc offsets of the steps are only kept when they change."""
+
+        if offsets is not None and len(offsets) > 0:
+            tz = tz or timezone(timedelta(seconds=offsets[0]))
+        if offsets is not None and (len(offsets) == 0 or min(offsets) == max(offsets)):
+            offsets = None
+        return ConsumptionSeries(timestamps, values, tz=tz, offsets=offsets)
+
+    @staticmethod
+    def concat(head: "ConsumptionSeries", tail: "ConsumptionSeries") -> "ConsumptionSeries":
+        """Get a series with the steps of head followed by the steps of tail, in new columns."""
+
+        if not tail:
+            return head
+        if not head:
+            return tail
+
+        timestamps = array("q")
+        values = array("d")
+        for series in (head, tail):
+            timestamps.frombytes(series.timestamps.cast("B"))
+            values.frombytes(series.values.cast("B"))
+
+        offsets = None
+        if head.tz is not None and (head.offsets is not None or tail.offsets is not None or head.tz != tail.tz):
+            offsets = head.get_utc_offsets() or array("i")
+            offsets.extend(tail.get_utc_offsets() or array("i"))
+        return ConsumptionSeries.from_columns(timestamps, values, tz=head.tz, offsets=offsets)
+
+    @staticmethod
+    def to_timestamp(instant: datetime) -> int:
+        """Get the timestamp of an instant, in wall clock seconds when it has no timezone."""
+
+        if instant.tzinfo is None:
+            return (instant - NAIVE_EPOCH) // timedelta(seconds=1)
+        return int(instant.timestamp())
+
+    def from_timestamp(self, timestamp: int) -> datetime:
+        """Get the instant of a timestamp of the series."""
+
+        if self.__tz is None:
+            return NAIVE_EPOCH + timedelta(seconds=timestamp)
+        return datetime.fromtimestamp(timestamp, self.__tz)
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Start of each step, in seconds."""
+        return self.__timestamps
+
+    @property
+    def values(self) -> memoryview:
+        """Consumption of each step, in Wh."""
+        return self.__values
+
+    @property
+    def tz(self) -> tzinfo | None:
+        """Timezone of the steps, None for wall clock steps."""
+        return self.__tz
+
+    @property
+    def offsets(self) -> memoryview | None:
+        """Utc offset of each step in seconds, None when the steps are all in the timezone of the series."""
+        return self.__offsets
+
+    def get_utc_offsets(self) -> array | None:
+        """Get a copy of the utc offset of each step in seconds, None for wall clock steps."""
+
+        if self.__offsets is not None:
+            return array("i", self.__offsets)
+        if self.__tz is None:
+            return None
+        return array("i", (ConsumptionSeries.__get_utc_offset(step) for step, _ in self))
+
+    def total(self) -> float:
+        """Get the consumption of all the steps, in Wh."""
+        return sum(self.__values, 0.0)
+
+    def bisect_left(self, instant: datetime) -> int:
+        """Get the index of the first step starting at or after the given instant."""
+        return bisect_left(self.__timestamps, ConsumptionSeries.to_timestamp(instant))
+
+    def bisect_right(self, instant: datetime) -> int:
+        """Get the index of the first step starting after the given instant."""
+        return bisect_right(self.__timestamps, ConsumptionSeries.to_timestamp(instant))
+
+    def between(self, start: datetime, end: datetime) -> "ConsumptionSeries":
+        """Get a view of the steps starting from start and before end."""
+        return self[self.bisect_left(start) : self.bisect_left(end)]
+
+    def on_day(self, day: date) -> "ConsumptionSeries":
+        """Get a view of the steps starting on the given day, in the local time of each step."""
+
+        start = bisect_left(self, day, key=ConsumptionSeries.__get_day)
+        return self[start : bisect_right(self, day, lo=start, key=ConsumptionSeries.__get_day)]
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[datetime, float]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ConsumptionSeries": ...
+
+    def __getitem__(self, index: int | slice) -> "tuple[datetime, float] | ConsumptionSeries":
+        """Get a step with its consumption, or a view of a slice of the steps."""
+        if isinstance(index, slice):
+            offsets = self.__offsets[index] if self.__offsets is not None else None
+            return ConsumptionSeries(self.__timestamps[index], self.__values[index], tz=self.__tz, offsets=offsets)
+        if self.__offsets is not None:
+            return self.__from_offset(self.__timestamps[index], self.__offsets[index]), self.__values[index]
+        return self.from_timestamp(self.__timestamps[index]), self.__values[index]
+
+    def __len__(self) -> int:
+        """Get the number of steps."""
+        return len(self.__timestamps)
+
+    def __iter__(self) -> Iterator[tuple[datetime, float]]:
+        """Iterate over the steps with their consumption, in chronological order."""
+        if self.__offsets is not None:
+            for timestamp, value, offset in zip(self.__timestamps, self.__values, self.__offsets):
+                yield self.__from_offset(timestamp, offset), value
+            return
+        for timestamp, value in zip(self.__timestamps, self.__values):
+            yield self.from_timestamp(timestamp), value
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another series, or with a list of steps with their consumption."""
+        if isinstance(other, ConsumptionSeries):
+            return (
+                self.__timestamps == other.timestamps
+                and self.__values == other.values
+                and self.__tz == other.tz
+                and self.__offsets == other.offsets
+            )
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Get the representation of the steps with their consumption."""
+        return f"ConsumptionSeries({list(self)!r})"
+
+    @staticmethod
+    def __from_offset(timestamp: int, offset: int) -> datetime:
+        """Get the instant of a timestamp in the given utc offset."""
+        return datetime.fromtimestamp(timestamp, timezone(timedelta(seconds=offset)))
+
+    @staticmethod
+    def __get_utc_offset(step: datetime) -> int:
+        """Get the utc offset of a step in seconds."""
+        return (step.utcoffset() or timedelta()) // timedelta(seconds=1)
+
+    @staticmethod
+    def __get_day(step: tuple[datetime, float]) -> date:
+        """Get the local day of a step."""
+        return step[0].date()
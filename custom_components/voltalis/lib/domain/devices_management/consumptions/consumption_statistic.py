@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class ConsumptionStatistic(CustomModel):
+    """Class to represent the consumption of a Voltalis device over an hour, for the long-term statistics"""
+
+    # Start of the hour
+    start: datetime
+    # Consumption of the hour in Wh
+    consumption: float
+    # Consumption since the first imported hour in Wh
+    sum: float
@@ -0,0 +1,165 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, tzinfo
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+
+
+class DailyConsumptionSeries:
+    """Consumption steps of a device over a day, with the consumption accumulated up to each step.
+
+    The steps are kept sorted, new steps are appended after the last one and the late or revised steps are merged
+    by their start, so the consumption up to an instant is a binary search in the steps.
+    """
+
+    def __init__(self, *, day: date) -> None:
+        self.day = day
+
+        # Columns of the steps, the new steps are appended in place and the series are views of them
+        self.__timestamps = array("q")
+        self.__values = array("d")
+        self.__tz: tzinfo | None = None
+        # Utc offset of each step in seconds, only kept when it changes within the day
+        self.__offsets: array | None = None
+        # Consumption from the start of the day to the end of each step, in Wh
+        self.__cumulative_consumptions = array("d")
+
+    @property
+    def last_step(self) -> datetime | None:
+        """Start of the last stored step, None if the series is empty."""
+        return self.__get_series()[-1][0] if self.__timestamps else None
+
+    def append(self, records: ConsumptionSeries, *, until: datetime) -> int:
+        """Merge the steps starting before until, returns the number of steps added or changed.
+
+        The records are in chronological order. When the records up to the last stored step are unchanged, the new
+        ones are appended, otherwise the steps are merged by their start and accumulated again from the first change.
+        """
+
+        end = bisect_left(records.timestamps, ConsumptionSeries.to_timestamp(until))
+        start = min(bisect_right(records.timestamps, self.__timestamps[-1]), end) if self.__timestamps else 0
+        if (
+            records.offsets is not None
+            or self.__offsets is not None
+            or (self.__timestamps and records.tz != self.__tz)
+            or not self.__is_stored(records[:start])
+        ):
+            return self.__merge(records[:end])
+        if end == start:
+            return 0
+
+        total = self.__cumulative_consumptions[-1] if self.__cumulative_consumptions else 0.0
+        for consumption in records.values[start:end]:
+            total += consumption
+            self.__cumulative_consumptions.append(total)
+
+        self.__timestamps = DailyConsumptionSeries.__extend(self.__timestamps, records.timestamps[start:end])
+        self.__values = DailyConsumptionSeries.__extend(self.__values, records.values[start:end])
+        self.__tz = records.tz
+        return end - start
+
+    def get_consumption_before(self, instant: datetime) -> float:
+        """Get the consumption of the steps starting before the given instant, in Wh."""
+
+        index = self.__get_series().bisect_left(instant)
+        return self.__cumulative_consumptions[index - 1] if index > 0 else 0.0
+
+    def get_steps_after(self, instant: datetime | None) -> ConsumptionSeries:
+        """Get the steps starting after the given instant with their consumption, all the steps if None."""
+
+        series = self.__get_series()
+        index = 0 if instant is None else series.bisect_right(instant)
+        return series[index:]
+
+    def __len__(self) -> int:
+        """Get the number of stored steps."""
+        return len(self.__timestamps)
+
+    def __get_series(self) -> ConsumptionSeries:
+        """Get a read-only view of the stored steps."""
+        return ConsumptionSeries(self.__timestamps, self.__values, tz=self.__tz, offsets=self.__offsets)
+
+    def __is_stored(self, records: ConsumptionSeries) -> bool:
+        """Check if the records are the stored steps with the same start, in a single comparison of the columns."""
+
+        if not records:
+            return True
+        index = bisect_left(self.__timestamps, records.timestamps[0])
+        stored = self.__get_series()[index : index + len(records)]
+        return stored.timestamps == records.timestamps and stored.values == records.values
+
+    def __merge(self, records: ConsumptionSeries) -> int:
+        """Merge the records with the stored steps by their start, returns the number of steps added or changed."""
+
+        stored = self.__get_series()
+        stored_offsets = stored.get_utc_offsets()
+        records_offsets = records.get_utc_offsets()
+
+        timestamps = array("q")
+        values = array("d")
+        offsets = array("i")
+        first_changed_index: int | None = None
+        changed_count = 0
+        stored_index = 0
+        for index, (timestamp, consumption) in enumerate(zip(records.timestamps, records.values)):
+            # The stored steps starting before the record are kept
+            while stored_index < len(stored) and stored.timestamps[stored_index] < timestamp:
+                timestamps.append(stored.timestamps[stored_index])
+                values.append(stored.values[stored_index])
+                if stored_offsets is not None:
+                    offsets.append(stored_offsets[stored_index])
+                stored_index += 1
+
+            # The record replaces the stored step with the same start
+            is_changed = True
+            if stored_index < len(stored) and stored.timestamps[stored_index] == timestamp:
+                is_changed = stored.values[stored_index] != consumption or (
+                    stored_offsets is not None
+                    and records_offsets is not None
+                    and stored_offsets[stored_index] != records_offsets[index]
+                )
+                stored_index += 1
+            if is_changed:
+                changed_count += 1
+                first_changed_index = len(timestamps) if first_changed_index is None else first_changed_index
+
+            timestamps.append(timestamp)
+            values.append(consumption)
+            if records_offsets is not None:
+                offsets.append(records_offsets[index])
+
+        if first_changed_index is None:
+            return 0
+
+        timestamps.frombytes(stored.timestamps[stored_index:].cast("B"))
+        values.frombytes(stored.values[stored_index:].cast("B"))
+        if stored_offsets is not None:
+            offsets.extend(stored_offsets[stored_index:])
+
+        # The consumption is accumulated again from the first step added or changed
+        cumulative_consumptions = self.__cumulative_consumptions[:first_changed_index]
+        total = cumulative_consumptions[-1] if cumulative_consumptions else 0.0
+        for value in values[first_changed_index:]:
+            total += value
+            cumulative_consumptions.append(total)
+
+        self.__timestamps = timestamps
+        self.__values = values
+        self.__tz = records.tz if records else self.__tz
+        self.__offsets = offsets if offsets and min(offsets) != max(offsets) else None
+        self.__cumulative_consumptions = cumulative_consumptions
+        return changed_count
+
+    @staticmethod
+    def __extend(column: array, new_column: memoryview) -> array:
+        """Append the new steps to a column, returns the column holding all the steps."""
+
+        try:
+            column.frombytes(new_column.cast("B"))
+        except BufferError:
+            # A view of the steps is still used, it keeps the current column and the steps are appended to a copy
+            column = array(column.typecode, column)
+            column.frombytes(new_column.cast("B"))
+        return column
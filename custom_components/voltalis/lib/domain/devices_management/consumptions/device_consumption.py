@@ -1,3 +1,6 @@
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption_cost import (
+    DeviceConsumptionCost,
+)
 from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
 
 
@@ -5,3 +8,4 @@ class DeviceConsumption(CustomModel):
     """Class to represent Voltalis devices consumption"""
 
     daily_consumption: float
+    daily_cost: DeviceConsumptionCost | None = None
@@ -1,6 +1,9 @@
 from typing import Self
 
 from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption import DeviceConsumption
+from custom_components.voltalis.lib.domain.devices_management.consumptions.device_consumption_cost import (
+    DeviceConsumptionCost,
+)
 from custom_components.voltalis.lib.domain.shared.generic_builder import GenericBuilder
 
 
@@ -9,6 +12,7 @@ class DeviceConsumptionBuilder(GenericBuilder[DeviceConsumption]):
 
     DEFAULT_VALUES = DeviceConsumption(
         daily_consumption=0.0,
+        daily_cost=None,
     )
 
     def build(self) -> DeviceConsumption:
@@ -17,3 +21,7 @@ class DeviceConsumptionBuilder(GenericBuilder[DeviceConsumption]):
     def with_daily_consumption(self, daily_consumption: float) -> Self:
         """Set the daily consumption of the device."""
         return self._set_value("daily_consumption", daily_consumption)
+
+    def with_daily_cost(self, daily_cost: DeviceConsumptionCost | None) -> Self:
+        """Set the daily cost of the device."""
+        return self._set_value("daily_cost", daily_cost)
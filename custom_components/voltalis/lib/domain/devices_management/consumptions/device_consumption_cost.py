@@ -0,0 +1,13 @@
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class DeviceConsumptionCost(CustomModel):
+    """Class to represent the consumption of a Voltalis device split by energy contract mode, and its cost"""
+
+    # Consumption in Wh for each mode of the energy contract
+    consumptions: dict[EnergyContractCurrentModeEnum, float]
+    # Cost in euros, None if a mode with a consumption has no price
+    cost: float | None = None
@@ -0,0 +1,129 @@
+"""Unit tests for ManualSettingWriteCoalescer."""
+
+import asyncio
+import logging
+
+import pytest
+
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import (
+    ManualSetting,
+    ManualSettingUpdate,
+)
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_builder import (
+    ManualSettingBuilder,
+)
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
+from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
+from custom_components.voltalis.lib.infrastructure.providers.voltalis_provider_stub import VoltalisProviderStub
+from custom_components.voltalis.tests.utils.base_fixture import BaseFixture
+
+
+@pytest.mark.unit
+async def test_coalescer_sends_the_first_write_then_the_latest_one(
+    fixture: "ManualSettingWriteCoalescerFixture",
+) -> None:
+    """Test that the first write is sent right away, and the writes received meanwhile are sent once with the latest."""
+
+    # Given
+    fixture.given_manual_settings([ManualSettingBuilder().with_id(1).with_id_appliance(1).build()])
+
+    # When
+    results = await asyncio.gather(
+        *(fixture.coalescer.set_manual_setting(1, fixture.build_update(1, temp)) for temp in [20.0, 20.5, 21.0])
+    )
+
+    # Then
+    assert [result.temperature_target for result in results] == [20.0, 21.0, 21.0]
+    fixture.then_writes_should_be([(1, fixture.build_update(1, 20.0)), (1, fixture.build_update(1, 21.0))])
+    assert fixture.coalescer.collapsed_writes == 1
+
+
+@pytest.mark.unit
+async def test_coalescer_keeps_writes_of_different_manual_settings(
+    fixture: "ManualSettingWriteCoalescerFixture",
+) -> None:
+    """Test that the writes of different manual settings are not coalesced."""
+
+    # Given
+    fixture.given_manual_settings(
+        [
+            ManualSettingBuilder().with_id(1).with_id_appliance(1).build(),
+            ManualSettingBuilder().with_id(2).with_id_appliance(2).build(),
+        ]
+    )
+
+    # When
+    await asyncio.gather(
+        fixture.coalescer.set_manual_setting(1, fixture.build_update(1, 20.0)),
+        fixture.coalescer.set_manual_setting(2, fixture.build_update(2, 18.0)),
+    )
+
+    # Then
+    fixture.then_writes_should_be([(1, fixture.build_update(1, 20.0)), (2, fixture.build_update(2, 18.0))])
+    assert fixture.coalescer.collapsed_writes == 0
+
+
+@pytest.mark.unit
+async def test_coalescer_sends_successive_writes(fixture: "ManualSettingWriteCoalescerFixture") -> None:
+    """Test that a write received once the previous one was sent is sent on its own."""
+
+    # Given
+    fixture.given_manual_settings([ManualSettingBuilder().with_id(1).with_id_appliance(1).build()])
+
+    # When
+    await fixture.coalescer.set_manual_setting(1, fixture.build_update(1, 20.0))
+    await fixture.coalescer.set_manual_setting(1, fixture.build_update(1, 22.0))
+
+    # Then
+    fixture.then_writes_should_be([(1, fixture.build_update(1, 20.0)), (1, fixture.build_update(1, 22.0))])
+    assert fixture.coalescer.collapsed_writes == 0
+
+
+class ManualSettingWriteCoalescerFixture(BaseFixture):
+    """Fixture for the manual setting write coalescer tests."""
+
+    def __init__(self) -> None:
+        self.voltalis_provider = VoltalisProviderStub()
+        self.coalescer = ManualSettingWriteCoalescer(
+            logger=logging.getLogger("voltalis-home_assistant-tests manual-setting-write-coalescer-fixture"),
+            voltalis_provider=self.voltalis_provider,
+        )
+
+    def build_update(self, id_appliance: int, temperature_target: float) -> ManualSettingUpdate:
+        """Build an update of the target temperature of a device."""
+
+        return ManualSettingUpdate(
+            enabled=True,
+            id_appliance=id_appliance,
+            until_further_notice=True,
+            is_on=True,
+            has_ecov=False,
+            mode=DeviceModeEnum.TEMPERATURE,
+            temperature_target=temperature_target,
+        )
+
+    # ------------------------------------------------------------
+    # Given
+    # ------------------------------------------------------------
+
+    def given_manual_settings(self, manual_settings: list[ManualSetting]) -> None:
+        """Set the manual settings of the provider."""
+
+        self.voltalis_provider.set_manual_settings(manual_settings)
+
+    # ------------------------------------------------------------
+    # Assertions
+    # ------------------------------------------------------------
+
+    def then_writes_should_be(self, expected_writes: list[tuple[int, ManualSettingUpdate]]) -> None:
+        """Assert the manual settings updates sent to the provider, sorted by manual setting."""
+
+        writes = sorted(self.voltalis_provider.get_manual_setting_writes(), key=lambda write: write[0])
+        assert writes == expected_writes
+
+
+@pytest.fixture
+def fixture() -> ManualSettingWriteCoalescerFixture:
+    return ManualSettingWriteCoalescerFixture()
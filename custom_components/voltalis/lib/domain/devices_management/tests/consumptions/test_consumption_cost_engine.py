@@ -0,0 +1,176 @@
+"""Unit tests for ConsumptionCostEngine."""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_cost_engine import (
+    ConsumptionCostEngine,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.daily_consumption_series import (
+    DailyConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract import EnergyContractPrices
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_builder import EnergyContractBuilder
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_service import EnergyContractService
+from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
+from custom_components.voltalis.lib.infrastructure.providers.date_provider_stub import DateProviderStub
+
+DAY = date(2024, 1, 1)
+HOUR = timedelta(hours=1)
+
+PEAK_OFFPEAK_CONTRACT = (
+    EnergyContractBuilder()
+    .with_type(EnergyContractTypeEnum.PEAK_OFFPEAK)
+    .with_offpeak_hours([RangeModel[time](start=time(22, 30), end=time(5, 59, 59))])
+    .with_prices(EnergyContractPrices(subscription=10.0, kwh_peak=0.3, kwh_offpeak=0.1))
+    .build()
+)
+
+
+def build_series(day: date, records: list[tuple[datetime, float]]) -> DailyConsumptionSeries:
+    """Build the consumption series of a day with the given steps."""
+
+    series = DailyConsumptionSeries(day=day)
+    until = datetime.combine(day, time()) + timedelta(days=1)
+    series.append(ConsumptionSeries.from_records(records), until=until)
+    return series
+
+
+@pytest.mark.unit
+def test_consumption_cost_engine_splits_steps_by_mode() -> None:
+    """Test that the steps are split by mode, pro rata when they overlap a transition."""
+
+    engine = ConsumptionCostEngine(
+        energy_contract_service=EnergyContractService(date_provider=DateProviderStub()), step_duration=HOUR
+    )
+
+    result = engine.update(
+        day=DAY,
+        energy_contract=PEAK_OFFPEAK_CONTRACT,
+        devices_series={
+            1: build_series(DAY, [(datetime(2024, 1, 1, 21, 0), 1000.0), (datetime(2024, 1, 1, 22, 0), 1000.0)]),
+            2: build_series(DAY, [(datetime(2024, 1, 1, 5, 0), 200.0)]),
+        },
+    )
+
+    assert result[1].consumptions == {
+        EnergyContractCurrentModeEnum.PEAK: pytest.approx(1500.0),
+        EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(500.0),
+    }
+    assert result[1].cost == pytest.approx(1.5 * 0.3 + 0.5 * 0.1)
+    assert result[2].consumptions == {EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(200.0)}
+    assert result[2].cost == pytest.approx(0.2 * 0.1)
+
+
+@pytest.mark.unit
+def test_consumption_cost_engine_only_adds_new_steps() -> None:
+    """Test that the steps already processed are not counted again, and a new day starts from zero."""
+
+    engine = ConsumptionCostEngine(
+        energy_contract_service=EnergyContractService(date_provider=DateProviderStub()), step_duration=HOUR
+    )
+    series = build_series(DAY, [(datetime(2024, 1, 1, 21, 0), 1000.0), (datetime(2024, 1, 1, 22, 0), 1000.0)])
+
+    engine.update(day=DAY, energy_contract=PEAK_OFFPEAK_CONTRACT, devices_series={1: series})
+    new_records = ConsumptionSeries.from_records([(datetime(2024, 1, 1, 23, 0), 1000.0)])
+    series.append(new_records, until=datetime(2024, 1, 2))
+    result = engine.update(day=DAY, energy_contract=PEAK_OFFPEAK_CONTRACT, devices_series={1: series})
+
+    assert result[1].consumptions == {
+        EnergyContractCurrentModeEnum.PEAK: pytest.approx(1500.0),
+        EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(1500.0),
+    }
+
+    # The next day starts from zero
+    result = engine.update(
+        day=date(2024, 1, 2),
+        energy_contract=PEAK_OFFPEAK_CONTRACT,
+        devices_series={1: build_series(date(2024, 1, 2), [(datetime(2024, 1, 2, 0, 0), 400.0)])},
+    )
+
+    assert result[1].consumptions == {EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(400.0)}
+
+
+@pytest.mark.unit
+def test_consumption_cost_engine_prices_late_and_updated_steps() -> None:
+    """Test that a step arriving before the last priced one is added, and an updated step replaces its consumption."""
+
+    engine = ConsumptionCostEngine(
+        energy_contract_service=EnergyContractService(date_provider=DateProviderStub()), step_duration=HOUR
+    )
+    series = build_series(DAY, [(datetime(2024, 1, 1, 23, 0), 1000.0)])
+    engine.update(day=DAY, energy_contract=PEAK_OFFPEAK_CONTRACT, devices_series={1: series})
+
+    new_records = ConsumptionSeries.from_records(
+        [(datetime(2024, 1, 1, 21, 0), 1000.0), (datetime(2024, 1, 1, 23, 0), 400.0)]
+    )
+    series.append(new_records, until=datetime(2024, 1, 2))
+    result = engine.update(day=DAY, energy_contract=PEAK_OFFPEAK_CONTRACT, devices_series={1: series})
+
+    assert result[1].consumptions == {
+        EnergyContractCurrentModeEnum.PEAK: pytest.approx(1000.0),
+        EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(400.0),
+    }
+
+
+@pytest.mark.unit
+def test_consumption_cost_engine_prices_steps_over_their_duration() -> None:
+    """Test that the steps are split over the given step duration, not over their whole hour."""
+
+    engine = ConsumptionCostEngine(
+        energy_contract_service=EnergyContractService(date_provider=DateProviderStub()),
+        step_duration=timedelta(minutes=20),
+    )
+
+    result = engine.update(
+        day=DAY,
+        energy_contract=PEAK_OFFPEAK_CONTRACT,
+        devices_series={
+            1: build_series(
+                DAY,
+                [
+                    (datetime(2024, 1, 1, 22, 0), 100.0),
+                    (datetime(2024, 1, 1, 22, 20), 100.0),
+                    (datetime(2024, 1, 1, 22, 40), 100.0),
+                ],
+            )
+        },
+    )
+
+    # The 22:20 step is split over 22:20-22:40 at the 22:30 transition
+    assert result[1].consumptions == {
+        EnergyContractCurrentModeEnum.PEAK: pytest.approx(150.0),
+        EnergyContractCurrentModeEnum.OFFPEAK: pytest.approx(150.0),
+    }
+
+
+@pytest.mark.unit
+def test_consumption_cost_engine_without_price() -> None:
+    """Test that the cost is None when a consumed mode has no price."""
+
+    engine = ConsumptionCostEngine(
+        energy_contract_service=EnergyContractService(date_provider=DateProviderStub()), step_duration=HOUR
+    )
+    energy_contract = (
+        EnergyContractBuilder()
+        .with_type(EnergyContractTypeEnum.BASE)
+        .with_prices(EnergyContractPrices(subscription=10.0))
+        .build()
+    )
+
+    result = engine.update(
+        day=DAY,
+        energy_contract=energy_contract,
+        devices_series={1: build_series(DAY, [(datetime(2024, 1, 1, 10, 0), 1000.0)])},
+    )
+
+    assert result[1].consumptions == {EnergyContractCurrentModeEnum.BASE: pytest.approx(1000.0)}
+    assert result[1].cost is None
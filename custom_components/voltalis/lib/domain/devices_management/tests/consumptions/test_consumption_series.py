@@ -0,0 +1,104 @@
+"""Unit tests for ConsumptionSeries."""
+
+from array import array
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+
+RECORDS = [
+    (datetime(2024, 1, 1, 0, 0), 5.0),
+    (datetime(2024, 1, 1, 1, 0), 10.0),
+    (datetime(2024, 1, 1, 2, 0), 20.0),
+    (datetime(2024, 1, 1, 3, 0), 40.0),
+]
+
+SUMMER_TIME = timezone(timedelta(hours=2))
+WINTER_TIME = timezone(timedelta(hours=1))
+
+# Steps around the end of the summer time, the 2:00 local hour is repeated
+DST_RECORDS = [
+    (datetime(2024, 10, 26, 23, 0, tzinfo=SUMMER_TIME), 1.0),
+    (datetime(2024, 10, 27, 2, 0, tzinfo=SUMMER_TIME), 2.0),
+    (datetime(2024, 10, 27, 2, 0, tzinfo=WINTER_TIME), 3.0),
+    (datetime(2024, 10, 27, 23, 0, tzinfo=WINTER_TIME), 4.0),
+    (datetime(2024, 10, 28, 0, 0, tzinfo=WINTER_TIME), 5.0),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tz", [None, timezone(timedelta(hours=1))])
+def test_consumption_series_from_records(tz: timezone | None) -> None:
+    """Test the steps are read back from the columns, with the timezone of the records."""
+
+    records = [(step.replace(tzinfo=tz), consumption) for step, consumption in RECORDS]
+
+    series = ConsumptionSeries.from_records(records)
+
+    assert len(series) == 4
+    assert series.tz == tz
+    assert list(series) == records
+    assert series[-1] == records[-1]
+    assert series.total() == 75.0
+
+
+@pytest.mark.unit
+def test_consumption_series_slices_are_views() -> None:
+    """Test the slices and the steps between two instants share the columns of the series."""
+
+    series = ConsumptionSeries.from_records(RECORDS)
+
+    between = series.between(datetime(2024, 1, 1, 0, 30), datetime(2024, 1, 1, 3, 0))
+
+    assert between == RECORDS[1:3]
+    assert series[2:] == RECORDS[2:]
+    assert between.timestamps.obj is series.timestamps.obj
+    assert series.bisect_left(datetime(2024, 1, 1, 1, 0)) == 1
+    assert series.bisect_right(datetime(2024, 1, 1, 1, 0)) == 2
+
+
+@pytest.mark.unit
+def test_consumption_series_is_read_only() -> None:
+    """Test the columns of a series can not be modified and must have the same length."""
+
+    series = ConsumptionSeries.from_records(RECORDS)
+
+    with pytest.raises(TypeError):
+        series.values[0] = 1.0  # type: ignore[call-overload]
+    with pytest.raises(ValueError):
+        ConsumptionSeries(array("q", [0, 1]), array("d", [1.0]))
+
+
+@pytest.mark.unit
+def test_consumption_series_keeps_the_offset_of_each_step() -> None:
+    """Test the steps of a DST day keep their own utc offset, and a day is cut on the local date of each step."""
+
+    series = ConsumptionSeries.from_records(DST_RECORDS)
+    day = series.on_day(date(2024, 10, 27))
+
+    assert series.offsets is not None
+    assert [step.utcoffset() for step, _ in series] == [step.utcoffset() for step, _ in DST_RECORDS]
+    assert day == DST_RECORDS[1:4]
+    assert day.total() == 9.0
+    assert ConsumptionSeries.from_records(RECORDS).on_day(date(2024, 1, 1)) == RECORDS
+
+
+@pytest.mark.unit
+def test_consumption_series_concat() -> None:
+    """Test the steps of two series are joined, with the utc offset of each step when it changes between them."""
+
+    head = ConsumptionSeries.from_records(DST_RECORDS[:2])
+    tail = ConsumptionSeries.from_records(DST_RECORDS[2:])
+
+    assert head.offsets is None and tail.offsets is None
+    assert ConsumptionSeries.concat(head, tail) == ConsumptionSeries.from_records(DST_RECORDS)
+    assert ConsumptionSeries.concat(head, ConsumptionSeries()) is head
+    assert (
+        ConsumptionSeries.concat(
+            ConsumptionSeries.from_records(RECORDS[:1]), ConsumptionSeries.from_records(RECORDS[1:])
+        )
+        == RECORDS
+    )
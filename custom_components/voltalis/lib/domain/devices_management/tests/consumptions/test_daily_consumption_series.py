@@ -0,0 +1,119 @@
+"""Unit tests for DailyConsumptionSeries."""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.daily_consumption_series import (
+    DailyConsumptionSeries,
+)
+
+RECORDS = ConsumptionSeries.from_records(
+    [
+        (datetime(2024, 1, 1, 0, 0), 5.0),
+        (datetime(2024, 1, 1, 1, 0), 10.0),
+        (datetime(2024, 1, 1, 2, 0), 20.0),
+        (datetime(2024, 1, 1, 3, 0), 40.0),
+    ]
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "instant,expected",
+    [
+        (datetime(2024, 1, 1, 0, 0), 0.0),
+        (datetime(2024, 1, 1, 0, 30), 5.0),
+        (datetime(2024, 1, 1, 1, 0), 5.0),
+        (datetime(2024, 1, 1, 2, 0), 15.0),
+        (datetime(2024, 1, 1, 23, 0), 35.0),
+    ],
+)
+def test_daily_consumption_series_consumption_before(instant: datetime, expected: float) -> None:
+    """Test the consumption of the steps starting before an instant, the steps after until are not stored."""
+
+    series = DailyConsumptionSeries(day=date(2024, 1, 1))
+    series.append(RECORDS, until=datetime(2024, 1, 1, 3, 0))
+
+    assert len(series) == 3
+    assert series.get_consumption_before(instant) == expected
+
+
+@pytest.mark.unit
+def test_daily_consumption_series_appends_new_steps() -> None:
+    """Test that the steps after the last stored one are appended, the unchanged stored steps are skipped."""
+
+    series = DailyConsumptionSeries(day=date(2024, 1, 1))
+    assert series.append(RECORDS, until=datetime(2024, 1, 1, 2, 0)) == 2
+    assert series.append(RECORDS, until=datetime(2024, 1, 1, 4, 0)) == 2
+    assert series.append(RECORDS, until=datetime(2024, 1, 1, 4, 0)) == 0
+
+    assert series.last_step == datetime(2024, 1, 1, 3, 0)
+    assert series.get_consumption_before(datetime(2024, 1, 2)) == 75.0
+    assert series.get_steps_after(datetime(2024, 1, 1, 1, 0)) == [
+        (datetime(2024, 1, 1, 2, 0), 20.0),
+        (datetime(2024, 1, 1, 3, 0), 40.0),
+    ]
+    assert series.get_steps_after(None)[0] == (datetime(2024, 1, 1, 0, 0), 5.0)
+
+
+@pytest.mark.unit
+def test_daily_consumption_series_steps_views_are_not_modified() -> None:
+    """Test that the steps got before an append keep their steps, while the series has the new ones."""
+
+    series = DailyConsumptionSeries(day=date(2024, 1, 1))
+    series.append(RECORDS, until=datetime(2024, 1, 1, 2, 0))
+    steps = series.get_steps_after(None)
+
+    assert series.append(RECORDS, until=datetime(2024, 1, 1, 4, 0)) == 2
+
+    assert steps == list(RECORDS)[:2]
+    assert series.get_steps_after(None) == list(RECORDS)
+
+
+@pytest.mark.unit
+def test_daily_consumption_series_merges_late_and_revised_steps() -> None:
+    """Test that the late steps are inserted and the revised steps replace the stored ones, as a full recompute."""
+
+    series = DailyConsumptionSeries(day=date(2024, 1, 1))
+    series.append(
+        ConsumptionSeries.from_records([(datetime(2024, 1, 1, 0, 0), 10.0), (datetime(2024, 1, 1, 0, 20), 10.0)]),
+        until=datetime(2024, 1, 2),
+    )
+    records = ConsumptionSeries.from_records(
+        [
+            (datetime(2024, 1, 1, 0, 0), 15.0),
+            (datetime(2024, 1, 1, 0, 10), 10.0),
+            (datetime(2024, 1, 1, 0, 20), 10.0),
+            (datetime(2024, 1, 1, 1, 0), 5.0),
+        ]
+    )
+
+    assert series.append(records, until=datetime(2024, 1, 2)) == 3
+
+    assert series.get_steps_after(None) == list(records)
+    assert series.get_consumption_before(datetime(2024, 1, 1, 0, 20)) == 25.0
+    assert series.get_consumption_before(datetime(2024, 1, 2)) == 40.0
+
+
+@pytest.mark.unit
+def test_daily_consumption_series_keeps_the_offset_of_each_step() -> None:
+    """Test that the steps of the day the summer time ends keep their own utc offset."""
+
+    summer_time = timezone(timedelta(hours=2))
+    winter_time = timezone(timedelta(hours=1))
+    records = [
+        (datetime(2024, 10, 27, 2, 0, tzinfo=summer_time), 1.0),
+        (datetime(2024, 10, 27, 2, 0, tzinfo=winter_time), 2.0),
+        (datetime(2024, 10, 27, 23, 0, tzinfo=winter_time), 4.0),
+    ]
+
+    series = DailyConsumptionSeries(day=date(2024, 10, 27))
+    series.append(ConsumptionSeries.from_records(records[:1]), until=datetime(2024, 10, 28, tzinfo=winter_time))
+    series.append(ConsumptionSeries.from_records(records[1:]), until=datetime(2024, 10, 28, tzinfo=winter_time))
+
+    assert [step.utcoffset() for step, _ in series.get_steps_after(None)] == [step.utcoffset() for step, _ in records]
+    assert series.get_consumption_before(datetime(2024, 10, 28, tzinfo=winter_time)) == 7.0
@@ -49,3 +49,11 @@ class EnergyContractBuilder(GenericBuilder[EnergyContract]):
     def with_end_date(self, end_date: date | None) -> Self:
         """Set the end date."""
         return self._set_value("end_date", end_date)
+
+    def with_prices(self, prices: EnergyContractPrices) -> Self:
+        """Set the prices."""
+        return self._set_value("prices", prices)
+
+    def with_offpeak_hours(self, offpeak_hours: list[RangeModel[time]]) -> Self:
+        """Set the offpeak hours."""
+        return self._set_value("offpeak_hours", offpeak_hours)
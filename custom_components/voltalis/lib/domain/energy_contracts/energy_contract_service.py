@@ -1,9 +1,10 @@
-from datetime import time
+from datetime import datetime, time
 
 from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
     EnergyContractCurrentModeEnum,
 )
 from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.energy_contracts.tariff_timeline import TariffTimeline
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
 
@@ -17,6 +18,7 @@ class EnergyContractService:
         date_provider: DateProvider,
     ):
         self.__date_provider = date_provider
+        self.__tariff_timelines: dict[tuple, TariffTimeline] = {}
 
     def get_current_mode(
         self,
@@ -26,23 +28,32 @@ class EnergyContractService:
     ) -> EnergyContractCurrentModeEnum:
         """Get the current mode of the energy contract."""
 
-        if contract_type == EnergyContractTypeEnum.BASE:
-            return EnergyContractCurrentModeEnum.BASE
+        tariff_timeline = self.get_tariff_timeline(contract_type=contract_type, offpeak_hours=offpeak_hours)
+        return tariff_timeline.get_mode_at(self.__date_provider.get_now())
 
-        now = self.__date_provider.get_now().time()
-        in_off_peak = any(self.__is_in_time_range(time_range, now) for time_range in offpeak_hours)
+    def get_next_mode_change(
+        self,
+        *,
+        contract_type: EnergyContractTypeEnum,
+        offpeak_hours: list[RangeModel[time]],
+    ) -> datetime | None:
+        """Get the next instant the current mode of the energy contract changes, None if it never changes."""
+
+        tariff_timeline = self.get_tariff_timeline(contract_type=contract_type, offpeak_hours=offpeak_hours)
+        return tariff_timeline.get_next_transition(self.__date_provider.get_now())
 
-        if in_off_peak:
-            return EnergyContractCurrentModeEnum.OFFPEAK
+    def get_tariff_timeline(
+        self,
+        *,
+        contract_type: EnergyContractTypeEnum,
+        offpeak_hours: list[RangeModel[time]],
+    ) -> TariffTimeline:
+        """Get the tariff timeline of the energy contract, compiled on the first call for these offpeak hours."""
 
-        return EnergyContractCurrentModeEnum.PEAK
+        key = (contract_type, tuple((time_range.start, time_range.end) for time_range in offpeak_hours))
+        tariff_timeline = self.__tariff_timelines.get(key)
+        if tariff_timeline is None:
+            tariff_timeline = TariffTimeline(contract_type=contract_type, offpeak_hours=offpeak_hours)
+            self.__tariff_timelines[key] = tariff_timeline
 
-    def __is_in_time_range(self, time_range: RangeModel[time], now: time) -> bool:
-        """Return True if now is within the given time range, handling overnight spans."""
-        start = time_range.start
-        end = time_range.end
-        if start <= end:
-            # Normal range within the same day, e.g. 08:00-12:00
-            return start <= now <= end
-        # Overnight range crossing midnight, e.g. 22:00-06:00
-        return now >= start or now <= end
+        return tariff_timeline
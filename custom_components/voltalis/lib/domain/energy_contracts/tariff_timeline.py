@@ -0,0 +1,126 @@
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+class TariffTimeline:
+    """Modes of an energy contract over a day, compiled once from its offpeak hours.
+
+    The day is split into sorted segments with a single mode each, two following segments having different modes.
+    The mode at an instant and the next transition are found with a binary search over the segments starts,
+    the time spent in each mode between two instants with the durations accumulated up to each segment.
+    """
+
+    def __init__(
+        self,
+        *,
+        contract_type: EnergyContractTypeEnum,
+        offpeak_hours: list[RangeModel[time]],
+    ) -> None:
+        segments = TariffTimeline.__compile_segments(contract_type, offpeak_hours)
+
+        # Start of each segment in seconds of the day, and its mode
+        self.__starts = [start for start, _ in segments]
+        self.__modes = [mode for _, mode in segments]
+
+        # Seconds spent in each mode from the start of the day to the start of each segment
+        self.__elapsed: list[dict[EnergyContractCurrentModeEnum, float]] = []
+        elapsed = {mode: 0.0 for mode in self.__modes}
+        for index, (start, mode) in enumerate(segments):
+            self.__elapsed.append(dict(elapsed))
+            end = self.__starts[index + 1] if index + 1 < len(segments) else DAY_SECONDS
+            elapsed[mode] += end - start
+        self.__day_durations = elapsed
+
+    def get_mode_at(self, instant: datetime) -> EnergyContractCurrentModeEnum:
+        """Get the mode of the energy contract at the given instant."""
+
+        return self.__modes[self.__get_segment_index(TariffTimeline.__get_day_seconds(instant))]
+
+    def get_next_transition(self, instant: datetime) -> datetime | None:
+        """Get the next instant the mode changes after the given instant, None if the mode never changes."""
+
+        if len(self.__day_durations) == 1:
+            return None
+
+        index = self.__get_segment_index(TariffTimeline.__get_day_seconds(instant))
+        next_day, next_index = divmod(index + 1, len(self.__starts))
+        if self.__modes[next_index] == self.__modes[index]:
+            # Only the segments of the end and the start of the day can share a mode, the day wraps around
+            next_day, next_index = divmod(index + 2, len(self.__starts))
+
+        day_start = datetime.combine(instant.date(), time(), tzinfo=instant.tzinfo)
+        return day_start + timedelta(days=next_day, seconds=self.__starts[next_index])
+
+    def get_durations(self, start: datetime, end: datetime) -> dict[EnergyContractCurrentModeEnum, timedelta]:
+        """Get the time spent in each mode within [start, end)."""
+
+        days = (end.date() - start.date()).days
+        elapsed_at_start = self.__get_elapsed(TariffTimeline.__get_day_seconds(start))
+        elapsed_at_end = self.__get_elapsed(TariffTimeline.__get_day_seconds(end))
+
+        durations: dict[EnergyContractCurrentModeEnum, timedelta] = {}
+        for mode, day_duration in self.__day_durations.items():
+            seconds = days * day_duration + elapsed_at_end[mode] - elapsed_at_start[mode]
+            if seconds > 0:
+                durations[mode] = timedelta(seconds=seconds)
+        return durations
+
+    def __get_segment_index(self, seconds: float) -> int:
+        return bisect_right(self.__starts, seconds) - 1
+
+    def __get_elapsed(self, seconds: float) -> dict[EnergyContractCurrentModeEnum, float]:
+        """Get the seconds spent in each mode from the start of the day to the given second of the day."""
+
+        index = self.__get_segment_index(seconds)
+        elapsed = dict(self.__elapsed[index])
+        elapsed[self.__modes[index]] += seconds - self.__starts[index]
+        return elapsed
+
+    @staticmethod
+    def __get_day_seconds(instant: datetime) -> float:
+        return instant.hour * 3600 + instant.minute * 60 + instant.second + instant.microsecond / 1_000_000
+
+    @staticmethod
+    def __compile_segments(
+        contract_type: EnergyContractTypeEnum,
+        offpeak_hours: list[RangeModel[time]],
+    ) -> list[tuple[float, EnergyContractCurrentModeEnum]]:
+        """Compile the offpeak hours into the sorted segments of the day."""
+
+        if contract_type == EnergyContractTypeEnum.BASE:
+            return [(0, EnergyContractCurrentModeEnum.BASE)]
+
+        # The ranges include their end, the offpeak intervals last until the next second
+        intervals: list[tuple[float, float]] = []
+        for time_range in offpeak_hours:
+            range_start = time_range.start.hour * 3600 + time_range.start.minute * 60 + time_range.start.second
+            range_end = time_range.end.hour * 3600 + time_range.end.minute * 60 + time_range.end.second + 1
+            if range_start < range_end:
+                intervals.append((range_start, range_end))
+            else:
+                # Overnight range crossing midnight, e.g. 22:00-06:00
+                intervals.extend([(range_start, DAY_SECONDS), (0, range_end)])
+
+        # Merge the overlapping offpeak intervals and fill the gaps with peak segments
+        segments: list[tuple[float, EnergyContractCurrentModeEnum]] = []
+        cursor: float = 0
+        for start, end in sorted(intervals):
+            if end <= cursor:
+                continue
+            if start > cursor:
+                segments.append((cursor, EnergyContractCurrentModeEnum.PEAK))
+            if not segments or segments[-1][1] != EnergyContractCurrentModeEnum.OFFPEAK:
+                segments.append((max(start, cursor), EnergyContractCurrentModeEnum.OFFPEAK))
+            cursor = end
+        if cursor < DAY_SECONDS:
+            segments.append((cursor, EnergyContractCurrentModeEnum.PEAK))
+
+        return segments
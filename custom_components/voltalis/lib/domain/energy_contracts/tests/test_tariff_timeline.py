@@ -0,0 +1,104 @@
+"""Unit tests for TariffTimeline."""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_current_mode_enum import (
+    EnergyContractCurrentModeEnum,
+)
+from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_enum import EnergyContractTypeEnum
+from custom_components.voltalis.lib.domain.energy_contracts.tariff_timeline import TariffTimeline
+from custom_components.voltalis.lib.domain.shared.range_model import RangeModel
+
+OFFPEAK_HOURS = [
+    RangeModel[time](start=time(1, 0), end=time(6, 0)),
+    RangeModel[time](start=time(12, 0), end=time(14, 0)),
+    RangeModel[time](start=time(22, 30), end=time(0, 30)),
+]
+
+
+@pytest.mark.unit
+def test_tariff_timeline_base() -> None:
+    """Test that a base contract is always in BASE mode."""
+
+    timeline = TariffTimeline(contract_type=EnergyContractTypeEnum.BASE, offpeak_hours=OFFPEAK_HOURS)
+
+    assert timeline.get_mode_at(datetime(2024, 1, 2, 2, 0)) == EnergyContractCurrentModeEnum.BASE
+    assert timeline.get_next_transition(datetime(2024, 1, 2, 2, 0)) is None
+    assert timeline.get_durations(datetime(2024, 1, 2, 2, 0), datetime(2024, 1, 2, 3, 0)) == {
+        EnergyContractCurrentModeEnum.BASE: timedelta(hours=1)
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "instant,expected",
+    [
+        (datetime(2024, 1, 2, 0, 45), EnergyContractCurrentModeEnum.PEAK),
+        (datetime(2024, 1, 2, 1, 0), EnergyContractCurrentModeEnum.OFFPEAK),
+        # The ranges include their end
+        (datetime(2024, 1, 2, 6, 0), EnergyContractCurrentModeEnum.OFFPEAK),
+        (datetime(2024, 1, 2, 6, 0, 1), EnergyContractCurrentModeEnum.PEAK),
+        # Overnight range, on both sides of midnight
+        (datetime(2024, 1, 2, 23, 0), EnergyContractCurrentModeEnum.OFFPEAK),
+        (datetime(2024, 1, 2, 0, 15), EnergyContractCurrentModeEnum.OFFPEAK),
+    ],
+)
+def test_tariff_timeline_get_mode_at(instant: datetime, expected: EnergyContractCurrentModeEnum) -> None:
+    """Test the mode at an instant."""
+
+    timeline = TariffTimeline(contract_type=EnergyContractTypeEnum.PEAK_OFFPEAK, offpeak_hours=OFFPEAK_HOURS)
+
+    assert timeline.get_mode_at(instant) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "instant,expected",
+    [
+        (datetime(2024, 1, 2, 0, 45), datetime(2024, 1, 2, 1, 0)),
+        (datetime(2024, 1, 2, 6, 0), datetime(2024, 1, 2, 6, 0, 1)),
+        (datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 22, 30)),
+        # Midnight is not a transition inside the overnight range
+        (datetime(2024, 1, 2, 23, 0), datetime(2024, 1, 3, 0, 30, 1)),
+    ],
+)
+def test_tariff_timeline_get_next_transition(instant: datetime, expected: datetime) -> None:
+    """Test the next transition after an instant."""
+
+    timeline = TariffTimeline(contract_type=EnergyContractTypeEnum.PEAK_OFFPEAK, offpeak_hours=OFFPEAK_HOURS)
+
+    assert timeline.get_next_transition(instant) == expected
+
+
+@pytest.mark.unit
+def test_tariff_timeline_merges_overlapping_ranges() -> None:
+    """Test that overlapping offpeak ranges make a single transition."""
+
+    timeline = TariffTimeline(
+        contract_type=EnergyContractTypeEnum.PEAK_OFFPEAK,
+        offpeak_hours=[
+            RangeModel[time](start=time(1, 0), end=time(4, 0)),
+            RangeModel[time](start=time(3, 0), end=time(6, 0)),
+        ],
+    )
+
+    assert timeline.get_next_transition(datetime(2024, 1, 2, 2, 0)) == datetime(2024, 1, 2, 6, 0, 1)
+
+
+@pytest.mark.unit
+def test_tariff_timeline_get_durations() -> None:
+    """Test the time spent in each mode between two instants, over several days."""
+
+    timeline = TariffTimeline(
+        contract_type=EnergyContractTypeEnum.PEAK_OFFPEAK,
+        offpeak_hours=[RangeModel[time](start=time(22, 0), end=time(5, 59, 59))],
+    )
+
+    durations = timeline.get_durations(datetime(2024, 1, 1, 21, 0), datetime(2024, 1, 3, 7, 0))
+
+    assert durations == {
+        EnergyContractCurrentModeEnum.OFFPEAK: timedelta(hours=16),
+        EnergyContractCurrentModeEnum.PEAK: timedelta(hours=18),
+    }
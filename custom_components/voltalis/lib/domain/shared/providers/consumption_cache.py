@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+
+
+class ConsumptionCache(ABC):
+    """Interface for the cache of the devices consumptions of the past days."""
+
+    @abstractmethod
+    async def get_day(self, day: date) -> dict[int, ConsumptionSeries] | None:
+        """Get the devices consumptions of a day, None if the day is not cached"""
+        ...
+
+    @abstractmethod
+    async def set_day(self, day: date, devices_consumptions: dict[int, ConsumptionSeries]) -> None:
+        """Cache the devices consumptions of a day"""
+        ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_statistic import (
+    ConsumptionStatistic,
+)
+
+
+class ConsumptionStatisticsProvider(ABC):
+    """Provider for the long-term statistics of the devices consumption."""
+
+    @abstractmethod
+    async def get_checkpoint(self) -> ConsumptionBackfillCheckpoint:
+        """Get the progress of the backfill"""
+        ...
+
+    @abstractmethod
+    async def save_checkpoint(self, checkpoint: ConsumptionBackfillCheckpoint) -> None:
+        """Save the progress of the backfill"""
+        ...
+
+    @abstractmethod
+    async def import_statistics(self, devices_statistics: dict[int, list[ConsumptionStatistic]]) -> None:
+        """Import the hourly statistics of the devices, the statistics of an hour already imported are replaced"""
+        ...
@@ -14,6 +14,8 @@ class HttpClientResponse(CustomModel, Generic[T]):
     status: int
     url: str
     headers: dict[str, str | list[str] | int | bool | None] = {}
+    # Size of the response body in bytes, None if unknown
+    size: int | None = None
 
 
 class HttpClientException(Exception, Generic[T]):
@@ -0,0 +1,46 @@
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device import VoltalisDeviceDto
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device_consumption import (
+    VoltalisConsumptionDto,
+    VoltalisConsumptionDtoDevice,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device_health import (
+    VoltalisDeviceHealthDto,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_manual_setting import (
+    VoltalisManualSettingDto,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_program import VoltalisProgramDto
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_realtime_consumption import (
+    VoltalisRealtimeConsumptionDto,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_subscriber_contract import (
+    VoltalisSubscriberContractDto,
+)
+
+
+@cache
+def get_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    """Get the TypeAdapter of a type, building its validator only once."""
+    return TypeAdapter(type_)
+
+
+# Pre-built validators of the Voltalis API responses, shared by all the provider calls
+DEVICES_ADAPTER: TypeAdapter[list[VoltalisDeviceDto]] = get_type_adapter(list[VoltalisDeviceDto])
+DEVICES_HEALTH_ADAPTER: TypeAdapter[list[VoltalisDeviceHealthDto]] = get_type_adapter(list[VoltalisDeviceHealthDto])
+CONSUMPTION_ADAPTER: TypeAdapter[VoltalisConsumptionDto] = get_type_adapter(VoltalisConsumptionDto)
+CONSUMPTION_RECORDS_ADAPTER: TypeAdapter[list[VoltalisConsumptionDtoDevice]] = get_type_adapter(
+    list[VoltalisConsumptionDtoDevice]
+)
+REALTIME_CONSUMPTION_ADAPTER: TypeAdapter[VoltalisRealtimeConsumptionDto] = get_type_adapter(
+    VoltalisRealtimeConsumptionDto
+)
+MANUAL_SETTINGS_ADAPTER: TypeAdapter[list[VoltalisManualSettingDto]] = get_type_adapter(list[VoltalisManualSettingDto])
+PROGRAMS_ADAPTER: TypeAdapter[list[VoltalisProgramDto]] = get_type_adapter(list[VoltalisProgramDto])
+SUBSCRIBER_CONTRACTS_ADAPTER: TypeAdapter[list[VoltalisSubscriberContractDto]] = get_type_adapter(
+    list[VoltalisSubscriberContractDto]
+)
@@ -0,0 +1,140 @@
+import sys
+from array import array
+from base64 import b64decode, b64encode
+from datetime import date, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.shared.providers.consumption_cache import ConsumptionCache
+from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
+
+
+class ConsumptionCachePersistent(ConsumptionCache):
+    """Cache of the devices consumptions of the past days, persisted with the given load and save functions.
+
+    Each day is encoded in columns for each device: the timestamps in epoch seconds and the consumptions as float32,
+    in little endian and base64, with the utc offset of the steps, or the offset of each step on a DST day.
+    The days older than the retention are dropped, then the oldest days until the encoded size fits in the maximum size.
+    """
+
+    # Default maximum size of the encoded days, in bytes
+    DEFAULT_MAX_SIZE = 5 * 1024 * 1024
+
+    def __init__(
+        self,
+        *,
+        date_provider: DateProvider,
+        load: Callable[[], Awaitable[dict[str, Any] | None]],
+        save: Callable[[dict[str, Any]], None],
+        retention_days: int,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.__date_provider = date_provider
+        self.__load = load
+        self.__save = save
+        self.__retention_days = retention_days
+        self.__max_size = max_size
+
+        # Encoded days, loaded on the first access
+        self.__days: dict[str, dict[str, dict[str, str]]] | None = None
+
+    @property
+    def size(self) -> int:
+        """Encoded size of the cached days, in bytes."""
+        days = self.__days or {}
+        return sum(ConsumptionCachePersistent.__get_day_size(encoded_day) for encoded_day in days.values())
+
+    async def get_day(self, day: date) -> dict[int, ConsumptionSeries] | None:
+        days = await self.__get_days()
+        encoded_day = days.get(day.isoformat())
+        if encoded_day is None or not self.__is_retained(day):
+            return None
+
+        return {
+            int(device_id): ConsumptionCachePersistent.__decode_series(encoded_series)
+            for device_id, encoded_series in encoded_day.items()
+        }
+
+    async def set_day(self, day: date, devices_consumptions: dict[int, ConsumptionSeries]) -> None:
+        if not self.__is_retained(day):
+            return
+
+        days = await self.__get_days()
+        days[day.isoformat()] = {
+            str(device_id): ConsumptionCachePersistent.__encode_series(consumptions)
+            for device_id, consumptions in devices_consumptions.items()
+        }
+        self.__evict(days)
+        self.__save({"days": days})
+
+    async def __get_days(self) -> dict[str, dict[str, dict[str, str]]]:
+        if self.__days is None:
+            data = await self.__load()
+            self.__days = dict((data or {}).get("days", {}))
+        return self.__days
+
+    def __is_retained(self, day: date) -> bool:
+        return day >= self.__date_provider.get_now().date() - timedelta(days=self.__retention_days)
+
+    def __evict(self, days: dict[str, dict[str, dict[str, str]]]) -> None:
+        """Drop the days out of the retention, then the oldest days until the size fits."""
+
+        for day_str in sorted(days):
+            if not self.__is_retained(date.fromisoformat(day_str)):
+                del days[day_str]
+
+        size = sum(ConsumptionCachePersistent.__get_day_size(encoded_day) for encoded_day in days.values())
+        for day_str in sorted(days):
+            if size <= self.__max_size:
+                break
+            size -= ConsumptionCachePersistent.__get_day_size(days.pop(day_str))
+
+    @staticmethod
+    def __get_day_size(encoded_day: dict[str, dict[str, str]]) -> int:
+        return sum(len(column) for encoded_series in encoded_day.values() for column in encoded_series.values())
+
+    @staticmethod
+    def __encode_series(consumptions: ConsumptionSeries) -> dict[str, str]:
+        # Naive timestamps are already in wall clock seconds, as if they were in utc, and have no offsets
+        encoded_series = {
+            "timestamps": ConsumptionCachePersistent.__encode_column(array("q", consumptions.timestamps)),
+            "values": ConsumptionCachePersistent.__encode_column(array("f", consumptions.values)),
+        }
+        # A single utc offset is stored when the steps share it, the offset of each step when it changes in the day
+        offsets = consumptions.get_utc_offsets()
+        if offsets and min(offsets) == max(offsets):
+            encoded_series["offset"] = str(offsets[0])
+        elif offsets:
+            encoded_series["offsets"] = ConsumptionCachePersistent.__encode_column(offsets)
+        return encoded_series
+
+    @staticmethod
+    def __decode_series(encoded_series: dict[str, str]) -> ConsumptionSeries:
+        timestamps = ConsumptionCachePersistent.__decode_column("q", encoded_series["timestamps"])
+        values = array("d", ConsumptionCachePersistent.__decode_column("f", encoded_series["values"]))
+
+        encoded_offsets = encoded_series.get("offsets")
+        if encoded_offsets is not None:
+            offsets = ConsumptionCachePersistent.__decode_column("i", encoded_offsets)
+            return ConsumptionSeries.from_columns(timestamps, values, offsets=offsets)
+
+        encoded_offset = encoded_series.get("offset")
+        tz = timezone(timedelta(seconds=int(encoded_offset))) if encoded_offset is not None else None
+        return ConsumptionSeries(timestamps, values, tz=tz)
+
+    @staticmethod
+    def __encode_column(column: array) -> str:
+        if sys.byteorder == "big":
+            column = array(column.typecode, column)
+            column.byteswap()
+        return b64encode(column.tobytes()).decode("ascii")
+
+    @staticmethod
+    def __decode_column(typecode: str, encoded_column: str) -> array:
+        column = array(typecode)
+        column.frombytes(b64decode(encoded_column))
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
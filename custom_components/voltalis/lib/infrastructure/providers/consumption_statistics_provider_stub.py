@@ -0,0 +1,34 @@
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_backfill_checkpoint import (
+    ConsumptionBackfillCheckpoint,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_statistic import (
+    ConsumptionStatistic,
+)
+from custom_components.voltalis.lib.domain.shared.providers.consumption_statistics_provider import (
+    ConsumptionStatisticsProvider,
+)
+
+
+class ConsumptionStatisticsProviderStub(ConsumptionStatisticsProvider):
+    """Stub implementation of the ConsumptionStatisticsProvider for testing purposes."""
+
+    def __init__(self) -> None:
+        self._checkpoint = ConsumptionBackfillCheckpoint()
+        self._statistics: dict[int, dict[str, ConsumptionStatistic]] = {}
+        self._imports_count = 0
+
+    def set_checkpoint(self, checkpoint: ConsumptionBackfillCheckpoint) -> None:
+        self._checkpoint = checkpoint
+
+    async def get_checkpoint(self) -> ConsumptionBackfillCheckpoint:
+        return self._checkpoint
+
+    async def save_checkpoint(self, checkpoint: ConsumptionBackfillCheckpoint) -> None:
+        self._checkpoint = checkpoint
+
+    async def import_statistics(self, devices_statistics: dict[int, list[ConsumptionStatistic]]) -> None:
+        self._imports_count += 1
+        for device_id, statistics in devices_statistics.items():
+            device_statistics = self._statistics.setdefault(device_id, {})
+            for statistic in statistics:
+                device_statistics[statistic.start.isoformat()] = statistic
@@ -1,12 +1,27 @@
+import asyncio
+import logging
+import ssl
+import time
+from collections import Counter, OrderedDict
 from typing import Any, TypeVar, cast
 
-from aiohttp import ClientConnectorError, ClientError, ClientResponse, ClientResponseError, ClientSession
+from aiohttp import (
+    ClientConnectorError,
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 
 from custom_components.voltalis.lib.domain.shared.providers.http_client import (
     HttpClient,
     HttpClientException,
     HttpClientResponse,
 )
+from custom_components.voltalis.lib.infrastructure.providers.http_retry_policy import HttpRetryPolicy
+from custom_components.voltalis.lib.infrastructure.providers.http_timeout import HttpRouteClassEnum, HttpTimeout
 
 T = TypeVar("T")
 TData = TypeVar("TData")
@@ -15,19 +30,105 @@ TData = TypeVar("TData")
 class HttpClientAiohttp(HttpClient):
     """Concrete implementation of the HttpClient using the aiohttp library."""
 
+    # Timeouts of each route class, the large reads download the consumption of a whole day
+    DEFAULT_TIMEOUTS: dict[HttpRouteClassEnum, HttpTimeout] = {
+        HttpRouteClassEnum.AUTH: HttpTimeout(connect=10.0, read=15.0, total=20.0),
+        HttpRouteClassEnum.SMALL_READ: HttpTimeout(connect=10.0, read=15.0, total=20.0),
+        HttpRouteClassEnum.LARGE_READ: HttpTimeout(connect=10.0, read=30.0, total=60.0),
+        HttpRouteClassEnum.WRITE: HttpTimeout(connect=10.0, read=15.0, total=20.0),
+    }
+
+    # Number of responses kept by the conditional cache, room for the polled routes and the latest days
+    CONDITIONAL_CACHE_MAX_SIZE = 32
+
     def __init__(
         self,
         *,
         session: ClientSession,
         base_url: str | None = None,
+        use_conditional_cache: bool = False,
+        conditional_cache_max_size: int = CONDITIONAL_CACHE_MAX_SIZE,
+        retry_policy: HttpRetryPolicy | None = None,
+        timeouts: dict[HttpRouteClassEnum, HttpTimeout] | None = None,
     ) -> None:
         self._session = session
         self._base_url = base_url
 
+        # Timeouts of each route class, the route class of a request is given with route_class=
+        self._timeouts = {**HttpClientAiohttp.DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self._timeouts_count: Counter[HttpRouteClassEnum] = Counter()
+
+        # Retries of the transient errors, the requests are sent once without a policy
+        self._retry_policy = retry_policy
+        self._retries_count = 0
+
+        # Conditional requests cache (ETag / Last-Modified), keyed on method + url + query params
+        # The least recently used responses are dropped first, the past days fetched once don't stay in memory
+        self._use_conditional_cache = use_conditional_cache
+        self._conditional_cache_max_size = conditional_cache_max_size
+        self._conditional_cache: OrderedDict[tuple[str, str, tuple[tuple[str, str], ...]], HttpClientResponse[Any]] = (
+            OrderedDict()
+        )
+        self._conditional_cache_hits = 0
+        self._conditional_cache_misses = 0
+
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def conditional_cache_hits(self) -> int:
+        """Number of requests answered with a 304 and served from the conditional cache."""
+        return self._conditional_cache_hits
+
+    @property
+    def conditional_cache_misses(self) -> int:
+        """Number of cacheable requests that had to download the full response."""
+        return self._conditional_cache_misses
+
+    @property
+    def retries_count(self) -> int:
+        """Number of requests sent again after a transient error."""
+        return self._retries_count
+
+    @property
+    def timeouts_count(self) -> dict[HttpRouteClassEnum, int]:
+        """Number of attempts that exceeded the timeouts of their route class."""
+        return dict(self._timeouts_count)
+
+    @staticmethod
+    def create_session(
+        *,
+        connections_limit: int,
+        keepalive_timeout: float,
+        dns_cache_ttl: int,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> ClientSession:
+        """Create a session whose connection pool is tuned for a single host.
+
+        The idle connections are kept open for keepalive_timeout seconds and the host is resolved again after
+        dns_cache_ttl seconds only. It must be called from the event loop, and the session closed by the caller.
+        """
+
+        connector = TCPConnector(
+            limit=connections_limit,
+            limit_per_host=connections_limit,
+            keepalive_timeout=keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=dns_cache_ttl,
+            ssl=ssl_context if ssl_context is not None else True,
+        )
+        return ClientSession(connector=connector)
+
+    def clear_conditional_cache(self) -> None:
+        """Forget all the cached responses."""
+        self._conditional_cache.clear()
+
     @staticmethod
     async def _from_response(*, response: ClientResponse) -> HttpClientResponse[T]:
         """Convert a aiohttp Response to a HttpClientResponse."""
 
+        # The body is read once, the json decoding reuses it
+        body = await response.read()
+
         data: Any = None
         if response.content_type == "application/json":
             data = await response.json()
@@ -37,15 +138,16 @@ class HttpClientAiohttp(HttpClient):
             status=response.status,
             url=str(response.url),
             headers=dict(response.headers),
+            size=len(body),
         )
 
     @staticmethod
     def _from_exception(
-        *, exception: ClientConnectorError | ClientError | ClientResponseError
+        *, exception: ClientConnectorError | ClientError | ClientResponseError | TimeoutError
     ) -> HttpClientException[T]:
         """
         Convert an aiohttp exception (ClientConnectorError, ClientError, or ClientResponseError)
-        to a HttpClientException.
+        or a timeout to a HttpClientException.
         """
 
         response: HttpClientResponse[T] | None = None
@@ -58,7 +160,7 @@ class HttpClientAiohttp(HttpClient):
             )
 
         return HttpClientException(
-            message=str(exception),
+            message=str(exception) or type(exception).__name__,
             request={
                 "url": str(exception.request_info.url),
                 "method": exception.request_info.method,
@@ -84,10 +186,88 @@ class HttpClientAiohttp(HttpClient):
         headers: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> HttpClientResponse[TData]:
-        """Send an HTTP request to the server."""
+        """Send an HTTP request to the server.
+
+        The GET requests, and the other requests sent with idempotent=True, are retried on transient errors
+        following the retry policy. Each attempt is bounded by the timeouts of the route_class of the request,
+        the reads are small reads and the other methods writes by default.
+        """
+
+        idempotent = kwargs.pop("idempotent", False)
+        route_class = kwargs.pop("route_class", None) or (
+            HttpRouteClassEnum.SMALL_READ if method.upper() in ("GET", "HEAD") else HttpRouteClassEnum.WRITE
+        )
+        retry_policy = self._retry_policy
+        if retry_policy is None or not retry_policy.can_retry_request(method=method, idempotent=idempotent):
+            return await self._send_request_once(
+                url=url,
+                method=method,
+                body=body,
+                query_params=query_params,
+                headers=headers,
+                route_class=route_class,
+                **kwargs,
+            )
+
+        # The attempts and the delays between them all end before the deadline of the request
+        deadline = time.monotonic() + retry_policy.deadline
+        attempt = 1
+        while True:
+            try:
+                return await self._send_request_once(
+                    url=url,
+                    method=method,
+                    body=body,
+                    query_params=query_params,
+                    headers=headers,
+                    route_class=route_class,
+                    deadline=deadline,
+                    **kwargs,
+                )
+            except HttpClientException as err:
+                if attempt >= retry_policy.max_attempts or not retry_policy.can_retry_error(err):
+                    raise
+
+                # No new attempt once the time budget of the request is spent
+                delay = retry_policy.get_delay(attempt)
+                if time.monotonic() + delay >= deadline:
+                    raise
+
+                self._logger.debug("%s %s failed (%s), retrying in %.2fs", method, url, err, delay)
+                self._retries_count += 1
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _send_request_once(
+        self,
+        *,
+        url: str,
+        method: str,
+        body: Any | None,
+        query_params: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        route_class: HttpRouteClassEnum,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> HttpClientResponse[TData]:
+        """Send one attempt of an HTTP request to the server, it must end before the deadline if any."""
+
+        if "timeout" not in kwargs:
+            timeout = self._timeouts[route_class]
+            total = timeout.total if deadline is None else min(timeout.total, deadline - time.monotonic())
+            kwargs["timeout"] = ClientTimeout(total=total, connect=timeout.connect, sock_read=timeout.read)
 
         full_url = self._get_full_url(url)
-        full_headers = headers or {}
+        full_headers = dict(headers or {})
+
+        # Only the GET requests are cached, other methods have side effects
+        cache_key = (method.upper(), full_url, tuple(sorted((query_params or {}).items())))
+        is_cacheable = self._use_conditional_cache and cache_key[0] == "GET"
+        cached_response = self._conditional_cache.get(cache_key) if is_cacheable else None
+        if cached_response is not None:
+            self._conditional_cache.move_to_end(cache_key)
+            full_headers.update(self._get_conditional_headers(cached_response))
+
         try:
             response = await self._session.request(
                 method=method,
@@ -98,6 +278,41 @@ class HttpClientAiohttp(HttpClient):
                 **kwargs,
             )
             response.raise_for_status()
-            return await self._from_response(response=response)
-        except (ClientConnectorError, ClientError, ClientResponseError) as e:
+
+            if cached_response is not None and response.status == 304:
+                response.release()
+                self._conditional_cache_hits += 1
+                return cached_response
+
+            result: HttpClientResponse[TData] = await self._from_response(response=response)
+        except (ClientConnectorError, ClientError, ClientResponseError, TimeoutError) as e:
+            if isinstance(e, TimeoutError):
+                self._timeouts_count[route_class] += 1
+                self._logger.debug("%s %s exceeded the %s timeouts", method, url, route_class)
             raise self._from_exception(exception=e) from e
+
+        if is_cacheable:
+            self._conditional_cache_misses += 1
+            if self._get_conditional_headers(result):
+                self._conditional_cache[cache_key] = result
+                self._conditional_cache.move_to_end(cache_key)
+                while len(self._conditional_cache) > self._conditional_cache_max_size:
+                    self._conditional_cache.popitem(last=False)
+            else:
+                self._conditional_cache.pop(cache_key, None)
+
+        return result
+
+    @staticmethod
+    def _get_conditional_headers(response: HttpClientResponse[Any]) -> dict[str, str]:
+        """Get the conditional request headers matching the validators of a cached response."""
+
+        # aiohttp headers are case-insensitive, but they have been copied to a plain dict
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+
+        conditional_headers: dict[str, str] = {}
+        if isinstance(etag := response_headers.get("etag"), str):
+            conditional_headers["If-None-Match"] = etag
+        if isinstance(last_modified := response_headers.get("last-modified"), str):
+            conditional_headers["If-Modified-Since"] = last_modified
+        return conditional_headers
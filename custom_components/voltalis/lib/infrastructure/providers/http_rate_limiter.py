@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections import Counter
+from enum import StrEnum
+from typing import Callable
+
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class HttpPriorityEnum(StrEnum):
+    """Enum to represent the priority lane of a request"""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class HttpRateBudget(CustomModel):
+    """Token bucket budget of a priority lane."""
+
+    # Number of requests sent per second once the burst is spent
+    rate: float
+    # Number of requests sent at once after a quiet period
+    burst: int
+
+
+class HttpRateLimiter:
+    """Rate limiter of the requests sent to an API, with a token bucket per priority lane.
+
+    The requests of a lane are sent in order, each one taking a token of the lane. The interactive requests also
+    take the unused tokens of the background lane, so they never wait behind the background requests.
+    """
+
+    # The background lane has room for all the polls of a refresh, the interactive one for a command on every device
+    DEFAULT_BUDGETS: dict[HttpPriorityEnum, HttpRateBudget] = {
+        HttpPriorityEnum.INTERACTIVE: HttpRateBudget(rate=5.0, burst=10),
+        HttpPriorityEnum.BACKGROUND: HttpRateBudget(rate=2.0, burst=10),
+    }
+
+    def __init__(
+        self,
+        *,
+        budgets: dict[HttpPriorityEnum, HttpRateBudget] | None = None,
+        get_time: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.__budgets = {**HttpRateLimiter.DEFAULT_BUDGETS, **(budgets or {})}
+        self.__get_time = get_time
+
+        # The buckets start full
+        self.__tokens = {priority: float(budget.burst) for priority, budget in self.__budgets.items()}
+        self.__refilled_at = get_time()
+
+        # The lock of a lane is fair, its requests take the tokens in order
+        self.__locks = {priority: asyncio.Lock() for priority in HttpPriorityEnum}
+
+        self.__requests_count: Counter[HttpPriorityEnum] = Counter()
+        self.__queue_time: dict[HttpPriorityEnum, float] = {priority: 0.0 for priority in HttpPriorityEnum}
+        self.__max_queue_time: dict[HttpPriorityEnum, float] = {priority: 0.0 for priority in HttpPriorityEnum}
+
+    @property
+    def requests_count(self) -> dict[HttpPriorityEnum, int]:
+        """Number of requests let through, per lane."""
+        return dict(self.__requests_count)
+
+    @property
+    def queue_time(self) -> dict[HttpPriorityEnum, float]:
+        """Total time the requests waited for a token, per lane, in seconds."""
+        return dict(self.__queue_time)
+
+    @property
+    def max_queue_time(self) -> dict[HttpPriorityEnum, float]:
+        """Longest time a request waited for a token, per lane, in seconds."""
+        return dict(self.__max_queue_time)
+
+    async def acquire(self, priority: HttpPriorityEnum) -> float:
+        """Wait for a token of the lane. Returns the time waited, in seconds."""
+
+        started_at = self.__get_time()
+        # A request queued behind the other requests of its lane, or waiting for a token
+        queued = self.__locks[priority].locked()
+        async with self.__locks[priority]:
+            while not self.__take_token(priority):
+                queued = True
+                await asyncio.sleep(self.__get_token_delay(priority))
+
+        queue_time = self.__get_time() - started_at if queued else 0.0
+        self.__requests_count[priority] += 1
+        self.__queue_time[priority] += queue_time
+        self.__max_queue_time[priority] = max(self.__max_queue_time[priority], queue_time)
+        return queue_time
+
+    def __get_lanes(self, priority: HttpPriorityEnum) -> list[HttpPriorityEnum]:
+        """Get the lanes the requests of a lane take their tokens from, by order of preference."""
+
+        if priority == HttpPriorityEnum.INTERACTIVE:
+            return [HttpPriorityEnum.INTERACTIVE, HttpPriorityEnum.BACKGROUND]
+        return [priority]
+
+    def __refill(self) -> None:
+        now = self.__get_time()
+        elapsed = now - self.__refilled_at
+        self.__refilled_at = now
+        for priority, budget in self.__budgets.items():
+            self.__tokens[priority] = min(float(budget.burst), self.__tokens[priority] + elapsed * budget.rate)
+
+    def __take_token(self, priority: HttpPriorityEnum) -> bool:
+        self.__refill()
+        for lane in self.__get_lanes(priority):
+            if self.__tokens[lane] >= 1:
+                self.__tokens[lane] -= 1
+                return True
+        return False
+
+    def __get_token_delay(self, priority: HttpPriorityEnum) -> float:
+        """Get the time until one of the lanes of the priority has a token again."""
+
+        return min(
+            (1 - self.__tokens[lane]) / self.__budgets[lane].rate
+            for lane in self.__get_lanes(priority)
+            if self.__budgets[lane].rate > 0
+        )
@@ -0,0 +1,46 @@
+import random
+from typing import Callable
+
+from custom_components.voltalis.lib.domain.shared.providers.http_client import HttpClientException
+
+
+class HttpRetryPolicy:
+    """Retry policy of the HttpClientAiohttp requests, with a capped exponential backoff and full jitter.
+
+    Only the idempotent requests are retried, on a 5xx response, a timeout or a connection error. A request is
+    attempted at most max_attempts times, and no new attempt starts after the deadline of the request.
+    Subclasses can override the methods to change which requests and errors are retried.
+    """
+
+    # Methods without side effects, the other ones are retried only when the request is marked idempotent
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 5.0,
+        deadline: float = 60.0,
+        get_random: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # Time budget of a request and its retries, in seconds
+        self.deadline = deadline
+        self.__get_random = get_random
+
+    def can_retry_request(self, *, method: str, idempotent: bool) -> bool:
+        """Check if a request can be sent again without side effects."""
+        return idempotent or method.upper() in HttpRetryPolicy.IDEMPOTENT_METHODS
+
+    def can_retry_error(self, error: HttpClientException) -> bool:
+        """Check if an error is transient: no response (timeout or connection error) or a server error."""
+        return error.response is None or error.response.status >= 500
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay before the next attempt, attempt being the number of attempts already done."""
+
+        # Full jitter, the clients failing together don't retry together
+        return float(min(self.max_delay, self.base_delay * 2 ** (attempt - 1)) * self.__get_random())
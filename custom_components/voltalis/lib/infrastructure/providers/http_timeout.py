@@ -0,0 +1,23 @@
+from enum import StrEnum
+
+from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+
+
+class HttpRouteClassEnum(StrEnum):
+    """Enum to represent the class of a route, the routes of a class share the same timeouts"""
+
+    AUTH = "auth"
+    SMALL_READ = "small_read"
+    LARGE_READ = "large_read"
+    WRITE = "write"
+
+
+class HttpTimeout(CustomModel):
+    """Timeouts of one attempt of a request, in seconds."""
+
+    # Time to get a connection, from the pool or a new one
+    connect: float
+    # Time between two reads of the response
+    read: float
+    # Time of the whole attempt, including the connection and the response body
+    total: float
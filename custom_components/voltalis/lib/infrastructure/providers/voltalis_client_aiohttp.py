@@ -1,5 +1,9 @@
+import asyncio
+import base64
+import json
 import logging
-from typing import Any, TypedDict, cast
+import time
+from typing import Any, Callable, TypedDict, cast
 
 from aiohttp import ClientSession
 from pydantic import SecretStr
@@ -12,6 +16,9 @@ from custom_components.voltalis.lib.domain.shared.providers.http_client import (
     TData,
 )
 from custom_components.voltalis.lib.infrastructure.providers.http_client_aiohttp import HttpClientAiohttp
+from custom_components.voltalis.lib.infrastructure.providers.http_rate_limiter import HttpPriorityEnum, HttpRateLimiter
+from custom_components.voltalis.lib.infrastructure.providers.http_retry_policy import HttpRetryPolicy
+from custom_components.voltalis.lib.infrastructure.providers.http_timeout import HttpRouteClassEnum, HttpTimeout
 
 
 class VoltalisClientAiohttp(HttpClientAiohttp):
@@ -22,6 +29,9 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
 
     LOGIN_ROUTE = VOLTALIS_API_LOGIN_ROUTE
 
+    # Renew the token this many seconds before its expiry
+    TOKEN_RENEWAL_MARGIN = 60
+
     class Storage(TypedDict):
         """Dict that represent the storage of the client"""
 
@@ -35,8 +45,18 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
         *,
         session: ClientSession,
         base_url: str,
+        use_conditional_cache: bool = False,
+        retry_policy: HttpRetryPolicy | None = None,
+        timeouts: dict[HttpRouteClassEnum, HttpTimeout] | None = None,
+        rate_limiter: HttpRateLimiter | None = None,
     ) -> None:
-        super().__init__(session=session, base_url=base_url)
+        super().__init__(
+            session=session,
+            base_url=base_url,
+            use_conditional_cache=use_conditional_cache,
+            retry_policy=retry_policy,
+            timeouts=timeouts,
+        )
 
         # Setup storage
         self.__storage = VoltalisClientAiohttp.Storage(
@@ -46,6 +66,19 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
             default_site_id=None,
         )
 
+        # Budget of the requests sent to Voltalis, the requests are sent right away without a limiter
+        self.__rate_limiter = rate_limiter
+
+        # Only one login can run at a time, the other requests wait for it and reuse its token
+        self.__login_lock = asyncio.Lock()
+
+        # Background renewal of the token before it expires
+        self.__token_renewal_handle: asyncio.TimerHandle | None = None
+        self.__token_renewal_task: asyncio.Task[None] | None = None
+
+        # Called after each successful login, e.g. to persist the new token
+        self.__login_listeners: list[Callable[[], None]] = []
+
         # Configure logger
         logger = logging.getLogger(__name__)
         self.__logger = logger
@@ -55,6 +88,29 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
         """Get the aiohttp storage."""
         return self.__storage
 
+    @property
+    def rate_limiter(self) -> HttpRateLimiter | None:
+        """Get the rate limiter of the requests, it holds the queueing time of each priority lane."""
+        return self.__rate_limiter
+
+    @staticmethod
+    def get_token_expiry(token: SecretStr) -> float | None:
+        """Get the expiry timestamp of a JWT token, None if the token isn't a JWT or has no expiry."""
+
+        parts = token.get_secret_value().split(".")
+        if len(parts) != 3:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        except ValueError:
+            return None
+
+        expiry = payload.get("exp") if isinstance(payload, dict) else None
+        if not isinstance(expiry, (int, float)) or isinstance(expiry, bool):
+            return None
+        return float(expiry)
+
     async def get_access_token(
         self,
         *,
@@ -73,6 +129,7 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
                 method="POST",
                 body=payload,
                 can_retry=False,
+                route_class=HttpRouteClassEnum.AUTH,
             )
             return SecretStr(response.data["token"])
         except HttpClientException as err:
@@ -82,9 +139,12 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
             raise err
 
     async def __get_me(self) -> str:
+        # Called while holding the login lock, a 401 here must not trigger another login
         response: HttpClientResponse[dict] = await self.send_request(
             url="/api/account/me",
             method="GET",
+            can_retry=False,
+            route_class=HttpRouteClassEnum.AUTH,
         )
         return cast(str, response.data["defaultSite"]["id"])
 
@@ -103,9 +163,102 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
         self.__storage["auth_token"] = token
         self.__storage["default_site_id"] = await self.__get_me()
 
+        self.__schedule_token_renewal(token)
+
         self.__logger.info("Voltalis login successful")
 
+        for listener in list(self.__login_listeners):
+            listener()
+
+    def add_login_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call the listener after each successful login. Returns a function to remove the listener."""
+
+        self.__login_listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self.__login_listeners:
+                self.__login_listeners.remove(listener)
+
+        return remove_listener
+
+    def restore_session(
+        self,
+        *,
+        username: str,
+        password: SecretStr,
+        auth_token: SecretStr,
+        default_site_id: str,
+    ) -> None:
+        """Reuse the token of a previous login without calling the API, the next 401 triggers a new login."""
+
+        self.__storage["username"] = username
+        self.__storage["password"] = password
+
+        self.__storage["auth_token"] = auth_token
+        self.__storage["default_site_id"] = default_site_id
+
+        self.__schedule_token_renewal(auth_token)
+
+        self.__logger.info("Voltalis session restored")
+
+    def close(self) -> None:
+        """Stop the background token renewal, without logging out so the session can be restored later."""
+        self.__cancel_token_renewal()
+
+    def __schedule_token_renewal(self, token: SecretStr) -> None:
+        """Schedule a login just before the token expires, so the requests never get a 401 for an expired token."""
+
+        if self.__token_renewal_handle is not None:
+            self.__token_renewal_handle.cancel()
+            self.__token_renewal_handle = None
+
+        expiry = self.get_token_expiry(token)
+        if expiry is None:
+            return
+
+        # If the token expires too soon, the renewal is left to the 401 handling of send_request
+        delay = expiry - time.time() - VoltalisClientAiohttp.TOKEN_RENEWAL_MARGIN
+        if delay <= 0:
+            return
+
+        self.__token_renewal_handle = asyncio.get_running_loop().call_later(delay, self.__start_token_renewal, token)
+
+    def __start_token_renewal(self, token: SecretStr) -> None:
+        self.__token_renewal_handle = None
+        self.__token_renewal_task = asyncio.create_task(self.__renew_token(token))
+
+    async def __renew_token(self, token: SecretStr) -> None:
+        self.__logger.debug("Voltalis token is about to expire, renewing it...")
+        try:
+            await self.__renew_login(expired_token=token)
+        except Exception as err:
+            self.__logger.warning("Voltalis token renewal failed, will login again on the next 401: %s", err)
+        finally:
+            self.__token_renewal_task = None
+
+    def __cancel_token_renewal(self) -> None:
+        if self.__token_renewal_handle is not None:
+            self.__token_renewal_handle.cancel()
+            self.__token_renewal_handle = None
+        if self.__token_renewal_task is not None:
+            self.__token_renewal_task.cancel()
+            self.__token_renewal_task = None
+
+    async def __renew_login(self, *, expired_token: SecretStr | None) -> None:
+        """Login again, unless another request already renewed the expired token while we were waiting."""
+
+        async with self.__login_lock:
+            if self.__storage["auth_token"] is not None and self.__storage["auth_token"] != expired_token:
+                return
+
+            await self.login(
+                username=self.__storage["username"] or "",
+                password=self.__storage["password"] or SecretStr(""),
+            )
+
     async def logout(self) -> None:
+        self.__cancel_token_renewal()
+
         if self.__storage["auth_token"] is None:
             return
 
@@ -119,6 +272,8 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
         self.__storage["auth_token"] = None
         self.__storage["default_site_id"] = None
 
+        self.clear_conditional_cache()
+
     async def send_request(
         self,
         *,
@@ -129,15 +284,21 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
         headers: dict[str, str] | None = None,
         **kwargs: Any,
     ) -> HttpClientResponse[TData]:
-        """Send http requests to Voltalis."""
+        """Send http requests to Voltalis.
+
+        With a rate limiter, the request waits for a token of its priority lane: the reads are background requests
+        and the authentication and the writes interactive ones by default.
+        """
 
         can_retry = kwargs.pop("can_retry", True)
+        priority = kwargs.pop("priority", None) or (
+            HttpPriorityEnum.BACKGROUND
+            if method.upper() in ("GET", "HEAD") and kwargs.get("route_class") != HttpRouteClassEnum.AUTH
+            else HttpPriorityEnum.INTERACTIVE
+        )
 
         if self.__storage["auth_token"] is None and url != VoltalisClientAiohttp.LOGIN_ROUTE:
-            await self.login(
-                username=self.__storage["username"] or "",
-                password=self.__storage["password"] or SecretStr(""),
-            )
+            await self.__renew_login(expired_token=None)
 
         headers = {
             **{
@@ -146,20 +307,16 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
             },
             **(headers or {}),
         }
-        if self.__storage["auth_token"] is not None:
-            headers["Authorization"] = f"Bearer {self.__storage['auth_token'].get_secret_value()}"
-
-        _url = url
-        if self.__storage["default_site_id"] is not None:
-            _url = url.format(site_id=self.__storage["default_site_id"])
 
+        auth_token = self.__storage["auth_token"]
         try:
-            response: HttpClientResponse[TData] = await super().send_request(
-                url=_url,
+            response: HttpClientResponse[TData] = await self.__send_authenticated_request(
+                url=url,
                 method=method,
                 body=body,
                 query_params=query_params,
                 headers=headers,
+                priority=priority,
                 **kwargs,
             )
         except HttpClientException as ex:
@@ -168,19 +325,52 @@ class VoltalisClientAiohttp(HttpClientAiohttp):
 
             self.__logger.warning("Authentication failed (401), retrying with new login...")
             try:
-                await self.login(
-                    username=self.__storage["username"] or "",
-                    password=self.__storage["password"] or SecretStr(""),
-                )
+                await self.__renew_login(expired_token=auth_token)
             except Exception as login_ex:
                 self.__logger.error("Re-login failed during retry after 401: %s", login_ex)
-            response = await super().send_request(
-                url=_url,
+            response = await self.__send_authenticated_request(
+                url=url,
                 method=method,
                 body=body,
                 query_params=query_params,
                 headers=headers,
+                priority=priority,
                 **kwargs,
             )
 
         return response
+
+    async def __send_authenticated_request(
+        self,
+        *,
+        url: str,
+        method: str,
+        body: Any | None,
+        query_params: dict[str, str] | None,
+        headers: dict[str, str],
+        priority: HttpPriorityEnum,
+        **kwargs: Any,
+    ) -> HttpClientResponse[TData]:
+        """Send the request with the current token and site id, once the rate limiter let it through."""
+
+        if self.__rate_limiter is not None:
+            queue_time = await self.__rate_limiter.acquire(priority)
+            if queue_time > 0:
+                self.__logger.debug("%s %s waited %.2fs in the %s lane", method, url, queue_time, priority)
+
+        headers = dict(headers)
+        if self.__storage["auth_token"] is not None:
+            headers["Authorization"] = f"Bearer {self.__storage['auth_token'].get_secret_value()}"
+
+        _url = url
+        if self.__storage["default_site_id"] is not None:
+            _url = url.format(site_id=self.__storage["default_site_id"])
+
+        return await super().send_request(
+            url=_url,
+            method=method,
+            body=body,
+            query_params=query_params,
+            headers=headers,
+            **kwargs,
+        )
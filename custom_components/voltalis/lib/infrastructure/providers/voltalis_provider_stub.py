@@ -4,6 +4,9 @@ from custom_components.voltalis.lib.domain.devices_management.climates.manual_se
     ManualSetting,
     ManualSettingUpdate,
 )
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device import Device
 from custom_components.voltalis.lib.domain.devices_management.health.device_health import DeviceHealth
 from custom_components.voltalis.lib.domain.energy_contracts.energy_contract import EnergyContract
@@ -22,6 +25,8 @@ class VoltalisProviderStub(VoltalisProvider):
         self._live_consumption = LiveConsumption(consumption=0.0)
         self._devices_consumptions: dict[int, list[tuple[datetime, float]]] = {}
         self._manual_settings: dict[int, ManualSetting] = {}
+        self._manual_settings_error: Exception | None = None
+        self._manual_setting_writes: list[tuple[int, ManualSettingUpdate]] = []
         self._energy_contracts: dict[int, EnergyContract] = {}
         self._programs: dict[int, Program] = {}
 
@@ -40,6 +45,12 @@ class VoltalisProviderStub(VoltalisProvider):
     def set_manual_settings(self, manual_settings: list[ManualSetting]) -> None:
         self._manual_settings = {manual_setting.id: manual_setting for manual_setting in manual_settings}
 
+    def set_manual_settings_error(self, error: Exception | None) -> None:
+        self._manual_settings_error = error
+
+    def get_manual_setting_writes(self) -> list[tuple[int, ManualSettingUpdate]]:
+        return list(self._manual_setting_writes)
+
     def set_energy_contracts(self, energy_contracts: list[EnergyContract]) -> None:
         self._energy_contracts = {energy_contract.id: energy_contract for energy_contract in energy_contracts}
 
@@ -59,21 +70,24 @@ class VoltalisProviderStub(VoltalisProvider):
     async def get_live_consumption(self) -> LiveConsumption:
         return self._live_consumption
 
-    async def get_devices_daily_consumptions(self, target_date: date) -> dict[int, list[tuple[datetime, float]]]:
+    async def get_devices_daily_consumptions(self, target_date: date) -> dict[int, ConsumptionSeries]:
         devices_consumptions = {
-            device_id: [
+            device_id: ConsumptionSeries.from_records(
                 (consumption_date, consumption_value)
                 for (consumption_date, consumption_value) in consumption_records
                 if consumption_date.date() == target_date
-            ]
+            )
             for device_id, consumption_records in self._devices_consumptions.items()
         }
         return devices_consumptions
 
     async def get_manual_settings(self) -> dict[int, ManualSetting]:
+        if self._manual_settings_error is not None:
+            raise self._manual_settings_error
         return {manual_setting.id_appliance: manual_setting for manual_setting in self._manual_settings.values()}
 
     async def set_manual_setting(self, manual_setting_id: int, setting: ManualSettingUpdate) -> None:
+        self._manual_setting_writes.append((manual_setting_id, setting))
         existing_setting = self._manual_settings[manual_setting_id]
         updated_setting = existing_setting.model_copy(update=setting.model_dump(exclude_unset=True))
         self._manual_settings[manual_setting_id] = updated_setting
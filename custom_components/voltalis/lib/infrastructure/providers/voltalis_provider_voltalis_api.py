@@ -1,14 +1,17 @@
 import asyncio
 import logging
-from datetime import date, datetime
-from typing import cast
+from datetime import date, timedelta
+from typing import Any, Iterable, cast
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting import (
     ManualSetting,
     ManualSettingUpdate,
 )
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
 from custom_components.voltalis.lib.domain.devices_management.devices.device import Device
 from custom_components.voltalis.lib.domain.devices_management.devices.device_enum import DeviceModeEnum
 from custom_components.voltalis.lib.domain.devices_management.health.device_health import DeviceHealth
@@ -20,6 +23,8 @@ from custom_components.voltalis.lib.domain.shared.exceptions import (
     VoltalisConnectionException,
     VoltalisValidationException,
 )
+from custom_components.voltalis.lib.domain.shared.providers.consumption_cache import ConsumptionCache
+from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.http_client import (
     HttpClient,
     HttpClientException,
@@ -33,6 +38,7 @@ from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_de
 )
 from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device_consumption import (
     VoltalisConsumptionDto,
+    VoltalisConsumptionDtoDevice,
 )
 from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device_health import (
     VoltalisDeviceHealthDto,
@@ -51,15 +57,65 @@ from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_re
 from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_subscriber_contract import (
     VoltalisSubscriberContractDto,
 )
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_type_adapters import (
+    CONSUMPTION_ADAPTER,
+    CONSUMPTION_RECORDS_ADAPTER,
+    DEVICES_ADAPTER,
+    DEVICES_HEALTH_ADAPTER,
+    MANUAL_SETTINGS_ADAPTER,
+    PROGRAMS_ADAPTER,
+    REALTIME_CONSUMPTION_ADAPTER,
+    SUBSCRIBER_CONTRACTS_ADAPTER,
+)
+from custom_components.voltalis.lib.infrastructure.providers.http_timeout import HttpRouteClassEnum
 
 
 class VoltalisProviderVoltalisApi(VoltalisProvider):
     """Provider for Voltalis data access using the Voltalis API client."""
 
-    def __init__(self, *, http_client: HttpClient) -> None:
+    # Number of days whose consumption steps are kept to only validate the new steps on the next fetch
+    STORED_CONSUMPTION_DAYS = 2
+    # Number of days after which the consumption of a day is complete and is cached
+    CACHED_CONSUMPTION_DELAY = timedelta(days=2)
+
+    def __init__(
+        self,
+        *,
+        http_client: HttpClient,
+        date_provider: DateProvider | None = None,
+        consumption_cache: ConsumptionCache | None = None,
+    ) -> None:
         self._client = http_client
+        self.__date_provider = date_provider
+        self.__consumption_cache = consumption_cache
         self.__logger = logging.getLogger(__name__)
 
+        # Consumption steps already validated, keyed by the url of the day then by device,
+        # with the raw timestamp and consumption of the records they were validated from
+        self.__stored_consumptions: dict[str, dict[int, tuple[list[Any], ConsumptionSeries]]] = {}
+        self.__consumption_bytes_received = 0
+        self.__consumption_records_parsed = 0
+        self.__consumption_records_reused = 0
+
+    @property
+    def consumption_bytes_received(self) -> int:
+        """Number of bytes received by the daily consumption requests."""
+        return self.__consumption_bytes_received
+
+    @property
+    def consumption_records_parsed(self) -> int:
+        """Number of daily consumption records validated."""
+        return self.__consumption_records_parsed
+
+    @property
+    def consumption_records_reused(self) -> int:
+        """Number of daily consumption records taken from the steps already validated."""
+        return self.__consumption_records_reused
+
+    def clear_stored_consumptions(self) -> None:
+        """Forget the consumption steps already validated."""
+        self.__stored_consumptions.clear()
+
     async def get_devices(self) -> dict[int, Device]:
         response: HttpClientResponse[list[dict]]
         try:
@@ -72,7 +128,7 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         parsed_devices: list[VoltalisDeviceDto]
         try:
-            parsed_devices = TypeAdapter(list[VoltalisDeviceDto]).validate_python(response.data)
+            parsed_devices = DEVICES_ADAPTER.validate_python(response.data)
         except ValidationError as err:
             self.__logger.error("Error parsing health: %s", err)
             raise VoltalisValidationException(*err.args) from err
@@ -93,7 +149,7 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         parsed_devices_health: list[VoltalisDeviceHealthDto]
         try:
-            parsed_devices_health = TypeAdapter(list[VoltalisDeviceHealthDto]).validate_python(response.data)
+            parsed_devices_health = DEVICES_HEALTH_ADAPTER.validate_python(response.data)
         except ValidationError as err:
             self.__logger.error("Error parsing health: %s", err)
             raise VoltalisValidationException(*err.args) from err
@@ -117,7 +173,7 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         parsed_realtime_consumption: VoltalisRealtimeConsumptionDto
         try:
-            parsed_realtime_consumption = TypeAdapter(VoltalisRealtimeConsumptionDto).validate_python(response.data)
+            parsed_realtime_consumption = REALTIME_CONSUMPTION_ADAPTER.validate_python(response.data)
         except ValidationError as err:
             self.__logger.error("Error parsing realtime consumption: %s", err)
             raise VoltalisValidationException(*err.args) from err
@@ -129,7 +185,31 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         return LiveConsumption(consumption=live_consumption)
 
-    async def get_devices_daily_consumptions(self, target_date: date) -> dict[int, list[tuple[datetime, float]]]:
+    async def get_devices_daily_consumptions(self, target_date: date) -> dict[int, ConsumptionSeries]:
+        # The consumption of a past day never changes once complete, it is read from the cache
+        consumption_cache = self.__consumption_cache if self.__is_consumption_complete(target_date) else None
+        if consumption_cache is not None:
+            cached_consumptions = await consumption_cache.get_day(target_date)
+            if cached_consumptions is not None:
+                self.__logger.debug("Consumptions of %s read from the cache", target_date)
+                return cached_consumptions
+
+        devices_consumptions = await self.__fetch_devices_daily_consumptions(target_date)
+
+        if consumption_cache is not None and devices_consumptions:
+            await consumption_cache.set_day(target_date, devices_consumptions)
+
+        return devices_consumptions
+
+    def __is_consumption_complete(self, target_date: date) -> bool:
+        """Check if the consumption of a day is complete, the last steps of a day are received late."""
+
+        if self.__date_provider is None:
+            return False
+        today = self.__date_provider.get_now().date()
+        return target_date <= today - VoltalisProviderVoltalisApi.CACHED_CONSUMPTION_DELAY
+
+    async def __fetch_devices_daily_consumptions(self, target_date: date) -> dict[int, ConsumptionSeries]:
         # Fetch the data from the voltalis API
         target_date_str = target_date.isoformat()
 
@@ -138,27 +218,95 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
             response = await self._client.send_request(
                 url=f"/api/site/{{site_id}}/consumption/day/{target_date_str}/full-data",
                 method="GET",
+                route_class=HttpRouteClassEnum.LARGE_READ,
             )
         except HttpClientException as err:
             raise VoltalisConnectionException("Error connecting to Voltalis API") from err
 
-        parsed_consumption: VoltalisConsumptionDto
+        # The url of the response identifies the site and the day
+        stored_consumptions = self.__stored_consumptions.pop(response.url, {})
+        records_parsed = 0
+        records_reused = 0
+
+        per_appliance = response.data.get("perAppliance") if isinstance(response.data, dict) else None
+        devices_consumptions: dict[int, ConsumptionSeries] = {}
         try:
-            parsed_consumption = TypeAdapter(VoltalisConsumptionDto).validate_python(response.data)
-        except ValidationError as err:
+            if isinstance(per_appliance, dict):
+                for raw_device_id, raw_records in per_appliance.items():
+                    device_id = int(raw_device_id)
+                    stored_consumptions[device_id], parsed_count = self.__merge_consumption_records(
+                        raw_records, stored_consumptions.get(device_id)
+                    )
+                    devices_consumptions[device_id] = stored_consumptions[device_id][1]
+                    records_parsed += parsed_count
+                    records_reused += len(raw_records) - parsed_count
+            else:
+                # Unexpected payload, validated as a whole to report the error
+                parsed_consumption: VoltalisConsumptionDto = CONSUMPTION_ADAPTER.validate_python(response.data)
+                for device_id, device_consumptions in parsed_consumption.per_appliance.items():
+                    devices_consumptions[device_id] = self.__to_series(device_consumptions)
+                    records_parsed += len(device_consumptions)
+        except (ValidationError, ValueError, TypeError) as err:
             self.__logger.error("Error parsing consumptions: %s", err)
             raise VoltalisValidationException(*err.args) from err
 
-        devices_consumptions = {
-            device_id: [
-                (consumption_record.step_timestamp_on_site, consumption_record.total_consumption_in_wh)
-                for consumption_record in device_consumptions
-                if consumption_record.step_timestamp_on_site.date() == target_date
-            ]
-            for device_id, device_consumptions in parsed_consumption.per_appliance.items()
-        }
+        # Keep the steps of the latest days only, the older days are not fetched again
+        self.__stored_consumptions[response.url] = stored_consumptions
+        while len(self.__stored_consumptions) > VoltalisProviderVoltalisApi.STORED_CONSUMPTION_DAYS:
+            del self.__stored_consumptions[next(iter(self.__stored_consumptions))]
+
+        self.__consumption_bytes_received += response.size or 0
+        self.__consumption_records_parsed += records_parsed
+        self.__consumption_records_reused += records_reused
+        self.__logger.debug(
+            "Consumptions of %s: %s bytes, %s records parsed, %s records reused",
+            target_date_str,
+            response.size,
+            records_parsed,
+            records_reused,
+        )
 
-        return devices_consumptions
+        # The steps of the other days are cut on the local date of each step, a DST day lasts 23 or 25 hours
+        return {device_id: series.on_day(target_date) for device_id, series in devices_consumptions.items()}
+
+    @staticmethod
+    def __merge_consumption_records(
+        raw_records: list[Any],
+        stored: tuple[list[Any], ConsumptionSeries] | None,
+    ) -> tuple[tuple[list[Any], ConsumptionSeries], int]:
+        """Validate the raw records of a device into a series, the steps already validated are reused.
+
+        The new steps are appended after the stored ones, which are reused up to the first raw record whose timestamp
+        or consumption differs, so a step still in progress or corrected by the server is validated again.
+        Returns the raw keys of the records with their series, and the number of validated records.
+        """
+
+        raw_keys = [
+            (raw_record.get("stepTimestampOnSite"), raw_record.get("totalConsumptionInWh"))
+            if isinstance(raw_record, dict)
+            else None
+            for raw_record in raw_records
+        ]
+        stored_keys, stored_series = stored if stored is not None else ([], ConsumptionSeries())
+
+        reused_count = 0
+        for raw_key, stored_key in zip(raw_keys, stored_keys):
+            if raw_key is None or raw_key != stored_key:
+                break
+            reused_count += 1
+
+        new_records = CONSUMPTION_RECORDS_ADAPTER.validate_python(raw_records[reused_count:])
+        series = ConsumptionSeries.concat(
+            stored_series[:reused_count], VoltalisProviderVoltalisApi.__to_series(new_records)
+        )
+        return (raw_keys, series), len(new_records)
+
+    @staticmethod
+    def __to_series(records: Iterable[VoltalisConsumptionDtoDevice]) -> ConsumptionSeries:
+        """Get the series of validated consumption records."""
+        return ConsumptionSeries.from_records(
+            (record.step_timestamp_on_site, record.total_consumption_in_wh) for record in records
+        )
 
     async def get_manual_settings(self) -> dict[int, ManualSetting]:
         response: HttpClientResponse[list[dict]]
@@ -172,7 +320,7 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         parsed_manual_settings: list[VoltalisManualSettingDto]
         try:
-            parsed_manual_settings = TypeAdapter(list[VoltalisManualSettingDto]).validate_python(response.data)
+            parsed_manual_settings = MANUAL_SETTINGS_ADAPTER.validate_python(response.data)
         except ValidationError as err:
             self.__logger.error("Error parsing manual settings: %s", err)
             raise VoltalisValidationException(*err.args) from err
@@ -205,6 +353,8 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
                 url=f"/api/site/{{site_id}}/manualsetting/{manual_setting_id}",
                 method="PUT",
                 body=payload,
+                # The whole setting is sent, sending it again gives the same result
+                idempotent=True,
             )
         except HttpClientException as err:
             raise VoltalisConnectionException("Error connecting to Voltalis API") from err
@@ -219,7 +369,7 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
 
         parsed_contracts: list[VoltalisSubscriberContractDto]
         try:
-            parsed_contracts = TypeAdapter(list[VoltalisSubscriberContractDto]).validate_python(response.data)
+            parsed_contracts = SUBSCRIBER_CONTRACTS_ADAPTER.validate_python(response.data)
         except ValidationError as err:
             self.__logger.exception("Failed to parse subscriber contracts")
             raise VoltalisValidationException("Failed to parse subscriber contracts") from err
@@ -250,8 +400,8 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
         parsed_quick_programs: list[VoltalisProgramDto]
         parsed_user_programs: list[VoltalisProgramDto]
         try:
-            parsed_quick_programs = TypeAdapter(list[VoltalisProgramDto]).validate_python(quick_programs_response.data)
-            parsed_user_programs = TypeAdapter(list[VoltalisProgramDto]).validate_python(user_programs_response.data)
+            parsed_quick_programs = PROGRAMS_ADAPTER.validate_python(quick_programs_response.data)
+            parsed_user_programs = PROGRAMS_ADAPTER.validate_python(user_programs_response.data)
         except ValidationError as err:
             self.__logger.error("Error parsing programs: %s", err)
             raise VoltalisValidationException(*err.args) from err
@@ -283,6 +433,8 @@ class VoltalisProviderVoltalisApi(VoltalisProvider):
                 url=url,
                 method="PUT",
                 body=payload,
+                # The enabled state is sent, sending it again gives the same result
+                idempotent=True,
             )
         except HttpClientException as err:
             raise VoltalisConnectionException("Error connecting to Voltalis API") from err
@@ -0,0 +1,162 @@
+"""Unit tests for ConsumptionCachePersistent."""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.infrastructure.providers.consumption_cache_persistent import (
+    ConsumptionCachePersistent,
+)
+from custom_components.voltalis.lib.infrastructure.providers.date_provider_stub import DateProviderStub
+
+NOW = datetime(2024, 11, 30, 12, 0, 0)
+
+
+class InMemoryStore:
+    """Store of the cache data, as persisted between two runs."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] | None = None
+        self.saves_count = 0
+
+    async def load(self) -> dict[str, Any] | None:
+        return self.data
+
+    def save(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self.saves_count += 1
+
+
+def build_cache(
+    store: InMemoryStore,
+    *,
+    retention_days: int = 30,
+    max_size: int = 1024 * 1024,
+) -> ConsumptionCachePersistent:
+    """Build a cache persisted in the given store."""
+
+    date_provider = DateProviderStub()
+    date_provider.now = NOW
+    return ConsumptionCachePersistent(
+        date_provider=date_provider,
+        load=store.load,
+        save=store.save,
+        retention_days=retention_days,
+        max_size=max_size,
+    )
+
+
+def build_day(day: date, *, tz: timezone | None = None) -> dict[int, ConsumptionSeries]:
+    """Build the hourly consumption of two devices over a day."""
+
+    start = datetime(day.year, day.month, day.day, tzinfo=tz)
+    return {
+        1: ConsumptionSeries.from_records((start + timedelta(hours=hour), hour * 10.5) for hour in range(24)),
+        2: ConsumptionSeries.from_records((start + timedelta(hours=hour), 0.25) for hour in range(24)),
+    }
+
+
+@pytest.mark.unit
+async def test_consumption_cache_round_trip() -> None:
+    """Test that a cached day is read back after a restart, with naive and aware timestamps."""
+
+    store = InMemoryStore()
+    naive_day = build_day(date(2024, 11, 20))
+    aware_day = build_day(date(2024, 11, 21), tz=timezone(timedelta(hours=1)))
+
+    cache = build_cache(store)
+    await cache.set_day(date(2024, 11, 20), naive_day)
+    await cache.set_day(date(2024, 11, 21), aware_day)
+
+    # A new cache loads the persisted days
+    cache = build_cache(store)
+    assert await cache.get_day(date(2024, 11, 20)) == naive_day
+    assert await cache.get_day(date(2024, 11, 21)) == aware_day
+    assert await cache.get_day(date(2024, 11, 22)) is None
+    assert store.saves_count == 2
+
+    # A single utc offset is stored for the steps of an aware series
+    assert store.data is not None
+    assert "offset" not in store.data["days"]["2024-11-20"]["1"]
+    assert store.data["days"]["2024-11-21"]["1"]["offset"] == "3600"
+
+
+@pytest.mark.unit
+async def test_consumption_cache_round_trip_on_dst_day() -> None:
+    """Test that the steps of the day the summer time ends are read back with the utc offset of each step."""
+
+    store = InMemoryStore()
+    summer_time = timezone(timedelta(hours=2))
+    winter_time = timezone(timedelta(hours=1))
+    records = [
+        (datetime(2024, 10, 27, 2, 0, tzinfo=summer_time), 1.0),
+        (datetime(2024, 10, 27, 2, 0, tzinfo=winter_time), 2.0),
+        (datetime(2024, 10, 27, 23, 0, tzinfo=winter_time), 3.0),
+    ]
+    dst_day = {1: ConsumptionSeries.from_records(records)}
+
+    await build_cache(store, retention_days=60).set_day(date(2024, 10, 27), dst_day)
+    result = await build_cache(store, retention_days=60).get_day(date(2024, 10, 27))
+
+    assert result == dst_day
+    assert result is not None
+    assert [step.utcoffset() for step, _ in result[1]] == [step.utcoffset() for step, _ in records]
+    assert store.data is not None
+    assert "offset" not in store.data["days"]["2024-10-27"]["1"]
+
+
+@pytest.mark.unit
+async def test_consumption_cache_stores_float32() -> None:
+    """Test that the consumptions are stored as float32."""
+
+    store = InMemoryStore()
+    cache = build_cache(store)
+
+    await cache.set_day(date(2024, 11, 20), {1: ConsumptionSeries.from_records([(datetime(2024, 11, 20), 0.1)])})
+    result = await cache.get_day(date(2024, 11, 20))
+
+    assert result is not None
+    assert result[1][0][1] == pytest.approx(0.1, rel=1e-6)
+
+
+@pytest.mark.unit
+async def test_consumption_cache_drops_days_out_of_retention() -> None:
+    """Test that the days older than the retention are neither stored nor kept."""
+
+    store = InMemoryStore()
+    cache = build_cache(store, retention_days=10)
+
+    await cache.set_day(date(2024, 11, 1), build_day(date(2024, 11, 1)))
+    assert await cache.get_day(date(2024, 11, 1)) is None
+    assert store.saves_count == 0
+
+    # A day stored with a longer retention is dropped on the next write
+    await build_cache(store, retention_days=30).set_day(date(2024, 11, 1), build_day(date(2024, 11, 1)))
+    cache = build_cache(store, retention_days=10)
+    await cache.set_day(date(2024, 11, 25), build_day(date(2024, 11, 25)))
+
+    assert store.data is not None
+    assert list(store.data["days"]) == ["2024-11-25"]
+
+
+@pytest.mark.unit
+async def test_consumption_cache_evicts_oldest_days_over_max_size() -> None:
+    """Test that the oldest days are evicted when the cache is over its maximum size."""
+
+    store = InMemoryStore()
+    cache = build_cache(store)
+    await cache.set_day(date(2024, 11, 20), build_day(date(2024, 11, 20)))
+    day_size = cache.size
+
+    cache = build_cache(store, max_size=2 * day_size)
+    for day in [date(2024, 11, 21), date(2024, 11, 22)]:
+        await cache.set_day(day, build_day(day))
+
+    assert await cache.get_day(date(2024, 11, 20)) is None
+    assert await cache.get_day(date(2024, 11, 21)) is not None
+    assert await cache.get_day(date(2024, 11, 22)) is not None
+    assert cache.size <= 2 * day_size
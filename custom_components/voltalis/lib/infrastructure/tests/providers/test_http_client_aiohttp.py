@@ -0,0 +1,331 @@
+import logging
+from typing import AsyncGenerator
+
+import pytest
+from aiohttp import ClientSession, ClientTimeout
+
+from custom_components.voltalis.lib.domain.shared.providers.http_client import HttpClientException, HttpClientResponse
+from custom_components.voltalis.lib.infrastructure.providers.http_client_aiohttp import HttpClientAiohttp
+from custom_components.voltalis.lib.infrastructure.providers.http_retry_policy import HttpRetryPolicy
+from custom_components.voltalis.lib.infrastructure.providers.http_timeout import HttpRouteClassEnum, HttpTimeout
+from custom_components.voltalis.tests.utils.base_fixture import BaseFixture
+from custom_components.voltalis.tests.utils.mock_http_server import MockHttpServer
+
+
+@pytest.mark.integration
+async def test_conditional_cache_returns_cached_response_on_304(fixture: "HttpClientFixture") -> None:
+    """Test a 304 response is turned into the cached response."""
+
+    # Arrange
+    fixture.given_resource_with_etag(etag='"v1"', data={"value": 1})
+
+    # Act
+    first: HttpClientResponse[dict] = await fixture.client.send_request(url="/resource", method="GET")
+    second: HttpClientResponse[dict] = await fixture.client.send_request(url="/resource", method="GET")
+
+    # Assert
+    assert first.data == {"value": 1}
+    assert first.size == len('{"value": 1}')
+    assert second.data == {"value": 1}
+    assert fixture.received_etags == [None, '"v1"']
+    assert fixture.client.conditional_cache_hits == 1
+    assert fixture.client.conditional_cache_misses == 1
+
+
+@pytest.mark.integration
+async def test_conditional_cache_refreshes_on_new_etag(fixture: "HttpClientFixture") -> None:
+    """Test the cached response is replaced when the resource changed."""
+
+    # Arrange
+    fixture.given_resource_with_etag(etag='"v1"', data={"value": 1})
+    await fixture.client.send_request(url="/resource", method="GET")
+    fixture.given_resource_with_etag(etag='"v2"', data={"value": 2})
+
+    # Act
+    response: HttpClientResponse[dict] = await fixture.client.send_request(url="/resource", method="GET")
+
+    # Assert
+    assert response.data == {"value": 2}
+    assert fixture.received_etags == [None, '"v1"']
+    assert fixture.client.conditional_cache_hits == 0
+    assert fixture.client.conditional_cache_misses == 2
+
+
+@pytest.mark.integration
+async def test_conditional_cache_is_keyed_on_query_params(fixture: "HttpClientFixture") -> None:
+    """Test requests with different query params don't share the same cached response."""
+
+    # Arrange
+    fixture.given_resource_with_etag(etag='"v1"', data={"value": 1})
+    await fixture.client.send_request(url="/resource", method="GET", query_params={"page": "1"})
+
+    # Act
+    await fixture.client.send_request(url="/resource", method="GET", query_params={"page": "2"})
+
+    # Assert
+    assert fixture.received_etags == [None, None]
+    assert fixture.client.conditional_cache_hits == 0
+
+
+@pytest.mark.integration
+async def test_conditional_cache_drops_the_least_recently_used_responses(fixture: "HttpClientFixture") -> None:
+    """Test the conditional cache keeps at most its max size of responses."""
+
+    # Arrange
+    fixture.given_resource_with_etag(etag='"v1"', data={"value": 1})
+    client = HttpClientAiohttp(
+        session=fixture.client_session,
+        base_url=fixture.server.get_full_url(),
+        use_conditional_cache=True,
+        conditional_cache_max_size=2,
+    )
+    for page in ["1", "2", "1", "3"]:
+        await client.send_request(url="/resource", method="GET", query_params={"page": page})
+
+    # Act
+    await client.send_request(url="/resource", method="GET", query_params={"page": "1"})
+    await client.send_request(url="/resource", method="GET", query_params={"page": "2"})
+
+    # Assert
+    assert fixture.received_etags == [None, None, '"v1"', None, '"v1"', None]
+    assert client.conditional_cache_hits == 2
+
+
+@pytest.mark.integration
+async def test_retry_on_transient_errors(fixture: "HttpClientFixture") -> None:
+    """Test an idempotent request is sent again after a server error and a connection reset."""
+
+    # Arrange
+    # aiohttp already sends the GET requests again once on a connection reset, not the POST ones
+    fixture.given_resource(data={"value": 1}, method="POST")
+    fixture.server.inject_faults(
+        url="/resource",
+        method="POST",
+        faults=[MockHttpServer.Fault(status_code=502), MockHttpServer.Fault(disconnect=True)],
+    )
+
+    # Act
+    response: HttpClientResponse[dict] = await fixture.retrying_client.send_request(
+        url="/resource", method="POST", body={}, idempotent=True
+    )
+
+    # Assert
+    assert response.data == {"value": 1}
+    assert fixture.server.get_requests_count() == {"POST /resource": 3}
+    assert fixture.retrying_client.retries_count == 2
+
+
+@pytest.mark.integration
+async def test_retry_get_on_timeout(fixture: "HttpClientFixture") -> None:
+    """Test a GET is sent again after a timeout."""
+
+    # Arrange
+    fixture.given_resource(data={"value": 1})
+    timeout_fault = MockHttpServer.Fault(delay=0.3, disconnect=True)
+    fixture.server.inject_faults(url="/resource", method="GET", faults=[timeout_fault])
+
+    # Act
+    response: HttpClientResponse[dict] = await fixture.slow_retrying_client.send_request(
+        url="/resource", method="GET", timeout=ClientTimeout(total=0.1)
+    )
+
+    # Assert
+    assert response.data == {"value": 1}
+    assert fixture.slow_retrying_client.retries_count == 1
+
+
+@pytest.mark.integration
+async def test_retry_get_on_connection_reset(fixture: "HttpClientFixture") -> None:
+    """Test a GET is sent again after more connection resets than aiohttp sends it again by itself."""
+
+    # Arrange
+    # aiohttp sends the GET requests again once on a connection reset, the second reset reaches the retry policy
+    fixture.given_resource(data={"value": 1})
+    fixture.server.inject_faults(url="/resource", method="GET", faults=[MockHttpServer.Fault(disconnect=True)] * 2)
+
+    # Act
+    response: HttpClientResponse[dict] = await fixture.retrying_client.send_request(url="/resource", method="GET")
+
+    # Assert
+    assert response.data == {"value": 1}
+    assert fixture.server.get_requests_count() == {"GET /resource": 3}
+    assert fixture.retrying_client.retries_count == 1
+
+
+@pytest.mark.integration
+async def test_retry_gives_up_after_max_attempts(fixture: "HttpClientFixture") -> None:
+    """Test the last error is raised once all the attempts failed, and client errors are not retried."""
+
+    # Arrange
+    fixture.given_resource(data={"value": 1})
+    fixture.server.inject_faults(url="/resource", method="GET", faults=[MockHttpServer.Fault(status_code=503)] * 3)
+
+    # Act
+    with pytest.raises(HttpClientException) as server_error:
+        await fixture.retrying_client.send_request(url="/resource", method="GET")
+    fixture.server.inject_faults(url="/resource", method="GET", faults=[MockHttpServer.Fault(status_code=404)])
+    with pytest.raises(HttpClientException) as client_error:
+        await fixture.retrying_client.send_request(url="/resource", method="GET")
+
+    # Assert
+    assert server_error.value.response is not None and server_error.value.response.status == 503
+    assert client_error.value.response is not None and client_error.value.response.status == 404
+    assert fixture.server.get_requests_count() == {"GET /resource": 4}
+
+
+@pytest.mark.integration
+async def test_retry_put_only_when_idempotent(fixture: "HttpClientFixture") -> None:
+    """Test a PUT is sent once, unless it is marked idempotent."""
+
+    # Arrange
+    fixture.given_resource(data={"value": 1}, method="PUT")
+    fixture.server.inject_faults(url="/resource", method="PUT", faults=[MockHttpServer.Fault(status_code=502)] * 2)
+
+    # Act
+    with pytest.raises(HttpClientException):
+        await fixture.retrying_client.send_request(url="/resource", method="PUT", body={"value": 1})
+    response: HttpClientResponse[dict] = await fixture.retrying_client.send_request(
+        url="/resource", method="PUT", body={"value": 1}, idempotent=True
+    )
+
+    # Assert
+    assert response.data == {"value": 1}
+    assert fixture.server.get_requests_count() == {"PUT /resource": 3}
+
+
+@pytest.mark.integration
+async def test_retry_stops_at_deadline(fixture: "HttpClientFixture") -> None:
+    """Test no new attempt starts when the backoff would end after the deadline of the request."""
+
+    # Arrange
+    client = HttpClientAiohttp(
+        session=fixture.client_session,
+        base_url=fixture.server.get_full_url(),
+        retry_policy=HttpRetryPolicy(base_delay=1.0, deadline=0.5, get_random=lambda: 1.0),
+    )
+    fixture.given_resource(data={"value": 1})
+    fixture.server.inject_faults(url="/resource", method="GET", faults=[MockHttpServer.Fault(status_code=503)])
+
+    # Act
+    with pytest.raises(HttpClientException):
+        await client.send_request(url="/resource", method="GET")
+
+    # Assert
+    assert fixture.server.get_requests_count() == {"GET /resource": 1}
+    assert client.retries_count == 0
+
+
+@pytest.mark.integration
+async def test_timeouts_of_the_route_class(fixture: "HttpClientFixture") -> None:
+    """Test each request is bounded by the timeouts of its route class, and the exceeded timeouts are counted."""
+
+    # Arrange
+    client = HttpClientAiohttp(
+        session=fixture.client_session,
+        base_url=fixture.server.get_full_url(),
+        timeouts={
+            HttpRouteClassEnum.SMALL_READ: HttpTimeout(connect=1.0, read=0.1, total=1.0),
+            HttpRouteClassEnum.LARGE_READ: HttpTimeout(connect=1.0, read=1.0, total=2.0),
+        },
+    )
+    fixture.given_resource(data={"value": 1})
+    slow_faults = [MockHttpServer.Fault(delay=0.3, disconnect=True), MockHttpServer.Fault(delay=0.3)]
+    fixture.server.inject_faults(url="/resource", method="GET", faults=slow_faults)
+
+    # Act
+    with pytest.raises(HttpClientException) as timeout_error:
+        await client.send_request(url="/resource", method="GET")
+    response: HttpClientResponse[dict] = await client.send_request(
+        url="/resource", method="GET", route_class=HttpRouteClassEnum.LARGE_READ
+    )
+
+    # Assert
+    assert timeout_error.value.response is None
+    assert response.data == {"value": 1}
+    assert client.timeouts_count == {HttpRouteClassEnum.SMALL_READ: 1}
+
+
+class HttpClientFixture(BaseFixture):
+    """HttpClientAiohttp fixture."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.logger = logging.getLogger("HttpClientFixture")
+        self.server = MockHttpServer(logger=self.logger)
+        self.received_etags: list[str | None] = []
+
+    async def async_before_all(self) -> None:
+        self.server.start_server()
+        self.client_session = ClientSession()
+
+    async def async_after_all(self) -> None:
+        if self.client_session is not None:
+            await self.client_session.close()
+        self.server.stop_server()
+
+    def before_each(self) -> None:
+        self.server.reset_request_handlers()
+        self.server.reset_faults()
+        self.server.reset_requests_count()
+        self.received_etags = []
+        self.client = HttpClientAiohttp(
+            session=self.client_session,
+            base_url=self.server.get_full_url(),
+            use_conditional_cache=True,
+        )
+        self.retrying_client = HttpClientAiohttp(
+            session=self.client_session,
+            base_url=self.server.get_full_url(),
+            retry_policy=HttpRetryPolicy(base_delay=0.01, max_delay=0.02),
+        )
+        # The server answers one request at a time, the retry is sent once it is done with a delayed request
+        self.slow_retrying_client = HttpClientAiohttp(
+            session=self.client_session,
+            base_url=self.server.get_full_url(),
+            retry_policy=HttpRetryPolicy(base_delay=0.4, max_delay=0.4, get_random=lambda: 1.0),
+        )
+
+    # --------------------------------------
+    # Arrange
+    # --------------------------------------
+    def given_resource(self, *, data: dict, method: str = "GET") -> None:
+        self.server.set_request_handler(
+            url="/resource",
+            method=method,
+            new_request_handler=MockHttpServer.RequestHandler(
+                handle=lambda body, config: MockHttpServer.StubResponse(status_code=200, data=data)
+            ),
+        )
+
+    def given_resource_with_etag(self, *, etag: str, data: dict) -> None:
+        def resource_handler(body: object, config: dict) -> MockHttpServer.StubResponse[dict]:
+            received_etag = config["headers"].get("If-None-Match")
+            self.received_etags.append(received_etag)
+            if received_etag == etag:
+                return MockHttpServer.StubResponse(status_code=304, headers={"ETag": etag})
+            return MockHttpServer.StubResponse(status_code=200, headers={"ETag": etag}, data=data)
+
+        self.server.set_request_handler(
+            url="/resource",
+            method="GET",
+            new_request_handler=MockHttpServer.RequestHandler(handle=resource_handler, with_headers=True),
+        )
+
+
+pytestmark = [pytest.mark.asyncio(loop_scope="module"), pytest.mark.enable_socket]
+
+
+@pytest.fixture(scope="module")
+async def fixture_all() -> AsyncGenerator[HttpClientFixture, None]:
+    """Before all tests, start the server. Then after all tests, stop the server."""
+    fixture = HttpClientFixture()
+    await fixture.async_before_all()
+    yield fixture
+    await fixture.async_after_all()
+
+
+@pytest.fixture(scope="function")
+async def fixture(fixture_all: HttpClientFixture) -> AsyncGenerator[HttpClientFixture, None]:
+    """Before each test, reset server handlers and create a new client."""
+    fixture_all.before_each()
+    yield fixture_all
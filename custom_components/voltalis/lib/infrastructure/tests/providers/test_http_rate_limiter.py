@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from custom_components.voltalis.lib.infrastructure.providers.http_rate_limiter import (
+    HttpPriorityEnum,
+    HttpRateBudget,
+    HttpRateLimiter,
+)
+
+
+@pytest.mark.unit
+async def test_rate_limiter_queues_the_requests_over_the_burst() -> None:
+    """Test the requests over the burst of a lane wait for the refill, in order."""
+
+    # Arrange
+    limiter = HttpRateLimiter(budgets={HttpPriorityEnum.BACKGROUND: HttpRateBudget(rate=20.0, burst=2)})
+
+    # Act
+    queue_times = await asyncio.gather(*(limiter.acquire(HttpPriorityEnum.BACKGROUND) for _ in range(4)))
+
+    # Assert
+    assert queue_times[:2] == [0.0, 0.0]
+    assert 0 < queue_times[2] < queue_times[3]
+    assert limiter.requests_count == {HttpPriorityEnum.BACKGROUND: 4}
+    assert limiter.queue_time[HttpPriorityEnum.BACKGROUND] == pytest.approx(sum(queue_times))
+    assert limiter.max_queue_time[HttpPriorityEnum.BACKGROUND] == queue_times[3]
+
+
+@pytest.mark.unit
+async def test_rate_limiter_interactive_requests_skip_the_background_queue() -> None:
+    """Test the interactive requests don't wait behind the background ones, and borrow their unused tokens."""
+
+    # Arrange
+    limiter = HttpRateLimiter(
+        budgets={
+            HttpPriorityEnum.INTERACTIVE: HttpRateBudget(rate=20.0, burst=1),
+            HttpPriorityEnum.BACKGROUND: HttpRateBudget(rate=20.0, burst=2),
+        }
+    )
+
+    # Act
+    interactive_queue_times = [await limiter.acquire(HttpPriorityEnum.INTERACTIVE) for _ in range(3)]
+    background_queue_time = await limiter.acquire(HttpPriorityEnum.BACKGROUND)
+
+    # Assert
+    assert interactive_queue_times == [0.0, 0.0, 0.0]
+    assert background_queue_time > 0
+    assert limiter.max_queue_time[HttpPriorityEnum.INTERACTIVE] == 0.0
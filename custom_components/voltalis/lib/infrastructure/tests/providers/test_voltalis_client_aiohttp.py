@@ -1,4 +1,8 @@
+import asyncio
+import base64
+import json
 import logging
+import time
 from typing import AsyncGenerator
 
 import pytest
@@ -7,6 +11,11 @@ from pydantic import SecretStr
 
 from custom_components.voltalis.lib.domain.shared.exceptions import VoltalisAuthenticationException
 from custom_components.voltalis.lib.domain.shared.providers.http_client import HttpClientException, HttpClientResponse
+from custom_components.voltalis.lib.infrastructure.providers.http_rate_limiter import (
+    HttpPriorityEnum,
+    HttpRateBudget,
+    HttpRateLimiter,
+)
 from custom_components.voltalis.lib.infrastructure.providers.voltalis_client_aiohttp import (
     VoltalisClientAiohttp,
 )
@@ -110,6 +119,114 @@ async def test_send_request_retries_on_401(fixture: "VoltalisClientFixture") ->
     assert fixture.state["me_calls"] == 1
 
 
+@pytest.mark.integration
+async def test_send_request_concurrent_401_logins_once(fixture: "VoltalisClientFixture") -> None:
+    """Test concurrent requests failing with a 401 share a single login and replay with the new token."""
+
+    # Arrange
+    fixture.given_login_ok(token="new-token", default_site_id="1")
+    fixture.client.storage["username"] = "user"
+    fixture.client.storage["password"] = SecretStr("pass")
+    fixture.client.storage["auth_token"] = SecretStr("stale-token")
+    fixture.client.storage["default_site_id"] = "1"
+
+    def token_handler(body: object, config: dict) -> MockHttpServer.StubResponse[dict]:
+        if config["headers"].get("Authorization") != "Bearer new-token":
+            return MockHttpServer.StubResponse(status_code=401, data={"error": "unauthorized"})
+        return MockHttpServer.StubResponse(status_code=200, data={"ok": True})
+
+    fixture.server.set_request_handler(
+        url="/api/site/{site_id}/concurrent",
+        method="GET",
+        new_request_handler=MockHttpServer.RequestHandler(handle=token_handler, with_headers=True),
+    )
+
+    # Act
+    responses: list[HttpClientResponse[dict]] = await asyncio.gather(
+        *(fixture.client.send_request(url="/api/site/{site_id}/concurrent", method="GET") for _ in range(5))
+    )
+
+    # Assert
+    assert all(response.data == {"ok": True} for response in responses)
+    assert fixture.state["login_calls"] == 1
+    assert fixture.state["me_calls"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "token,expected_expiry",
+    [
+        ("fake-token", None),
+        ("header.not-base64!.signature", None),
+        (None, None),
+        (1700000000, 1700000000.0),
+    ],
+)
+async def test_get_token_expiry(token: str | int | None, expected_expiry: float | None) -> None:
+    """Test the expiry is read from the JWT payload, when there is one."""
+
+    raw_token = token if isinstance(token, str) else make_jwt(token)
+    assert VoltalisClientAiohttp.get_token_expiry(SecretStr(raw_token)) == expected_expiry
+
+
+@pytest.mark.integration
+async def test_login_renews_token_before_expiry(fixture: "VoltalisClientFixture") -> None:
+    """Test the token is renewed in the background just before it expires."""
+
+    # Arrange
+    expiring_token = make_jwt(time.time() + VoltalisClientAiohttp.TOKEN_RENEWAL_MARGIN + 0.2)
+    fixture.given_login_ok(token=expiring_token)
+    await fixture.client.login(username="user", password=SecretStr("pass"))
+    assert fixture.state["login_calls"] == 1
+
+    # Act
+    fixture.given_login_ok(token="renewed-token")
+    await asyncio.sleep(0.5)
+
+    # Assert
+    assert fixture.client.storage["auth_token"] == SecretStr("renewed-token")
+    assert fixture.state["login_calls"] == 2
+    assert fixture.state["me_calls"] == 2
+
+
+@pytest.mark.integration
+async def test_restored_session_logs_in_again_on_401(fixture: "VoltalisClientFixture") -> None:
+    """Test a restored session is used as is, and replaced by a new login when the token is rejected."""
+
+    # Arrange
+    fixture.given_login_ok(token="new-token", default_site_id="1")
+    fixture.client.restore_session(
+        username="user",
+        password=SecretStr("pass"),
+        auth_token=SecretStr("persisted-token"),
+        default_site_id="1",
+    )
+    logins: list[SecretStr | None] = []
+    remove_listener = fixture.client.add_login_listener(lambda: logins.append(fixture.client.storage["auth_token"]))
+
+    def token_handler(body: object, config: dict) -> MockHttpServer.StubResponse[dict]:
+        if config["headers"].get("Authorization") != "Bearer new-token":
+            return MockHttpServer.StubResponse(status_code=401, data={"error": "unauthorized"})
+        return MockHttpServer.StubResponse(status_code=200, data={"ok": True})
+
+    fixture.server.set_request_handler(
+        url="/api/site/{site_id}/restored",
+        method="GET",
+        new_request_handler=MockHttpServer.RequestHandler(handle=token_handler, with_headers=True),
+    )
+
+    # Act
+    response: HttpClientResponse[dict] = await fixture.client.send_request(
+        url="/api/site/{site_id}/restored", method="GET"
+    )
+    remove_listener()
+
+    # Assert
+    assert response.data == {"ok": True}
+    assert fixture.state["login_calls"] == 1
+    assert logins == [SecretStr("new-token")]
+
+
 @pytest.mark.integration
 async def test_logout_clears_storage(fixture: "VoltalisClientFixture") -> None:
     """Test logout clears the storage when a token is present."""
@@ -182,6 +299,63 @@ async def test_send_request_non_retryable_401(fixture: "VoltalisClientFixture")
         await fixture.client.send_request(url="/api/site/{site_id}/no-retry", method="GET", can_retry=False)
 
 
+@pytest.mark.integration
+async def test_send_request_writes_skip_the_queued_reads(fixture: "VoltalisClientFixture") -> None:
+    """Test a write is sent right away while a burst of reads waits in the background lane."""
+
+    # Arrange
+    fixture.given_login_ok()
+    fixture.client.storage["auth_token"] = SecretStr("fake-token")
+    fixture.client.storage["default_site_id"] = "1"
+    rate_limiter = HttpRateLimiter(
+        budgets={
+            HttpPriorityEnum.INTERACTIVE: HttpRateBudget(rate=10.0, burst=1),
+            HttpPriorityEnum.BACKGROUND: HttpRateBudget(rate=10.0, burst=1),
+        }
+    )
+    client = VoltalisClientAiohttp(
+        session=fixture.client_session,
+        base_url=fixture.server.get_full_url(),
+        rate_limiter=rate_limiter,
+    )
+    client.storage.update(fixture.client.storage)
+
+    for method in ["GET", "PUT"]:
+        fixture.server.set_request_handler(
+            url="/api/site/{site_id}/resource",
+            method=method,
+            new_request_handler=MockHttpServer.RequestHandler(
+                handle=lambda body, config: MockHttpServer.StubResponse(status_code=200, data={"ok": True})
+            ),
+        )
+
+    # Act
+    reads: list[asyncio.Task[HttpClientResponse[dict]]] = [
+        asyncio.create_task(client.send_request(url="/api/site/{site_id}/resource", method="GET")) for _ in range(4)
+    ]
+    await asyncio.sleep(0)
+    await client.send_request(url="/api/site/{site_id}/resource", method="PUT", body={})
+    reads_pending = sum(not read.done() for read in reads)
+    await asyncio.gather(*reads)
+
+    # Assert
+    assert reads_pending > 0
+    assert client.rate_limiter is rate_limiter
+    assert rate_limiter.requests_count == {HttpPriorityEnum.BACKGROUND: 4, HttpPriorityEnum.INTERACTIVE: 1}
+    assert rate_limiter.max_queue_time[HttpPriorityEnum.INTERACTIVE] == 0.0
+    assert rate_limiter.queue_time[HttpPriorityEnum.BACKGROUND] > 0
+
+
+def make_jwt(expiry: float | None) -> str:
+    """Build an unsigned JWT with the given expiry."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    payload = {"sub": "user"} if expiry is None else {"sub": "user", "exp": expiry}
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.signature"
+
+
 class VoltalisClientFixture(BaseFixture):
     """VoltalisClientAiohttp fixture."""
 
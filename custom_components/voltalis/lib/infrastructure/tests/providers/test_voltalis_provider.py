@@ -1,5 +1,5 @@
-from datetime import date, datetime
-from typing import AsyncGenerator, TypeAlias
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, TypeAlias
 
 import pytest
 
@@ -28,6 +28,10 @@ from custom_components.voltalis.lib.domain.energy_contracts.live_consumption imp
 from custom_components.voltalis.lib.domain.programs_management.programs.program import Program
 from custom_components.voltalis.lib.domain.programs_management.programs.program_builder import ProgramBuilder
 from custom_components.voltalis.lib.domain.programs_management.programs.program_enum import ProgramTypeEnum
+from custom_components.voltalis.lib.infrastructure.providers.consumption_cache_persistent import (
+    ConsumptionCachePersistent,
+)
+from custom_components.voltalis.lib.infrastructure.providers.date_provider_stub import DateProviderStub
 from custom_components.voltalis.lib.infrastructure.providers.voltalis_provider_stub import (
     VoltalisProviderStub,
 )
@@ -172,6 +176,119 @@ async def test_get_devices_consumptions(fixture: "VoltalisProviderFixture") -> N
     fixture.compare_data(result, expected_result)
 
 
+@pytest.mark.integration
+async def test_get_devices_consumptions_on_dst_day(fixture: "VoltalisProviderFixture") -> None:
+    """Test get_devices_consumptions method keeps the 25 hours of the day the summer time ends."""
+
+    summer_time = timezone(timedelta(hours=2))
+    winter_time = timezone(timedelta(hours=1))
+    records = [
+        (datetime(2024, 10, 27, 0, 0, 0, tzinfo=summer_time), 1.0),
+        (datetime(2024, 10, 27, 2, 0, 0, tzinfo=summer_time), 2.0),
+        (datetime(2024, 10, 27, 2, 0, 0, tzinfo=winter_time), 3.0),
+        (datetime(2024, 10, 27, 23, 0, 0, tzinfo=winter_time), 4.0),
+    ]
+
+    # Arrange
+    fixture.given_devices_consumptions({1: records})
+
+    # Act
+    result = await fixture.provider.get_devices_daily_consumptions(date(2024, 10, 27))
+
+    # Assert
+    fixture.compare_dicts(result, {1: records})
+    assert [step.utcoffset() for step, _ in result[1]] == [step.utcoffset() for step, _ in records]
+
+
+@pytest.mark.integration
+async def test_get_devices_consumptions_only_validates_new_steps(fixture: "VoltalisProviderFixture") -> None:
+    """Test get_devices_consumptions method only validates the new steps."""
+
+    if not isinstance(fixture.provider, VoltalisProviderVoltalisApi):
+        pytest.skip("Only the Voltalis API provider stores the fetched steps")
+
+    records = [(datetime(2024, 11, 24, hour, 0, 0), float(hour)) for hour in range(10)]
+
+    # Arrange
+    fixture.given_devices_consumptions({1: records[:5]})
+    await fixture.provider.get_devices_daily_consumptions(date(2024, 11, 24))
+    parsed_before = fixture.provider.consumption_records_parsed
+    reused_before = fixture.provider.consumption_records_reused
+    fixture.given_devices_consumptions({1: records})
+
+    # Act
+    result = await fixture.provider.get_devices_daily_consumptions(date(2024, 11, 24))
+
+    # Assert
+    fixture.compare_dicts(result, {1: records})
+    assert fixture.provider.consumption_records_parsed - parsed_before == 5
+    assert fixture.provider.consumption_records_reused - reused_before == 5
+    assert fixture.provider.consumption_bytes_received > 0
+
+
+@pytest.mark.integration
+async def test_get_devices_consumptions_validates_corrected_steps(fixture: "VoltalisProviderFixture") -> None:
+    """Test get_devices_consumptions method validates again the stored steps whose consumption was corrected."""
+
+    if not isinstance(fixture.provider, VoltalisProviderVoltalisApi):
+        pytest.skip("Only the Voltalis API provider stores the fetched steps")
+
+    records = [(datetime(2024, 11, 24, hour, 0, 0), float(hour)) for hour in range(5)]
+    corrected_records = [*records[:2], (records[2][0], 20.0), *records[3:]]
+
+    # Arrange
+    fixture.given_devices_consumptions({1: records})
+    await fixture.provider.get_devices_daily_consumptions(date(2024, 11, 24))
+    parsed_before = fixture.provider.consumption_records_parsed
+    fixture.given_devices_consumptions({1: corrected_records})
+
+    # Act
+    result = await fixture.provider.get_devices_daily_consumptions(date(2024, 11, 24))
+
+    # Assert
+    fixture.compare_dicts(result, {1: corrected_records})
+    assert fixture.provider.consumption_records_parsed - parsed_before == 3
+
+
+@pytest.mark.integration
+async def test_get_devices_consumptions_reads_past_days_from_cache(fixture: "VoltalisProviderFixture") -> None:
+    """Test get_devices_consumptions method reads the complete past days from the consumption cache."""
+
+    if not isinstance(fixture.provider, VoltalisProviderVoltalisApi):
+        pytest.skip("Only the Voltalis API provider caches the past days")
+
+    records = [(datetime(2024, 11, 24, hour, 0, 0), float(hour)) for hour in range(24)]
+    date_provider = DateProviderStub()
+    date_provider.now = datetime(2024, 11, 30, 12, 0, 0)
+    stored_data: dict[str, Any] = {}
+
+    async def load() -> dict[str, Any] | None:
+        return stored_data
+
+    provider = VoltalisProviderVoltalisApi(
+        http_client=fixture.provider._client,
+        date_provider=date_provider,
+        consumption_cache=ConsumptionCachePersistent(
+            date_provider=date_provider,
+            load=load,
+            save=stored_data.update,
+            retention_days=30,
+        ),
+    )
+
+    # Arrange
+    fixture.given_devices_consumptions({1: records})
+    await provider.get_devices_daily_consumptions(date(2024, 11, 24))
+    fixture.given_devices_consumptions({1: []})
+
+    # Act
+    result = await provider.get_devices_daily_consumptions(date(2024, 11, 24))
+
+    # Assert
+    fixture.compare_dicts(result, {1: records})
+    assert provider.consumption_records_parsed == 24
+
+
 @pytest.mark.integration
 async def test_get_devices_consumptions_no_match(fixture: "VoltalisProviderFixture") -> None:
     """Test get_devices_consumptions method with no matching datetime."""
@@ -459,6 +576,7 @@ class VoltalisProviderFixture(BaseFixture):
         if isinstance(self.provider, VoltalisProviderVoltalisApi):
             self.voltalis_server.reset_storage()
             self.voltalis_server.given_login_ok()
+            self.provider.clear_stored_consumptions()
 
     async def __get_provider(self, *, provider_type: type[TestedProvidersType]) -> TestedProvidersType:
         """Get the provider depends on the provider type."""
@@ -18,10 +18,16 @@ from custom_components.voltalis.lib.application.devices_management.handlers.clim
 from custom_components.voltalis.lib.application.devices_management.handlers.climates.turn_off_device_handler import (
     TurnOffDeviceHandler,
 )
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.backfill_devices_consumption_handler import (  # noqa: E501
+    BackfillDevicesConsumptionHandler,
+)
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_device_mode_handler import (  # noqa: E501
     GetDeviceModeHandler,
 )
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices import GetDevicesHandler
+from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_consumption_range_handler import (  # noqa: E501
+    GetDevicesConsumptionRangeHandler,
+)
 from custom_components.voltalis.lib.application.devices_management.handlers.devices.get_devices_daily_consumption_handler import (  # noqa: E501
     GetDevicesDailyConsumptionHandler,
 )  # noqa: E501
@@ -52,6 +58,9 @@ from custom_components.voltalis.lib.application.energy_contracts.handlers.get_en
 from custom_components.voltalis.lib.application.energy_contracts.handlers.get_energy_contract_current_mode_handler import (  # noqa: E501
     GetEnergyContractCurrentModeHandler,
 )
+from custom_components.voltalis.lib.application.energy_contracts.handlers.get_energy_contract_next_mode_change_handler import (  # noqa: E501
+    GetEnergyContractNextModeChangeHandler,
+)
 from custom_components.voltalis.lib.application.energy_contracts.handlers.get_live_consumption_handler import (
     GetLiveConsumptionHandler,
 )
@@ -61,7 +70,13 @@ from custom_components.voltalis.lib.application.programs_management.handlers.get
 from custom_components.voltalis.lib.application.programs_management.handlers.set_program_handler import (  # noqa: E501
     SetProgramHandler,
 )
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_write_coalescer import (
+    ManualSettingWriteCoalescer,
+)
 from custom_components.voltalis.lib.domain.shared.custom_model import CustomModel
+from custom_components.voltalis.lib.domain.shared.providers.consumption_statistics_provider import (
+    ConsumptionStatisticsProvider,
+)
 from custom_components.voltalis.lib.domain.shared.providers.date_provider import DateProvider
 from custom_components.voltalis.lib.domain.shared.providers.voltalis_provider import VoltalisProvider
 
@@ -89,6 +104,7 @@ class VoltalisModule:
         date_provider: DateProvider,
         logger: Logger,
         voltalis_provider: VoltalisProvider,
+        consumption_statistics_provider: ConsumptionStatisticsProvider,
         # Config
         config: VoltalisModuleConfig,
     ) -> None:
@@ -98,6 +114,7 @@ class VoltalisModule:
         self.date_provider = date_provider
         self.logger = logger
         self.__voltalis_provider = voltalis_provider
+        self.__consumption_statistics_provider = consumption_statistics_provider
 
         # Config
         self.config = config
@@ -105,6 +122,12 @@ class VoltalisModule:
     def setup_handlers(self) -> None:
         """Setup the handlers."""
 
+        # Shared by all the handlers writing manual settings, so close writes of a device are sent once
+        self.manual_setting_write_coalescer = ManualSettingWriteCoalescer(
+            logger=self.logger,
+            voltalis_provider=self.__voltalis_provider,
+        )
+
         # Devices management
         self.get_devices_handler = GetDevicesHandler(
             logger=self.logger,
@@ -117,6 +140,15 @@ class VoltalisModule:
             date_provider=self.date_provider,
             voltalis_provider=self.__voltalis_provider,
         )
+        self.get_devices_consumption_range_handler = GetDevicesConsumptionRangeHandler(
+            voltalis_provider=self.__voltalis_provider,
+        )
+        self.backfill_devices_consumption_handler = BackfillDevicesConsumptionHandler(
+            logger=self.logger,
+            date_provider=self.date_provider,
+            consumption_statistics_provider=self.__consumption_statistics_provider,
+            get_devices_consumption_range_handler=self.get_devices_consumption_range_handler,
+        )
         self.get_device_mode_handler = GetDeviceModeHandler()
 
         # Device presets
@@ -131,6 +163,7 @@ class VoltalisModule:
             default_away_temperature=self.config.default_away_temp,
             default_eco_temperature=self.config.default_eco_temp,
             default_comfort_temperature=self.config.default_comfort_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
 
         # Device water heater operations
@@ -141,6 +174,7 @@ class VoltalisModule:
             date_provider=self.date_provider,
             voltalis_provider=self.__voltalis_provider,
             default_water_heater_temp=self.config.default_water_heater_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
 
         # Device climate management
@@ -156,6 +190,7 @@ class VoltalisModule:
             default_away_temperature=self.config.default_away_temp,
             default_eco_temperature=self.config.default_eco_temp,
             default_comfort_temperature=self.config.default_comfort_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
 
         self.turn_off_device_handler = TurnOffDeviceHandler(
@@ -166,6 +201,7 @@ class VoltalisModule:
             default_away_temperature=self.config.default_away_temp,
             default_eco_temperature=self.config.default_eco_temp,
             default_comfort_temperature=self.config.default_comfort_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
 
         self.set_device_temperature_handler = SetDeviceTemperatureHandler(
@@ -176,6 +212,7 @@ class VoltalisModule:
             default_away_temperature=self.config.default_away_temp,
             default_eco_temperature=self.config.default_eco_temp,
             default_comfort_temperature=self.config.default_comfort_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
         self.disable_manual_mode_handler = DisableManualModeHandler(
             logger=self.logger,
@@ -185,6 +222,7 @@ class VoltalisModule:
             default_away_temp=self.config.default_away_temp,
             default_eco_temp=self.config.default_eco_temp,
             default_comfort_temp=self.config.default_comfort_temp,
+            manual_setting_write_coalescer=self.manual_setting_write_coalescer,
         )
 
         # energy contracts
@@ -195,6 +233,9 @@ class VoltalisModule:
         self.get_energy_contract_current_mode_handler = GetEnergyContractCurrentModeHandler(
             date_provider=self.date_provider,
         )
+        self.get_energy_contract_next_mode_change_handler = GetEnergyContractNextModeChangeHandler(
+            date_provider=self.date_provider,
+        )
         self.get_energy_contract_current_kwh_cost_handler = GetEnergyContractCurrentKwhCostHandler()
         self.get_live_consumption_handler = GetLiveConsumptionHandler(
             voltalis_provider=self.__voltalis_provider,
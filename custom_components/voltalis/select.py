@@ -33,7 +33,7 @@ async def async_setup_entry(
     select_entities.append(VoltalisProgramSelect(entry))
 
     all_entities: dict[str, VoltalisBaseEntity] = {sensor.unique_internal_name: sensor for sensor in select_entities}
-    async_add_entities(all_entities.values(), update_before_add=True)
+    async_add_entities(all_entities.values())
     voltalis_home_assistant_module.logger.info(
         f"Added {len(all_entities)} Voltalis select entities: {list(all_entities.keys())}"
     )
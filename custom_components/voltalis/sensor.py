@@ -20,6 +20,9 @@ from custom_components.voltalis.apps.home_assistant.entities.device_entities.vol
 from custom_components.voltalis.apps.home_assistant.entities.device_entities.voltalis_device_daily_consumption_sensor import (  # noqa: E501
     VoltalisDeviceDailyConsumptionSensor,
 )
+from custom_components.voltalis.apps.home_assistant.entities.device_entities.voltalis_device_daily_cost_sensor import (  # noqa: E501
+    VoltalisDeviceDailyCostSensor,
+)
 from custom_components.voltalis.apps.home_assistant.entities.device_entities.voltalis_device_programming_sensor import (
     VoltalisDeviceProgrammingSensor,
 )
@@ -59,12 +62,18 @@ async def async_setup_entry(
     health_coordinator = voltalis_home_assistant_module.device_health_coordinator
     energy_contract_coordinator = voltalis_home_assistant_module.energy_contract_coordinator
 
+    current_contract = next(iter(energy_contract_coordinator.data.values()), None)
+
     device_sensors: list[VoltalisDeviceEntity] = []
 
     for device in device_coordinator.data.values():
         # Create the consumption sensor for each device
         device_sensors.append(VoltalisDeviceDailyConsumptionSensor(entry, device))
 
+        # Create the cost sensor for each device (the consumption is priced with the energy contract)
+        if current_contract is not None:
+            device_sensors.append(VoltalisDeviceDailyCostSensor(entry, device))
+
         # Create the connected sensor for each device (if status is available)
         if health_coordinator.data.get(device.id) is not None:
             device_sensors.append(VoltalisDeviceConnectedSensor(entry, device))
@@ -77,7 +86,6 @@ async def async_setup_entry(
             device_sensors.append(VoltalisDeviceProgrammingSensor(entry, device))
 
     energy_contract_sensors: list[VoltalisEnergyContractEntity] = []
-    current_contract = next(iter(energy_contract_coordinator.data.values()), None)
     if current_contract is not None:
         energy_contract_sensors.append(VoltalisEnergyContractLiveConsumptionSensor(entry, current_contract))
         energy_contract_sensors.append(VoltalisEnergyContractSubscribedPowerSensor(entry, current_contract))
@@ -93,7 +101,7 @@ async def async_setup_entry(
     all_entities: dict[str, VoltalisBaseEntity] = {
         sensor.unique_internal_name: sensor for sensor in (device_sensors + energy_contract_sensors)
     }
-    async_add_entities(all_entities.values(), update_before_add=True)
+    async_add_entities(all_entities.values())
     voltalis_home_assistant_module.logger.info(
         f"Added {len(all_entities)} Voltalis sensor entities: {list(all_entities.keys())}"
     )
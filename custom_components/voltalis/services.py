@@ -0,0 +1,97 @@
+"""Service actions of the Voltalis integration that are not bound to an entity."""
+
+from collections import defaultdict
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from custom_components.voltalis.apps.home_assistant.entities.config_entry_data import VoltalisConfigEntry
+from custom_components.voltalis.const import (
+    CONSUMPTION_RANGE_MAX_CONCURRENCY,
+    CONSUMPTION_RANGE_MAX_DAYS,
+    DOMAIN,
+)
+from custom_components.voltalis.lib.application.devices_management.queries.get_devices_consumption_range_query import (  # noqa: E501
+    GetDevicesConsumptionRangeQuery,
+)
+from custom_components.voltalis.lib.domain.shared.exceptions import VoltalisException
+
+SERVICE_GET_CONSUMPTION = "get_consumption"
+
+GET_CONSUMPTION_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry_id"): cv.string,
+        vol.Required("start_date"): cv.date,
+        vol.Required("end_date"): cv.date,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the service actions of the integration."""
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CONSUMPTION,
+        async_get_consumption,
+        schema=GET_CONSUMPTION_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def async_get_consumption(call: ServiceCall) -> ServiceResponse:
+    """Get the consumption of the devices between two days, with the total of each device and of each day."""
+
+    entry: VoltalisConfigEntry | None = call.hass.config_entries.async_get_entry(call.data["config_entry_id"])
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Voltalis entry {call.data['config_entry_id']} is not loaded")
+
+    start_date = call.data["start_date"]
+    end_date = call.data["end_date"]
+    if start_date > end_date:
+        raise ServiceValidationError("The start date must be before the end date")
+    if (end_date - start_date).days >= CONSUMPTION_RANGE_MAX_DAYS:
+        raise ServiceValidationError(f"The range can't be longer than {CONSUMPTION_RANGE_MAX_DAYS} days")
+
+    voltalis_home_assistant_module = entry.runtime_data.voltalis_home_assistant_module
+    get_devices_consumption_range_handler = voltalis_home_assistant_module.get_devices_consumption_range_handler
+
+    # The days are aggregated as they are received, only the totals are kept
+    devices_consumptions: dict[int, float] = defaultdict(float)
+    days_consumptions: list[dict[str, str | float]] = []
+    try:
+        async for day, day_devices_consumptions in get_devices_consumption_range_handler.handle(
+            GetDevicesConsumptionRangeQuery(
+                start=start_date,
+                end=end_date,
+                max_concurrency=CONSUMPTION_RANGE_MAX_CONCURRENCY,
+            )
+        ):
+            day_consumption = 0.0
+            for device_id, consumption_records in day_devices_consumptions.items():
+                device_consumption = consumption_records.total()
+                devices_consumptions[device_id] += device_consumption
+                day_consumption += device_consumption
+            days_consumptions.append({"date": day.isoformat(), "consumption": day_consumption})
+    except VoltalisException as err:
+        raise HomeAssistantError(f"Error getting the consumption from Voltalis: {err}") from err
+
+    devices = voltalis_home_assistant_module.device_coordinator.data or {}
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "consumption": sum(devices_consumptions.values()),
+        "devices": [
+            {
+                "device_id": device_id,
+                "name": devices[device_id].name if device_id in devices else None,
+                "consumption": consumption,
+            }
+            for device_id, consumption in devices_consumptions.items()
+        ],
+        "days": days_consumptions,
+    }
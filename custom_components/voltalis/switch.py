@@ -30,7 +30,7 @@ async def async_setup_entry(
         switch_entities.append(VoltalisDeviceSwitch(entry, device))
 
     all_entities: dict[str, VoltalisBaseEntity] = {sensor.unique_internal_name: sensor for sensor in switch_entities}
-    async_add_entities(all_entities.values(), update_before_add=True)
+    async_add_entities(all_entities.values())
     voltalis_home_assistant_module.logger.info(
         f"Added {len(all_entities)} Voltalis switch entities: {list(all_entities.keys())}"
     )
@@ -0,0 +1,77 @@
+"""Micro-benchmark of the memory used by the consumption steps of a range of days.
+
+Compares the list of (datetime, float) tuples of each device (previous behavior) with the array columns
+of ConsumptionSeries, and the cost of looking a step up in both.
+
+Usage: python -m custom_components.voltalis.tests.benchmarks.bench_consumption_series
+"""
+
+import timeit
+import tracemalloc
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+
+DEVICES_COUNT = 20
+DAYS_COUNT = 30
+STEPS_PER_DAY = 144
+RANGE_START = datetime(2024, 1, 1)
+
+
+def build_records() -> dict[int, list[tuple[datetime, float]]]:
+    """Build the 10-minute consumption steps of DAYS_COUNT days for each of the DEVICES_COUNT devices."""
+
+    step = timedelta(days=1) / STEPS_PER_DAY
+    return {
+        device_id: [(RANGE_START + index * step, float(index % 50)) for index in range(DAYS_COUNT * STEPS_PER_DAY)]
+        for device_id in range(DEVICES_COUNT)
+    }
+
+
+def measure(name: str, build: Callable[[], Any]) -> tuple[Any, int]:
+    """Build the steps and print the memory they hold once built."""
+
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<24} {size / 1024 / 1024:>10.2f} MiB")
+    return built, size
+
+
+def main() -> None:
+    steps_count = DEVICES_COUNT * DAYS_COUNT * STEPS_PER_DAY
+    print(f"Storing {steps_count} steps of {DEVICES_COUNT} devices over {DAYS_COUNT} days")
+    records, records_size = measure("list of tuples", build_records)
+    # The series are built from the records, only the columns they keep are measured
+    series, series_size = measure(
+        "consumption series",
+        lambda: {device_id: ConsumptionSeries.from_records(steps) for device_id, steps in records.items()},
+    )
+    print(f"Memory: x{records_size / series_size:.1f} smaller")
+
+    # Both give the same steps and totals
+    for device_id, device_records in records.items():
+        assert series[device_id] == device_records
+        assert series[device_id].total() == sum(consumption for _, consumption in device_records)
+
+    instant = RANGE_START + timedelta(days=DAYS_COUNT / 2)
+    records_steps = [step for step, _ in records[0]]
+
+    def lookup_records() -> None:
+        bisect_left(records_steps, instant)
+
+    def lookup_series() -> None:
+        series[0].bisect_left(instant)
+
+    for name, lookup in [("list bisect", lookup_records), ("series bisect", lookup_series)]:
+        per_lookup = min(timeit.repeat(lookup, number=10_000, repeat=5)) / 10_000
+        print(f"{name:<24} {per_lookup * 1_000_000:>10.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
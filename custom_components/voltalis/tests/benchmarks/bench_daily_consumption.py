@@ -0,0 +1,92 @@
+"""Micro-benchmark of the daily consumption aggregation done on each hourly refresh.
+
+Compares summing the whole day on every refresh (previous behavior) with the per-device series
+of DailyConsumptionSeries, where each refresh appends the new steps and looks the total up with a bisect.
+
+Usage: python -m custom_components.voltalis.tests.benchmarks.bench_daily_consumption
+"""
+
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable
+
+from custom_components.voltalis.lib.domain.devices_management.consumptions.consumption_series import (
+    ConsumptionSeries,
+)
+from custom_components.voltalis.lib.domain.devices_management.consumptions.daily_consumption_series import (
+    DailyConsumptionSeries,
+)
+
+DEVICES_COUNT = 20
+RECORDS_PER_DEVICE = 4_000
+DAY_START = datetime(2024, 1, 1)
+
+
+def build_records() -> dict[int, list[tuple[datetime, float]]]:
+    """Build the consumption steps of a day, RECORDS_PER_DEVICE for each of the DEVICES_COUNT devices."""
+
+    step = timedelta(days=1) / RECORDS_PER_DEVICE
+    return {
+        device_id: [(DAY_START + index * step, float(index % 50)) for index in range(RECORDS_PER_DEVICE)]
+        for device_id in range(DEVICES_COUNT)
+    }
+
+
+def sum_whole_day(records: dict[int, list[tuple[datetime, float]]], target_hour: datetime) -> dict[int, float]:
+    """Previous behavior: truncate and compare every step of the day on each refresh."""
+
+    return {
+        device_id: sum(
+            [
+                consumption
+                for (date, consumption) in device_records
+                if date.replace(minute=0, second=0, microsecond=0) <= target_hour
+            ],
+            0.0,
+        )
+        for device_id, device_records in records.items()
+    }
+
+
+def run(name: str, refresh_day: Callable[[], None]) -> float:
+    """Run the 24 hourly refreshes of a day and print the mean cost per refresh."""
+
+    per_refresh = min(timeit.repeat(refresh_day, number=1, repeat=5)) / 24
+    print(f"{name:<24} {per_refresh * 1_000:>10.2f} ms/refresh")
+    return per_refresh
+
+
+def main() -> None:
+    records = build_records()
+    records_series = {
+        device_id: ConsumptionSeries.from_records(device_records) for device_id, device_records in records.items()
+    }
+
+    def refresh_day_with_whole_day_sum() -> None:
+        for hour in range(24):
+            sum_whole_day(records, DAY_START + timedelta(hours=hour))
+
+    def refresh_day_with_series() -> None:
+        devices_series = {device_id: DailyConsumptionSeries(day=DAY_START.date()) for device_id in records}
+        for hour in range(24):
+            until = DAY_START + timedelta(hours=hour + 1)
+            for device_id, series in devices_series.items():
+                series.append(records_series[device_id], until=until)
+                series.get_consumption_before(until)
+
+    # Both aggregations give the same totals
+    until = DAY_START + timedelta(hours=12)
+    expected = sum_whole_day(records, until - timedelta(hours=1))
+    for device_id, device_records in records_series.items():
+        series = DailyConsumptionSeries(day=DAY_START.date())
+        series.append(device_records, until=until)
+        assert series.get_consumption_before(until) == expected[device_id]
+
+    print(f"Aggregating {RECORDS_PER_DEVICE} steps per device of {DEVICES_COUNT} devices, 24 refreshes")
+    before = run("whole day sum", refresh_day_with_whole_day_sum)
+    after = run("incremental series", refresh_day_with_series)
+    print(f"Speedup: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
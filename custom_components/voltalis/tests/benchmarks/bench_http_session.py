@@ -0,0 +1,108 @@
+"""Micro-benchmark of the connections opened by the polls of the coordinators.
+
+Compares a session with the aiohttp connector defaults, like the session shared by the Home Assistant integrations
+(previous behavior), with the dedicated session of HttpClientAiohttp.create_session tuned for the Voltalis host.
+The polls are sent to a local server, the durations are scaled down by TIME_SCALE: a 60s poll interval becomes
+0.3s, and the keep-alive and DNS cache durations of both sessions are scaled the same way.
+
+Usage: python -m custom_components.voltalis.tests.benchmarks.bench_http_session
+"""
+
+import asyncio
+import statistics
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+
+from custom_components.voltalis.lib.infrastructure.providers.http_client_aiohttp import HttpClientAiohttp
+
+POLLS_COUNT = 20
+REQUESTS_PER_POLL = 6
+POLL_INTERVAL = 60  # in seconds
+TIME_SCALE = 1 / 200
+
+# aiohttp connector defaults
+SHARED_KEEPALIVE_TIMEOUT = 15  # in seconds
+SHARED_DNS_CACHE_TTL = 10  # in seconds
+# Same values as the dedicated session of the integration
+DEDICATED_CONNECTIONS_LIMIT = 10
+DEDICATED_KEEPALIVE_TIMEOUT = 75  # in seconds
+DEDICATED_DNS_CACHE_TTL = 300  # in seconds
+
+
+async def start_server() -> tuple[web.AppRunner, int, set[tuple[str, int]]]:
+    """Start a local server answering like a small Voltalis endpoint, it records the client address of each request.
+
+    Each new connection has a new client port, the number of addresses is the number of handshakes.
+    """
+
+    peers: set[tuple[str, int]] = set()
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.transport is not None:
+            peers.add(request.transport.get_extra_info("peername")[:2])
+        return web.json_response([{"id": device_id, "name": f"Device {device_id}"} for device_id in range(10)])
+
+    app = web.Application()
+    app.router.add_get("/api/site/1/resource", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, port, peers
+
+
+async def run_polls(session: ClientSession, url: str) -> list[float]:
+    """Send the polls, returns the latency of each request in seconds."""
+
+    async def send_request() -> float:
+        started_at = time.perf_counter()
+        async with session.get(url) as response:
+            await response.read()
+        return time.perf_counter() - started_at
+
+    latencies: list[float] = []
+    for _ in range(POLLS_COUNT):
+        latencies += await asyncio.gather(*(send_request() for _ in range(REQUESTS_PER_POLL)))
+        await asyncio.sleep(POLL_INTERVAL * TIME_SCALE)
+    return latencies
+
+
+async def measure(name: str, session: ClientSession) -> None:
+    """Send the polls with the session and print the handshakes and the median latency."""
+
+    runner, port, peers = await start_server()
+    try:
+        async with session:
+            latencies = await run_polls(session, f"http://localhost:{port}/api/site/1/resource")
+    finally:
+        await runner.cleanup()
+
+    print(f"{name:<20} {len(peers):>6} handshakes {statistics.median(latencies) * 1000:>10.3f} ms/request (median)")
+
+
+async def main() -> None:
+    print(f"Sending {POLLS_COUNT} polls of {REQUESTS_PER_POLL} requests, every {POLL_INTERVAL}s (scaled x{TIME_SCALE})")
+
+    await measure(
+        "shared session",
+        ClientSession(
+            connector=TCPConnector(
+                keepalive_timeout=SHARED_KEEPALIVE_TIMEOUT * TIME_SCALE,
+                ttl_dns_cache=SHARED_DNS_CACHE_TTL * TIME_SCALE,  # type: ignore[arg-type]
+            )
+        ),
+    )
+    await measure(
+        "dedicated session",
+        HttpClientAiohttp.create_session(
+            connections_limit=DEDICATED_CONNECTIONS_LIMIT,
+            keepalive_timeout=DEDICATED_KEEPALIVE_TIMEOUT * TIME_SCALE,
+            dns_cache_ttl=DEDICATED_DNS_CACHE_TTL * TIME_SCALE,  # type: ignore[arg-type]
+        ),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
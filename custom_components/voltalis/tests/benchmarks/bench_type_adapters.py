@@ -0,0 +1,88 @@
+"""Micro-benchmark of the pydantic parsing done on each 1-minute poll.
+
+Compares building a new TypeAdapter on every call (previous behavior) with the shared adapters
+of the voltalis_type_adapters registry.
+
+Usage: python -m custom_components.voltalis.tests.benchmarks.bench_type_adapters
+"""
+
+import timeit
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from custom_components.voltalis.lib.domain.devices_management.climates.manual_setting_builder import (
+    ManualSettingBuilder,
+)
+from custom_components.voltalis.lib.domain.devices_management.devices.device_builder import DeviceBuilder
+from custom_components.voltalis.lib.domain.devices_management.health.device_health_builder import (
+    DeviceHealthBuilder,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device import VoltalisDeviceDto
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_device_health import (
+    VoltalisDeviceHealthDto,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_manual_setting import (
+    VoltalisManualSettingDto,
+)
+from custom_components.voltalis.lib.infrastructure.dtos.voltalis_api.voltalis_type_adapters import (
+    DEVICES_ADAPTER,
+    DEVICES_HEALTH_ADAPTER,
+    MANUAL_SETTINGS_ADAPTER,
+)
+
+DEVICES_COUNT = 10
+ITERATIONS = 200
+
+
+def build_payloads() -> tuple[list[dict], list[dict], list[dict]]:
+    """Build the JSON payloads of a site with DEVICES_COUNT devices, as returned by the Voltalis API."""
+
+    devices = [DeviceBuilder().with_id(device_id).build() for device_id in range(DEVICES_COUNT)]
+    devices_health = [DeviceHealthBuilder().with_device_id(device.id).build() for device in devices]
+    manual_settings = [
+        ManualSettingBuilder().with_id(100 + device.id).with_id_appliance(device.id).build() for device in devices
+    ]
+
+    return (
+        [VoltalisDeviceDto.from_device(device).model_dump(mode="json", by_alias=True) for device in devices],
+        [
+            VoltalisDeviceHealthDto.from_device_health(device_health).model_dump(mode="json", by_alias=True)
+            for device_health in devices_health
+        ],
+        [
+            VoltalisManualSettingDto.from_manual_setting(manual_setting).model_dump(mode="json", by_alias=True)
+            for manual_setting in manual_settings
+        ],
+    )
+
+
+def run(name: str, parse_poll: Callable[[], Any]) -> float:
+    """Run the poll parsing ITERATIONS times and print the mean cost per poll."""
+
+    per_poll = min(timeit.repeat(parse_poll, number=ITERATIONS, repeat=5)) / ITERATIONS
+    print(f"{name:<24} {per_poll * 1_000_000:>10.1f} µs/poll")
+    return per_poll
+
+
+def main() -> None:
+    devices, devices_health, manual_settings = build_payloads()
+
+    def parse_with_new_adapters() -> None:
+        TypeAdapter(list[VoltalisDeviceDto]).validate_python(devices)
+        TypeAdapter(list[VoltalisDeviceHealthDto]).validate_python(devices_health)
+        TypeAdapter(list[VoltalisManualSettingDto]).validate_python(manual_settings)
+
+    def parse_with_shared_adapters() -> None:
+        DEVICES_ADAPTER.validate_python(devices)
+        DEVICES_HEALTH_ADAPTER.validate_python(devices_health)
+        MANUAL_SETTINGS_ADAPTER.validate_python(manual_settings)
+
+    print(f"Parsing devices, health and manual settings of {DEVICES_COUNT} devices")
+    before = run("new TypeAdapter per call", parse_with_new_adapters)
+    after = run("shared TypeAdapter", parse_with_shared_adapters)
+    print(f"Speedup: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
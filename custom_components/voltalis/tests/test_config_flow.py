@@ -487,6 +487,9 @@ async def test_options_flow_init_shows_form(fixture: HomeAssistantFixture) -> No
     assert "default_eco_temp" in schema_keys
     assert "default_comfort_temp" in schema_keys
     assert "default_water_heater_temp" in schema_keys
+    assert "consumption_cache_retention_days" in schema_keys
+    assert "consumption_backfill_days" in schema_keys
+    assert "dedicated_session" in schema_keys
 
     # Submit None to keep the form displayed
     result2 = await fixture.hass.config_entries.options.async_configure(
@@ -1,12 +1,30 @@
 """E2E tests for the Voltalis integration initialization."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta
+from typing import Any, cast
 
 import pytest
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pydantic import SecretStr
 
+from custom_components.voltalis.apps.home_assistant.coordinators.circuit_breaker import (
+    VoltalisCircuitBreakerStateEnum,
+)
 from custom_components.voltalis.apps.home_assistant.tests.home_assistant_fixture import HomeAssistantFixture
-from custom_components.voltalis.const import DOMAIN
+from custom_components.voltalis.const import (
+    CIRCUIT_BREAKER_BASE_BACKOFF,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CONF_DEDICATED_SESSION,
+    DOMAIN,
+    SESSION_STORAGE_KEY,
+)
+from custom_components.voltalis.lib.infrastructure.providers.date_provider_stub import DateProviderStub
+from custom_components.voltalis.services import SERVICE_GET_CONSUMPTION
+from custom_components.voltalis.tests.utils.mock_http_server import MockHttpServer
 
 
 @pytest.mark.e2e
@@ -90,6 +108,289 @@ async def test_config_entry_update_listener(fixture: HomeAssistantFixture) -> No
     assert entry.state.name == "LOADED"
 
 
+@pytest.mark.e2e
+async def test_session_persisted_after_login(fixture: HomeAssistantFixture, hass_storage: dict[str, Any]) -> None:
+    """Test that the Voltalis session is persisted after the login."""
+
+    entry = fixture.get_config_entry()
+    session = hass_storage[f"{SESSION_STORAGE_KEY}.{entry.entry_id}"]["data"]
+    assert session == {"username": "test@example.com", "auth_token": "fake_token", "default_site_id": "1"}
+
+
+@pytest.mark.e2e
+async def test_session_restored_on_reload(fixture: HomeAssistantFixture, hass_storage: dict[str, Any]) -> None:
+    """Test that the persisted session is reused on setup instead of logging in again."""
+
+    entry = fixture.get_config_entry()
+    session_key = f"{SESSION_STORAGE_KEY}.{entry.entry_id}"
+    hass_storage[session_key]["data"]["auth_token"] = "persisted_token"
+
+    # Reload the integration
+    result = await fixture.hass.config_entries.async_reload(entry.entry_id)
+    await fixture.hass.async_block_till_done(True)
+    assert result is True
+
+    # The persisted token is used, no new login
+    voltalis_client = fixture.get_home_assistant_voltalis_module()._voltalis_client
+    assert voltalis_client.storage["auth_token"] == SecretStr("persisted_token")
+    assert hass_storage[session_key]["data"]["auth_token"] == "persisted_token"
+
+
+@pytest.mark.e2e
+async def test_setup_requests_each_endpoint_once(fixture: HomeAssistantFixture) -> None:
+    """Test that the setup hits each endpoint at most once, the entities reuse the first refresh of the coordinators."""
+
+    entry = fixture.get_config_entry()
+    fixture.voltalis_server.reset_requests_count()
+
+    # Reload the integration, the persisted session is reused
+    result = await fixture.hass.config_entries.async_reload(entry.entry_id)
+    await fixture.hass.async_block_till_done(True)
+    assert result is True
+
+    requests_count = fixture.voltalis_server.get_requests_count()
+    assert len(requests_count) > 0
+    fixture.compare_data({endpoint: count for endpoint, count in requests_count.items() if count > 1}, {})
+
+
+@pytest.mark.e2e
+async def test_entities_state_set_on_setup(fixture: HomeAssistantFixture) -> None:
+    """Test that the entities get their state from the first refresh of the coordinators, without another refresh."""
+
+    entry = fixture.get_config_entry()
+
+    # Reload the integration, the coordinators are not refreshed again after the setup
+    result = await fixture.hass.config_entries.async_reload(entry.entry_id)
+    await fixture.hass.async_block_till_done(True)
+    assert result is True
+
+    assert fixture.get_entity_state("switch.heater_1_device_switch").state == STATE_ON
+    assert fixture.get_entity_state("switch.heater_2_device_switch").state == STATE_OFF
+    for entity_id in ["sensor.heater_1_daily_consumption", "sensor.heater_1_connection_status"]:
+        assert fixture.get_entity_state(entity_id).state not in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+
+
+@pytest.mark.e2e
+async def test_session_removed_with_entry(fixture: HomeAssistantFixture, hass_storage: dict[str, Any]) -> None:
+    """Test that the persisted session is removed with the config entry."""
+
+    entry = fixture.get_config_entry()
+
+    await fixture.hass.config_entries.async_remove(entry.entry_id)
+    await fixture.hass.async_block_till_done(True)
+
+    assert f"{SESSION_STORAGE_KEY}.{entry.entry_id}" not in hass_storage
+
+
+@pytest.mark.e2e
+async def test_dedicated_session_closed_on_unload(fixture: HomeAssistantFixture) -> None:
+    """Test that the dedicated session is only opened with its option, and closed when the entry is unloaded."""
+
+    entry = fixture.get_config_entry()
+    assert fixture.get_home_assistant_voltalis_module()._dedicated_session is None
+
+    # Reload the integration with the dedicated session
+    fixture.hass.config_entries.async_update_entry(entry, options={CONF_DEDICATED_SESSION: True})
+    result = await fixture.hass.config_entries.async_reload(entry.entry_id)
+    await fixture.hass.async_block_till_done(True)
+    assert result is True
+
+    voltalis_module = fixture.get_home_assistant_voltalis_module()
+    dedicated_session = voltalis_module._dedicated_session
+    assert dedicated_session is not None
+    assert not dedicated_session.closed
+
+    # Unload the integration
+    result = await fixture.hass.config_entries.async_unload(entry.entry_id)
+    assert result is True
+    assert dedicated_session.closed
+    assert voltalis_module._dedicated_session is None
+
+
+@pytest.mark.e2e
+async def test_get_consumption_service(fixture: HomeAssistantFixture) -> None:
+    """Test that the get_consumption service returns the consumption of the devices over the range."""
+
+    entry = fixture.get_config_entry()
+
+    response = await fixture.hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_CONSUMPTION,
+        {"config_entry_id": entry.entry_id, "start_date": "2024-01-01", "end_date": "2024-01-02"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response is not None
+    assert response["consumption"] == pytest.approx(4 * 6.5)
+    assert response["days"] == [
+        {"date": "2024-01-01", "consumption": pytest.approx(4 * 6.5)},
+        {"date": "2024-01-02", "consumption": 0.0},
+    ]
+    devices = cast(list[dict[str, Any]], response["devices"])
+    assert {device["device_id"]: device["consumption"] for device in devices} == {
+        device_id: pytest.approx(6.5) for device_id in range(1, 5)
+    }
+
+
+@pytest.mark.e2e
+async def test_get_consumption_service_invalid_range(fixture: HomeAssistantFixture) -> None:
+    """Test that the get_consumption service rejects a start date after the end date."""
+
+    entry = fixture.get_config_entry()
+
+    with pytest.raises(ServiceValidationError):
+        await fixture.hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_CONSUMPTION,
+            {"config_entry_id": entry.entry_id, "start_date": "2024-01-02", "end_date": "2024-01-01"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize(
+    "now,expected_extra_slices",
+    [
+        (datetime(2024, 1, 1, 12, 3), set()),
+        (datetime(2024, 1, 1, 12, 5), {"Voltalis Device Daily Consumption"}),
+        # The 12:05 tick was missed, the daily consumption is refreshed on the next tick
+        (datetime(2024, 1, 1, 12, 7), {"Voltalis Device Daily Consumption"}),
+        (datetime(2024, 1, 1, 12, 10), {"Voltalis Live Consumption"}),
+    ],
+)
+async def test_site_snapshot_refreshes_due_coordinators(
+    fixture: HomeAssistantFixture,
+    now: datetime,
+    expected_extra_slices: set[str],
+) -> None:
+    """Test that a site snapshot tick refreshes only the coordinators that are due."""
+
+    voltalis_module = fixture.get_home_assistant_voltalis_module()
+    date_provider = DateProviderStub()
+    date_provider.now = now
+    voltalis_module.date_provider = date_provider
+    voltalis_module.device_daily_consumption_coordinator._last_refresh_at = datetime(2024, 1, 1, 12, 1)
+    voltalis_module.live_consumption_coordinator._last_refresh_at = datetime(2024, 1, 1, 12, 1)
+
+    # Trigger a snapshot tick
+    await fixture.async_refresh_coordinator(voltalis_module.site_snapshot_coordinator)
+
+    # Minute coordinators are always due, the energy contract is due because the day changed
+    expected_slices = {
+        "Voltalis Device",
+        "Voltalis Device Health",
+        "Voltalis Program",
+        "Voltalis Energy Contract",
+        *expected_extra_slices,
+    }
+    refreshed_at = voltalis_module.site_snapshot_coordinator.data
+    assert set(refreshed_at.keys()) == expected_slices
+    assert all(value == now for value in refreshed_at.values())
+
+
+@pytest.mark.e2e
+async def test_site_snapshot_skips_unchanged_slices(fixture: HomeAssistantFixture) -> None:
+    """Test that a site snapshot tick only notifies the entities whose slice changed."""
+
+    device_coordinator = fixture.get_home_assistant_voltalis_module().device_coordinator
+    contexts = list(device_coordinator.async_contexts())
+
+    # Nothing changed since the last refresh, no entity is notified
+    await device_coordinator.async_refresh_slice()
+    await fixture.hass.async_block_till_done(True)
+    assert device_coordinator.suppressed_updates == len(contexts)
+
+    # Only the entities of the removed device are notified
+    fixture.voltalis_server.remove_device(4)
+    await device_coordinator.async_refresh_slice()
+    await fixture.hass.async_block_till_done(True)
+    unchanged_contexts = [context for context in contexts if context != 4]
+    assert device_coordinator.suppressed_updates == len(contexts) + len(unchanged_contexts)
+
+
+@pytest.mark.e2e
+async def test_circuit_breaker_pauses_refreshes_during_outage(fixture: HomeAssistantFixture) -> None:
+    """Test that the coordinators stop calling the API after consecutive failures, until a probe succeeds."""
+
+    voltalis_module = fixture.get_home_assistant_voltalis_module()
+    circuit_breaker = voltalis_module.circuit_breaker
+    date_provider = DateProviderStub()
+    date_provider.now = datetime(2024, 1, 1, 12, 0)
+    voltalis_module.date_provider = date_provider
+
+    devices_endpoint = "/api/site/1/managed-appliance"
+    fixture.voltalis_server.inject_faults(
+        url=devices_endpoint,
+        method="GET",
+        faults=[MockHttpServer.Fault(status_code=503)] * CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    )
+    fixture.voltalis_server.reset_requests_count()
+
+    # The circuit opens after the consecutive failures
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        await fixture.async_refresh_coordinator(voltalis_module.device_coordinator)
+    state_after_failures = circuit_breaker.state
+    assert state_after_failures == VoltalisCircuitBreakerStateEnum.OPEN
+
+    # The refreshes of all the coordinators are skipped during the backoff
+    await fixture.async_refresh_coordinator(voltalis_module.device_coordinator)
+    await fixture.async_refresh_coordinator(voltalis_module.device_health_coordinator)
+    requests_count = fixture.voltalis_server.get_requests_count()
+    assert requests_count[f"GET {devices_endpoint}"] == CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    assert "GET /api/site/1/autodiag" not in requests_count
+    assert circuit_breaker.skipped_refreshes == 2
+
+    # After the backoff, a single probe closes the circuit
+    date_provider.now += timedelta(minutes=CIRCUIT_BREAKER_BASE_BACKOFF)
+    await fixture.async_refresh_coordinator(voltalis_module.device_coordinator)
+    assert circuit_breaker.state == VoltalisCircuitBreakerStateEnum.CLOSED
+    assert voltalis_module.device_coordinator.last_update_success
+
+
+@pytest.mark.e2e
+async def test_circuit_breaker_releases_cancelled_probe(
+    fixture: HomeAssistantFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a cancelled probe opens the circuit again, so the next refresh probes the API."""
+
+    voltalis_module = fixture.get_home_assistant_voltalis_module()
+    circuit_breaker = voltalis_module.circuit_breaker
+    device_coordinator = voltalis_module.device_coordinator
+    date_provider = DateProviderStub()
+    date_provider.now = datetime(2024, 1, 1, 12, 0)
+    voltalis_module.date_provider = date_provider
+
+    fixture.voltalis_server.inject_faults(
+        url="/api/site/1/managed-appliance",
+        method="GET",
+        faults=[MockHttpServer.Fault(status_code=503)] * CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    )
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        await fixture.async_refresh_coordinator(device_coordinator)
+    state_after_failures = circuit_breaker.state
+    assert state_after_failures == VoltalisCircuitBreakerStateEnum.OPEN
+
+    # The probe is cancelled while waiting for the API
+    async def cancelled_get_data() -> None:
+        raise asyncio.CancelledError()
+
+    date_provider.now += timedelta(minutes=CIRCUIT_BREAKER_BASE_BACKOFF)
+    monkeypatch.setattr(device_coordinator, "_get_data", cancelled_get_data)
+    with pytest.raises(asyncio.CancelledError):
+        await device_coordinator._async_update_data()
+    state_after_cancel = circuit_breaker.state
+    assert state_after_cancel == VoltalisCircuitBreakerStateEnum.OPEN
+    assert circuit_breaker.retry_at == date_provider.now
+
+    # The next refresh probes the API again
+    monkeypatch.delattr(device_coordinator, "_get_data")
+    await fixture.async_refresh_coordinator(device_coordinator)
+    assert circuit_breaker.state == VoltalisCircuitBreakerStateEnum.CLOSED
+
+
 # We can't use the module-level because of the hass fixture scope
 pytestmark = [pytest.mark.asyncio(loop_scope="function"), pytest.mark.enable_socket]
 
@@ -1,6 +1,7 @@
 """E2E tests for the Voltalis sensor platform."""
 
 from collections.abc import AsyncGenerator
+from datetime import datetime, time, timedelta
 
 import pytest
 from homeassistant.const import (
@@ -28,6 +29,11 @@ from custom_components.voltalis.lib.domain.energy_contracts.energy_contract_curr
         ("sensor.heater_2_daily_consumption", {"unit_of_measurement": UnitOfEnergy.WATT_HOUR}),
         ("sensor.water_heater_1_daily_consumption", {"unit_of_measurement": UnitOfEnergy.WATT_HOUR}),
         ("sensor.water_heater_2_daily_consumption", {"unit_of_measurement": UnitOfEnergy.WATT_HOUR}),
+        # Device daily cost sensors - should exist for all devices when there is an energy contract
+        ("sensor.heater_1_daily_cost", {"unit_of_measurement": CURRENCY_EURO}),
+        ("sensor.heater_2_daily_cost", {"unit_of_measurement": CURRENCY_EURO}),
+        ("sensor.water_heater_1_daily_cost", {"unit_of_measurement": CURRENCY_EURO}),
+        ("sensor.water_heater_2_daily_cost", {"unit_of_measurement": CURRENCY_EURO}),
         # Device connection status sensors - should exist for all devices with health data
         ("sensor.heater_1_connection_status", {"has_options": True}),
         ("sensor.heater_2_connection_status", {"has_options": True}),
@@ -149,6 +155,19 @@ async def test_energy_contract_current_mode_sensor(fixture: HomeAssistantFixture
     assert sensor_entity.state in actual_options
 
 
+@pytest.mark.e2e
+async def test_tariff_clock_schedules_next_transition(fixture: HomeAssistantFixture) -> None:
+    """Test that the tariff clock wakes up at the next peak / offpeak transition instead of every minute."""
+
+    tariff_clock = fixture.get_home_assistant_voltalis_module().tariff_clock
+
+    # The offpeak hours of the contract are 20:00 - 06:00
+    next_transition = tariff_clock.next_transition
+    assert next_transition is not None
+    assert next_transition.time() in (time(20, 0), time(6, 0, 1))
+    assert timedelta(0) < next_transition - datetime.now() <= timedelta(days=1)
+
+
 @pytest.mark.e2e
 async def test_energy_contract_live_consumption_sensor(fixture: HomeAssistantFixture) -> None:
     """Test that energy contract live consumption sensor reports values."""
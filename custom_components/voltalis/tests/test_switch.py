@@ -60,6 +60,39 @@ async def test_switch_turn_on(
     fixture.compare_data(state.state, expected_state)
 
 
+@pytest.mark.e2e
+@pytest.mark.parametrize(
+    "entity_id,service,expected_state",
+    [
+        ("switch.heater_1_device_switch", SERVICE_TURN_OFF, STATE_OFF),
+        ("switch.heater_2_device_switch", SERVICE_TURN_ON, STATE_ON),
+    ],
+)
+async def test_switch_state_updated_without_refresh(
+    fixture: HomeAssistantFixture,
+    entity_id: str,
+    service: str,
+    expected_state: str,
+) -> None:
+    """Test that the switch state is updated right after the command, before the devices are fetched again."""
+
+    device_coordinator = fixture.get_home_assistant_voltalis_module().device_coordinator
+    last_refresh_at = device_coordinator._last_refresh_at
+
+    await fixture.async_call_service(SWITCH_DOMAIN, service, entity_id)
+
+    # The expected state is published without fetching the devices
+    state = fixture.get_entity_state(entity_id)
+    fixture.compare_data(state.state, expected_state)
+    assert device_coordinator._last_refresh_at == last_refresh_at
+
+    # The reconciliation fetch keeps the state written to the API
+    await device_coordinator.async_refresh_slice()
+    await fixture.hass.async_block_till_done(True)
+    state = fixture.get_entity_state(entity_id)
+    fixture.compare_data(state.state, expected_state)
+
+
 @pytest.mark.e2e
 async def test_switch_coordinator_update_reflects_state(fixture: HomeAssistantFixture) -> None:
     """Test that coordinator updates reflect in switch state."""
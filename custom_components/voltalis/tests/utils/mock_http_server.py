@@ -1,6 +1,9 @@
 import asyncio
 import inspect
 import json
+import socket
+import time
+from collections import Counter, deque
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from logging import Logger
 from threading import Thread
@@ -41,10 +44,23 @@ class MockHttpServer:
         )
         with_body: bool = False
         with_query_params: bool = False
+        with_headers: bool = False
+
+    class Fault(CustomModel):
+        """Fault injected in place of the next response of an endpoint."""
+
+        # Wait before handling the request, in seconds
+        delay: float = 0.0
+        # Answer with this error status instead of calling the request handler
+        status_code: int | None = None
+        # Close the connection without answering
+        disconnect: bool = False
 
     def __init__(self, logger: Logger) -> None:
         self.__logger = logger
         self.__request_handlers: dict[str, dict[str, tuple[MockHttpServer.RequestHandler, dict]]] = {}
+        self.__requests_count: Counter[str] = Counter()
+        self.__faults: dict[str, deque[MockHttpServer.Fault]] = {}
         self.__http_server = HTTPServer(("127.0.0.1", 0), self.server_request_handler_factory())
         self.__thread = Thread(target=self.__http_server.serve_forever, daemon=True)
 
@@ -107,12 +123,38 @@ class MockHttpServer:
             self.__request_handlers[url] = {}
         self.__request_handlers[url][method] = (new_request_handler, config)
 
+    # --------------------------
+    # Fault injection methods
+    # --------------------------
+
+    def inject_faults(self, *, url: str, method: str, faults: list[Fault]) -> None:
+        """Inject faults in the next requests to the given path and method, one fault per request."""
+        self.__faults.setdefault(f"{method} {url}", deque()).extend(faults)
+
+    def reset_faults(self) -> None:
+        """Remove the faults not injected yet."""
+        self.__faults.clear()
+
+    # --------------------------
+    # Requests count methods
+    # --------------------------
+
+    def get_requests_count(self) -> dict[str, int]:
+        """Returns the number of requests received by endpoint, as "METHOD /path"."""
+        return dict(self.__requests_count)
+
+    def reset_requests_count(self) -> None:
+        """Reset the number of requests received."""
+        self.__requests_count.clear()
+
     # --------------------------
     # Utils methods
     # --------------------------
 
     def server_request_handler_factory(self) -> type[BaseHTTPRequestHandler]:
         request_handlers = self.__request_handlers
+        requests_count = self.__requests_count
+        faults = self.__faults
         logger = self.__logger
 
         class ServerRequestHandler(BaseHTTPRequestHandler):
@@ -215,6 +257,20 @@ class MockHttpServer:
                 method = self.command
                 config: dict = {}
 
+                requests_count[f"{method} {path}"] += 1
+
+                endpoint_faults = faults.get(f"{method} {path}")
+                if endpoint_faults:
+                    fault = endpoint_faults.popleft()
+                    time.sleep(fault.delay)
+                    if fault.disconnect:
+                        self.close_connection = True
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                        return
+                    if fault.status_code is not None:
+                        self.send_error(fault.status_code)
+                        return
+
                 # Find the handler for the requested path and method
                 try:
                     request_handler, handler_config = self.__find_request_handler(path, method)
@@ -245,6 +301,9 @@ class MockHttpServer:
                         self.send_error(500, str(error))
                         return
 
+                if request_handler.with_headers:
+                    config["headers"] = dict(self.headers.items())
+
                 try:
                     # Handle both sync and async response callables
                     if inspect.iscoroutinefunction(request_handler.handle):
@@ -265,7 +324,7 @@ class MockHttpServer:
                     for k, v in response.headers.items():
                         self.send_header(k, v)
                     self.end_headers()
-                    if response.data is not None:
+                    if response.data is not None and status_code != 304:
                         self.wfile.write(
                             json.dumps(MockHttpServer.serialize_data(response.data), cls=CustomJsonEncoder).encode()
                         )
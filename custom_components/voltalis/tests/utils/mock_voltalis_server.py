@@ -129,6 +129,23 @@ class MockVoltalisServer:
             raise RuntimeError("Server is not started. Please start the server before resetting the storage.")
 
         self.__voltalis_api.reset_request_handlers()
+        self.__voltalis_api.reset_requests_count()
+        self.__voltalis_api.reset_faults()
+
+    def get_requests_count(self) -> dict[str, int]:
+        """Returns the number of requests received by endpoint, as "METHOD /path"."""
+
+        return self.__voltalis_api.get_requests_count()
+
+    def reset_requests_count(self) -> None:
+        """Resets the number of requests received"""
+
+        self.__voltalis_api.reset_requests_count()
+
+    def inject_faults(self, *, url: str, method: str, faults: list[MockHttpServer.Fault]) -> None:
+        """Inject faults in the next requests to the given path and method, one fault per request."""
+
+        self.__voltalis_api.inject_faults(url=url, method=method, faults=faults)
 
     def given_login_ok(self) -> None:
         self.__voltalis_api.set_request_handler(